@@ -52,4 +52,66 @@ KEYWORDS = [
 
 ]
 
-    
\ No newline at end of file
+    
+
+# Both spellings of a keyword share one id, 0 is left for tokens that are
+# not keywords. The lexer stores the id, the original spelling stays the value.
+KW_VAR = 1
+KW_AND = 2
+KW_OR = 3
+KW_NOT = 4
+KW_IF = 5
+KW_ELIF = 6
+KW_ELSE = 7
+KW_THEN = 8
+KW_FOR = 9
+KW_TO = 10
+KW_STEP = 11
+KW_WHILE = 12
+KW_FUN = 13
+KW_END = 14
+KW_RETURN = 15
+KW_CONTINUE = 16
+KW_BREAK = 17
+
+KEYWORD_IDS = {
+    "VAR": KW_VAR,
+    "चल": KW_VAR,
+    "AND": KW_AND,
+    "आणि": KW_AND,
+    "OR": KW_OR,
+    "किंवा": KW_OR,
+    "NOT": KW_NOT,
+    "नाही": KW_NOT,
+    "IF": KW_IF,
+    "जर": KW_IF,
+    "ELIF": KW_ELIF,
+    "किंवाजर": KW_ELIF,
+    "ELSE": KW_ELSE,
+    "नाहीतर": KW_ELSE,
+    "THEN": KW_THEN,
+    "तर": KW_THEN,
+    "FOR": KW_FOR,
+    "वारंवार": KW_FOR,
+    "TO": KW_TO,
+    "ते": KW_TO,
+    "STEP": KW_STEP,
+    "पाऊल": KW_STEP,
+    "WHILE": KW_WHILE,
+    "जोपर्यंत": KW_WHILE,
+    "FUN": KW_FUN,
+    "कार्य": KW_FUN,
+    "END": KW_END,
+    "शेवट": KW_END,
+    "RETURN": KW_RETURN,
+    "परत": KW_RETURN,
+    "CONTINUE": KW_CONTINUE,
+    "सुरू": KW_CONTINUE,
+    "BREAK": KW_BREAK,
+    "थांबवा": KW_BREAK,
+}
+
+# the English and Marathi spelling of each keyword id, for messages
+KEYWORD_SPELLINGS = {}
+for spelling, keyword in KEYWORD_IDS.items():
+    KEYWORD_SPELLINGS[keyword] = KEYWORD_SPELLINGS.get(keyword, ()) + (spelling,)
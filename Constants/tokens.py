@@ -1,27 +1,57 @@
 # -----------TOKEN---------------
-TT_INT = "INT"
-TT_FLOAT = "FLOAT"
-TT_STRING = "STRING"
-TT_IDENTIFIER = "IDENTIFIER"
-TT_KEYWORD = "KEYWORD"
-TT_PLUS = "PLUS"
-TT_MINUS = "MINUS"
-TT_MUL = "MUL"
-TT_DIV = "DIV"
-TT_POWER = "POWER"
-TT_MOD = "MOD"
-TT_EQ = "EQ"
-TT_LPAREN = "LPAREN"
-TT_RPAREN = "RPAREN"
-TT_LSQUARE = "LSQUARE"
-TT_RSQUARE = "RSQUARE"
-TT_EE = "EE"
-TT_NE = "NE"
-TT_LT = "LT"
-TT_GT = "GT"
-TT_LTE = "LTE"
-TT_GTE = "GTE"
-TT_COMMA = "COMMA"
-TT_ARROW = "ARROW"
-TT_NEWLINE = "NEWLINE"
-TT_EOF = "EOF"
+# token types are small integer codes, TOKEN_NAMES maps them back for display
+TT_INT = 0
+TT_FLOAT = 1
+TT_STRING = 2
+TT_IDENTIFIER = 3
+TT_KEYWORD = 4
+TT_PLUS = 5
+TT_MINUS = 6
+TT_MUL = 7
+TT_DIV = 8
+TT_POWER = 9
+TT_MOD = 10
+TT_EQ = 11
+TT_LPAREN = 12
+TT_RPAREN = 13
+TT_LSQUARE = 14
+TT_RSQUARE = 15
+TT_EE = 16
+TT_NE = 17
+TT_LT = 18
+TT_GT = 19
+TT_LTE = 20
+TT_GTE = 21
+TT_COMMA = 22
+TT_ARROW = 23
+TT_NEWLINE = 24
+TT_EOF = 25
+
+TOKEN_NAMES = (
+    "INT",
+    "FLOAT",
+    "STRING",
+    "IDENTIFIER",
+    "KEYWORD",
+    "PLUS",
+    "MINUS",
+    "MUL",
+    "DIV",
+    "POWER",
+    "MOD",
+    "EQ",
+    "LPAREN",
+    "RPAREN",
+    "LSQUARE",
+    "RSQUARE",
+    "EE",
+    "NE",
+    "LT",
+    "GT",
+    "LTE",
+    "GTE",
+    "COMMA",
+    "ARROW",
+    "NEWLINE",
+    "EOF",
+)
@@ -1 +1,10 @@
-from Interpreter.interpreter import *
\ No newline at end of file
+from Interpreter.interpreter import *
+from Interpreter.raising import RaisingInterpreter
+from Interpreter.closures import ClosureCompiler
+from Interpreter.bytecode import Compiler, disassemble
+from Interpreter.vm import VirtualMachine
+from Interpreter.transpiler import Transpiler
+from Interpreter.optimizer import Optimizer
+from Interpreter.memo import Purity
+from Interpreter.usage import Usage
+from Interpreter.nesting import Nesting
\ No newline at end of file
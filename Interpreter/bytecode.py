@@ -0,0 +1,375 @@
+from Interpreter.interpreter import Visitors
+from Nodes import VarAccessNode
+from Constants import *
+
+
+# ------------BYTECODE----------------
+# The AST compiled to a linear list of instructions for the VirtualMachine.
+# Instruction i is the opcode Code.ops[i] with the int argument Code.args[i]:
+# an index into consts or names, a count, or the instruction a jump goes to.
+# Every node leaves exactly one value on the stack, the value the interpreter
+# would have returned for it.
+
+# opcodes are small integer codes, OPCODE_NAMES maps them back for display
+LOAD_NUMBER = 0  # push a new Number of consts[arg]
+LOAD_STRING = 1  # push a new String of consts[arg]
+LOAD_NULL = 2  # push Number.null
+BUILD_LIST = 3  # pop arg values, push a List of them
+LOAD_NAME = 4  # push a copy of the variable names[arg]
+CHECK_NAME = 5  # fail if names[arg] is not defined, before it is assigned
+STORE_NAME = 6  # set names[arg] to the value on top, which stays there
+POP = 7
+BINARY_ARITHMETIC = 8  # ARITHMETIC[arg] of the two values on top
+BINARY_COMPARE = 9  # COMPARISONS[arg] of the two values on top
+BINARY_OP = 10  # the Value method consts[arg] of the two values on top
+NEGATE = 11
+NOT = 12
+SET_POS = 13  # unary +, the value on top only moves
+JUMP = 14
+POP_JUMP_IF_FALSE = 15
+SETUP_LOOP = 16  # around the body of a pass, BREAK goes to arg and CONTINUE to arg - 1
+SETUP_GUARD = 17  # any error or exit until POP_BLOCK leaves None and goes to arg
+POP_BLOCK = 18
+FOR_PREP = 19  # pop start, end and step, push the loop state of the variable names[arg]
+FOR_ITER = 20  # set the loop variable, or go to arg when the loop is done
+WHILE_PREP = 21  # push the loop state
+WHILE_TEST = 22  # pop the condition, go to arg if it is false
+APPEND_ELEMENT = 23  # pop the value of a pass into the loop state
+END_LOOP = 24  # pop the loop state, push its List, or Number.null if arg
+MAKE_FUNCTION = 25  # push a Function of the Code consts[arg]
+LOAD_CALLEE = 26  # push the function names[arg] uncopied, fail if it is unknown
+CHECK_CALLEE = 27  # fail if names[arg] is unknown, the callee is evaluated after
+CALL_NAME = 28  # call the LOAD_CALLEE value under arg arguments
+CALL = 29  # call the evaluated value under arg arguments
+RETURN_VALUE = 30
+CONTINUE = 31
+BREAK = 32
+INDEX = 33
+INDEX_ASSIGN = 34
+CALLEE_ERROR = 35  # the callee consts[arg] has no name, fail as the interpreter does
+END = 36  # the value on top is the result of the code
+
+OPCODE_NAMES = (
+    "LOAD_NUMBER",
+    "LOAD_STRING",
+    "LOAD_NULL",
+    "BUILD_LIST",
+    "LOAD_NAME",
+    "CHECK_NAME",
+    "STORE_NAME",
+    "POP",
+    "BINARY_ARITHMETIC",
+    "BINARY_COMPARE",
+    "BINARY_OP",
+    "NEGATE",
+    "NOT",
+    "SET_POS",
+    "JUMP",
+    "POP_JUMP_IF_FALSE",
+    "SETUP_LOOP",
+    "SETUP_GUARD",
+    "POP_BLOCK",
+    "FOR_PREP",
+    "FOR_ITER",
+    "WHILE_PREP",
+    "WHILE_TEST",
+    "APPEND_ELEMENT",
+    "END_LOOP",
+    "MAKE_FUNCTION",
+    "LOAD_CALLEE",
+    "CHECK_CALLEE",
+    "CALL_NAME",
+    "CALL",
+    "RETURN_VALUE",
+    "CONTINUE",
+    "BREAK",
+    "INDEX",
+    "INDEX_ASSIGN",
+    "CALLEE_ERROR",
+    "END",
+)
+
+# shown as "to N" by the disassembler
+JUMPS = (JUMP, POP_JUMP_IF_FALSE, SETUP_LOOP, SETUP_GUARD, FOR_ITER, WHILE_TEST)
+USES_CONSTS = (LOAD_NUMBER, LOAD_STRING, BINARY_OP, MAKE_FUNCTION, CALLEE_ERROR)
+USES_NAMES = (LOAD_NAME, CHECK_NAME, STORE_NAME, LOAD_CALLEE, CHECK_CALLEE, FOR_PREP)
+
+# argument of BINARY_ARITHMETIC and BINARY_COMPARE -> operator token, the
+# VirtualMachine keeps the matching tables in the same order
+ARITHMETIC = [TT_PLUS, TT_MINUS, TT_MUL]
+COMPARISONS = [TT_EE, TT_NE, TT_LT, TT_GT, TT_LTE, TT_GTE]
+BINARY_METHODS = {
+    TT_DIV: "dived_by",
+    TT_MOD: "moded_by",
+    TT_POWER: "power_by",
+}
+BINARY_KEYWORD_METHODS = {
+    KW_AND: "anded_by",
+    KW_OR: "ored_by",
+}
+
+
+class Code:
+    def __init__(self, name, node, arg_names=(), should_auto_return=False):
+        self.name = name
+        # the node this is the code of, a Function keeps it as its body_node
+        self.node = node
+        self.arg_names = list(arg_names)
+        self.should_auto_return = should_auto_return
+        self.ops = []
+        self.args = []
+        self.consts = []
+        self.names = []
+        # (pos_start, pos_end) of the node each instruction was compiled from
+        self.positions = []
+
+    def __repr__(self):
+        return f"<code {self.name or '<anonymous>'}>"
+
+
+class Compiler:
+    def __init__(self, codes=None):
+        self.compilers = Visitors(self, "compile_")
+        # node -> Code, shared with the VirtualMachine so a function body is
+        # compiled only once
+        self.codes = {} if codes is None else codes
+        self.code = None
+        self.name_ids = None
+
+    def compile(self, node, name="<program>", arg_names=(), should_auto_return=False):
+        code = self.codes.get(node)
+        if code is not None:
+            return code
+
+        outer = self.code, self.name_ids
+        self.code = code = Code(name, node, arg_names, should_auto_return)
+        self.name_ids = {}
+        try:
+            self.visit(node)
+            self.emit(END, 0, node)
+        finally:
+            self.code, self.name_ids = outer
+        self.codes[node] = code
+        return code
+
+    def visit(self, node):
+        self.compilers[type(node)](node)
+
+    def no_visit_method(self, node):
+        raise Exception(f"No compile_{type(node).__name__} method defined")
+
+    def emit(self, op, arg, node):
+        # the index of the instruction, to patch or jump to
+        idx = len(self.code.ops)
+        self.code.ops.append(op)
+        self.code.args.append(arg)
+        self.code.positions.append((node.pos_start, node.pos_end))
+        return idx
+
+    def patch(self, idx, target):
+        self.code.args[idx] = target
+
+    def here(self):
+        return len(self.code.ops)
+
+    def const(self, value):
+        self.code.consts.append(value)
+        return len(self.code.consts) - 1
+
+    def name(self, name):
+        if name not in self.name_ids:
+            self.name_ids[name] = len(self.code.names)
+            self.code.names.append(name)
+        return self.name_ids[name]
+
+    ###################################
+
+    def compile_NumberNode(self, node):
+        self.emit(LOAD_NUMBER, self.const(node.token.value), node)
+
+    def compile_StringNode(self, node):
+        self.emit(LOAD_STRING, self.const(node.token.value), node)
+
+    def compile_ListNode(self, node):
+        for element_node in node.element_nodes:
+            self.visit(element_node)
+        self.emit(BUILD_LIST, len(node.element_nodes), node)
+
+    def compile_VarAccessNode(self, node):
+        self.emit(LOAD_NAME, self.name(node.var_name_token.value), node)
+
+    def compile_VarAssignNode(self, node):
+        name = self.name(node.var_name_token.value)
+        if not node.declare:
+            self.emit(CHECK_NAME, name, node)
+        self.visit(node.value_node)
+        self.emit(STORE_NAME, name, node)
+
+    def compile_BinOpNode(self, node):
+        self.visit(node.left_node)
+        self.visit(node.right_node)
+
+        op_type = node.op_token.type
+        if op_type in ARITHMETIC:
+            self.emit(BINARY_ARITHMETIC, ARITHMETIC.index(op_type), node)
+        elif op_type in COMPARISONS:
+            self.emit(BINARY_COMPARE, COMPARISONS.index(op_type), node)
+        elif op_type == TT_KEYWORD:
+            method = BINARY_KEYWORD_METHODS[node.op_token.keyword]
+            self.emit(BINARY_OP, self.const(method), node)
+        else:
+            self.emit(BINARY_OP, self.const(BINARY_METHODS[op_type]), node)
+
+    def compile_UnaryOpNode(self, node):
+        self.visit(node.node)
+        if node.op_token.type == TT_MINUS:
+            self.emit(NEGATE, 0, node)
+        elif node.op_token.keyword == KW_NOT:
+            self.emit(NOT, 0, node)
+        else:
+            self.emit(SET_POS, 0, node)
+
+    def compile_IfNode(self, node):
+        jumps_to_end = []
+
+        for condition, expr, should_return_null in node.cases:
+            self.visit(condition)
+            next_case = self.emit(POP_JUMP_IF_FALSE, 0, condition)
+            self.compile_branch(expr, should_return_null)
+            jumps_to_end.append(self.emit(JUMP, 0, node))
+            self.patch(next_case, self.here())
+
+        if node.else_case:
+            expr, should_return_null = node.else_case
+            self.compile_branch(expr, should_return_null)
+        else:
+            self.emit(LOAD_NULL, 0, node)
+
+        for jump in jumps_to_end:
+            self.patch(jump, self.here())
+
+    def compile_branch(self, expr, should_return_null):
+        self.visit(expr)
+        if should_return_null:
+            self.emit(POP, 0, expr)
+            self.emit(LOAD_NULL, 0, expr)
+
+    def compile_ForNode(self, node):
+        self.visit(node.start_value_node)
+        self.visit(node.end_value_node)
+        if node.step_value_node:
+            self.visit(node.step_value_node)
+        else:
+            # the interpreter steps by a Number(1) too
+            self.emit(LOAD_NUMBER, self.const(1), node)
+        self.emit(FOR_PREP, self.name(node.var_name_token.value), node)
+
+        loop = self.emit(FOR_ITER, 0, node)
+        self.compile_loop(node, loop, loop)
+
+    def compile_WhileNode(self, node):
+        self.emit(WHILE_PREP, 0, node)
+        loop = self.here()
+        self.visit(node.condition_node)
+        self.compile_loop(node, loop, self.emit(WHILE_TEST, 0, node))
+
+    def compile_loop(self, node, loop, test):
+        # only the body is in the loop block, an exit while the loop itself
+        # is evaluated goes on to the enclosing one as in the interpreter
+        setup = self.emit(SETUP_LOOP, 0, node)
+        self.visit(node.body_node)
+        self.emit(POP_BLOCK, 0, node)
+        # a block loop drops the value of each pass instead of collecting it
+        self.emit(POP if node.should_return_null else APPEND_ELEMENT, 0, node)
+        self.emit(JUMP, loop, node)
+        end = self.emit(END_LOOP, int(node.should_return_null), node)
+        self.patch(setup, end)
+        self.patch(test, end)
+
+    def compile_FuncDefNode(self, node):
+        func_name = node.var_name_token.value if node.var_name_token else None
+        arg_names = [arg_name.value for arg_name in node.arg_name_tokens]
+        body = self.compile(node.body_node, func_name, arg_names, node.should_auto_return)
+        self.emit(MAKE_FUNCTION, self.const(body), node)
+
+    def compile_CallNode(self, node):
+        try:
+            # the interpreter checks the name before it evaluates the callee
+            func_name = self.name(node.node_to_call.var_name_token.value)
+        except AttributeError:
+            self.emit(CALLEE_ERROR, self.const(node.node_to_call), node)
+            return
+
+        if type(node.node_to_call) is VarAccessNode:
+            self.emit(LOAD_CALLEE, func_name, node)
+            op = CALL_NAME
+        else:
+            self.emit(CHECK_CALLEE, func_name, node)
+            self.visit(node.node_to_call)
+            op = CALL
+
+        for arg_node in node.arg_nodes:
+            self.visit(arg_node)
+        self.emit(op, len(node.arg_nodes), node)
+
+    def compile_ReturnNode(self, node):
+        if node.node_to_return:
+            self.visit(node.node_to_return)
+        else:
+            self.emit(LOAD_NULL, 0, node)
+        self.emit(RETURN_VALUE, 0, node)
+
+    def compile_ContinueNode(self, node):
+        self.emit(CONTINUE, 0, node)
+
+    def compile_BreakNode(self, node):
+        self.emit(BREAK, 0, node)
+
+    def compile_index_target(self, node):
+        # Interpreter.visit_IndexNode does not check this result, so an error
+        # or exit here is dropped and the target is None
+        guard = self.emit(SETUP_GUARD, 0, node)
+        self.visit(node)
+        self.emit(POP_BLOCK, 0, node)
+        self.patch(guard, self.here())
+
+    def compile_IndexNode(self, node):
+        self.compile_index_target(node.index_node)
+        self.visit(node.expr)
+        self.emit(INDEX, 0, node)
+
+    def compile_IndexAssignNode(self, node):
+        self.compile_index_target(node.index_node)
+        self.visit(node.expr)
+        self.visit(node.assgin_expr)
+        self.emit(INDEX_ASSIGN, 0, node)
+
+
+def disassemble(code):
+    # a listing of code and then of every function defined in it
+    lines = [f"Disassembly of {code!r}:"]
+    functions = []
+
+    for idx, position in enumerate(code.positions):
+        op, arg = code.ops[idx], code.args[idx]
+        line = f"{position[0].ln + 1:>5} {idx:>5} {OPCODE_NAMES[op]:<18} {arg:>4}"
+
+        if op in JUMPS:
+            line += f" (to {arg})"
+        elif op in USES_CONSTS:
+            line += f" ({code.consts[arg]!r})"
+        elif op in USES_NAMES:
+            line += f" ({code.names[arg]})"
+        elif op == BINARY_ARITHMETIC:
+            line += f" ({TOKEN_NAMES[ARITHMETIC[arg]]})"
+        elif op == BINARY_COMPARE:
+            line += f" ({TOKEN_NAMES[COMPARISONS[arg]]})"
+        lines.append(line.rstrip())
+
+        if op == MAKE_FUNCTION:
+            functions.append(code.consts[arg])
+
+    for function in functions:
+        lines.append("")
+        lines.append(disassemble(function))
+    return "\n".join(lines)
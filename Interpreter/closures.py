@@ -0,0 +1,775 @@
+import operator
+from Interpreter.interpreter import Visitors, MAX_DEPTH, too_deep, host_stack_full
+from Interpreter.resolver import Resolver
+from Nodes import (
+    NumberNode,
+    StringNode,
+    ListNode,
+    VarAccessNode,
+    BinOpNode,
+    UnaryOpNode,
+    IfNode,
+    ForNode,
+    WhileNode,
+    CallNode,
+)
+from Values import Number, Function, String, List
+from Context import Context
+from SymbolTable import Frame
+from Errors import RTError
+from Constants import *
+from Results import RTResult
+
+
+# ------------CLOSURE COMPILER----------------
+# A second engine for the same AST. Every node is compiled once into a Python
+# closure that takes the context and returns the node's value, so running a
+# program makes no visit dispatch and builds no RTResult per node. Errors,
+# RETURN, CONTINUE and BREAK leave a closure as the exceptions below and are
+# turned back into an RTResult wherever a Function or main.run_ast expects one.
+#
+# A function body is compiled with its Scope from the Resolver, and every call
+# of it runs on a Frame, so the names the body sets are read and written by
+# slot instead of through a dict.
+#
+# Values carry the position and context they were last read at, so reading a
+# variable gives a copy of its value. Where only the value itself is used,
+# as by an IF condition, a FOR bound, an index or an operation on two
+# Numbers, the variable is read without the copy, and a copy is only made
+# for a Value method that may report an error at the operand.
+
+
+class Failure(Exception):
+    def __init__(self, error):
+        self.error = error
+
+
+class Return(Exception):
+    def __init__(self, value):
+        self.value = value
+
+
+class Continue(Exception):
+    pass
+
+
+class Break(Exception):
+    pass
+
+
+def unwrap(res):
+    # the value of an RTResult, or what it stands for raised
+    if res.error:
+        raise Failure(res.error)
+    if res.func_return_value:
+        raise Return(res.func_return_value)
+    if res.loop_should_continue:
+        raise Continue()
+    if res.loop_should_break:
+        raise Break()
+    return res.value
+
+
+def lookup(symbol_table, name):
+    # SymbolTable.get, reading the root at once or walking the parents in a loop
+    root = symbol_table.root
+    if name not in root.local_names:
+        return root.symbols.get(name)
+    while True:
+        value = symbol_table.symbols.get(name, None)
+        if value is not None or not symbol_table.parent:
+            return value
+        symbol_table = symbol_table.parent
+
+
+def find(symbol_table, name):
+    # lookup, reading the Frames on the way by slot
+    root = symbol_table.root
+    if name not in root.local_names:
+        return root.symbols.get(name)
+    while type(symbol_table) is Frame:
+        slot = symbol_table.slots.get(name)
+        if slot is not None:
+            value = symbol_table.values[slot]
+            if value is not None:
+                return value
+        symbol_table = symbol_table.parent
+    return lookup(symbol_table, name)
+
+
+# operator -> Value method, and the plain operation when both sides are Numbers
+BINARY_METHODS = {
+    TT_PLUS: "added_to",
+    TT_MINUS: "subbed_by",
+    TT_MUL: "multed_by",
+    TT_DIV: "dived_by",
+    TT_MOD: "moded_by",
+    TT_POWER: "power_by",
+    TT_EE: "get_comparison_eq",
+    TT_NE: "get_comparison_ne",
+    TT_LT: "get_comparison_lt",
+    TT_GT: "get_comparison_gt",
+    TT_LTE: "get_comparison_lte",
+    TT_GTE: "get_comparison_gte",
+}
+BINARY_KEYWORD_METHODS = {
+    KW_AND: "anded_by",
+    KW_OR: "ored_by",
+}
+NUMBER_ARITHMETIC = {
+    TT_PLUS: operator.add,
+    TT_MINUS: operator.sub,
+    TT_MUL: operator.mul,
+}
+NUMBER_COMPARISONS = {
+    TT_EE: operator.eq,
+    TT_NE: operator.ne,
+    TT_LT: operator.lt,
+    TT_GT: operator.gt,
+    TT_LTE: operator.le,
+    TT_GTE: operator.ge,
+}
+
+MINUS_ONE = Number(-1)
+
+
+def fresh(node):
+    # True if the value of node is always a new object that no variable or
+    # list holds, so it can take the position of a call without a copy
+    node_type = type(node)
+    if node_type in (NumberNode, StringNode, ListNode, VarAccessNode, CallNode):
+        return True
+    if node_type in (ForNode, WhileNode):
+        return not node.should_return_null
+    if node_type is BinOpNode:
+        # List.dived_by gives the element itself
+        return node.op_token.type != TT_DIV
+    if node_type is UnaryOpNode:
+        return node.op_token.type == TT_MINUS or node.op_token.keyword == KW_NOT or fresh(node.node)
+    if node_type is IfNode:
+        if not node.else_case:
+            return False
+        branches = [(expr, should_return_null) for _, expr, should_return_null in node.cases]
+        branches.append(node.else_case)
+        return all(fresh(expr) and not should_return_null for expr, should_return_null in branches)
+    return False
+
+
+class ClosureCompiler:
+    def __init__(self, max_depth=MAX_DEPTH):
+        self.compilers = Visitors(self, "compile_")
+        self.max_depth = max_depth
+        self.depth = 0
+        self.closures = {}
+        # function body -> its Scope, and the Scope being compiled
+        self.scopes = {}
+        self.scope = None
+
+    def visit(self, node, context):
+        # same contract as Interpreter.visit, used by main.run_ast and Function.execute
+        res = RTResult()
+        try:
+            return res.success(self.compile(node)(context))
+        except Failure as failure:
+            return res.failure(failure.error)
+        except Return as returned:
+            return res.success_return(returned.value)
+        except Continue:
+            return res.success_continue()
+        except Break:
+            return res.success_break()
+
+    def compile(self, node):
+        closure = self.closures.get(node)
+        if closure is None:
+            closure = self.closures[node] = self.compilers[type(node)](node)
+        return closure
+
+    def no_visit_method(self, node):
+        raise Exception(f"No compile_{type(node).__name__} method defined")
+
+    def scope_of(self, function):
+        # the Scope of a function body, compiled the first time it is called
+        scope = self.scopes.get(function.body_node)
+        if scope is None:
+            scope = Resolver().resolve_function(
+                function.name, function.body_node, function.arg_names
+            )
+            outer = self.scope, self.closures
+            self.scope, self.closures = scope, scope.closures
+            try:
+                scope.body = self.compile(function.body_node)
+                scope.fresh_body = fresh(function.body_node)
+            finally:
+                self.scope, self.closures = outer
+            self.scopes[function.body_node] = scope
+        return scope
+
+    def slot(self, name):
+        # the slot of name in the frames of the body being compiled, or None
+        return self.scope.slot(name) if self.scope else None
+
+    def reader(self, name):
+        # a function of the context that gives the value of name, None if not set
+        if self.scope is None:
+            def read(context):
+                return lookup(context.symbol_table, name)
+
+            return read
+
+        slot = self.scope.slot(name)
+        if slot is None:
+            def read_caller(context):
+                return find(context.symbol_table.parent, name)
+
+            return read_caller
+
+        def read_slot(context):
+            frame = context.symbol_table
+            value = frame.values[slot]
+            if value is None:
+                return find(frame.parent, name)
+            return value
+
+        return read_slot
+
+    def operand(self, node):
+        # the closure of node, reading a variable without copying its value
+        if type(node) is not VarAccessNode:
+            return self.compile(node)
+
+        var_name = node.var_name_token.value
+        read = self.reader(var_name)
+        pos_start, pos_end = node.pos_start, node.pos_end
+
+        def var_value(context):
+            value = read(context)
+            if value is None:
+                raise Failure(
+                    RTError(pos_start, pos_end, f"{var_name} परिभाषित नाही (not defined)", context)
+                )
+            return value
+
+        return var_value
+
+    def materializer(self, node):
+        # a function giving what the closure of node gives for the value an
+        # operand of it gives, None when they are the same
+        if type(node) is not VarAccessNode:
+            return None
+        pos_start, pos_end = node.pos_start, node.pos_end
+
+        def materialize(value, context):
+            return value.copy().set_pos(pos_start, pos_end).set_context(context)
+
+        return materialize
+
+    def writer(self, name):
+        # a function of the context and a value that sets name
+        slot = self.slot(name)
+        if slot is None:
+            def write(context, value):
+                context.symbol_table.set(name, value)
+
+            return write
+
+        def write_slot(context, value):
+            context.symbol_table.values[slot] = value
+
+        return write_slot
+
+    ###################################
+
+    def compile_NumberNode(self, node):
+        value = node.token.value
+        pos_start, pos_end = node.pos_start, node.pos_end
+
+        def number(context):
+            return Number(value).set_context(context).set_pos(pos_start, pos_end)
+
+        return number
+
+    def compile_StringNode(self, node):
+        value = node.token.value
+        pos_start, pos_end = node.pos_start, node.pos_end
+
+        def string(context):
+            return String(value).set_context(context).set_pos(pos_start, pos_end)
+
+        return string
+
+    def compile_ListNode(self, node):
+        elements = [self.compile(element_node) for element_node in node.element_nodes]
+        pos_start, pos_end = node.pos_start, node.pos_end
+
+        def list_(context):
+            return (
+                List([element(context) for element in elements])
+                .set_context(context)
+                .set_pos(pos_start, pos_end)
+            )
+
+        return list_
+
+    def compile_VarAccessNode(self, node):
+        var_name = node.var_name_token.value
+        read = self.reader(var_name)
+        pos_start, pos_end = node.pos_start, node.pos_end
+
+        def var_access(context):
+            value = read(context)
+            if value is None:
+                raise Failure(
+                    RTError(pos_start, pos_end, f"{var_name} परिभाषित नाही (not defined)", context)
+                )
+            return value.copy().set_pos(pos_start, pos_end).set_context(context)
+
+        return var_access
+
+    def compile_VarAssignNode(self, node):
+        var_name = node.var_name_token.value
+        value_node = self.compile(node.value_node)
+        read, write = self.reader(var_name), self.writer(var_name)
+        pos_start, pos_end = node.pos_start, node.pos_end
+
+        if node.declare:
+            def var_declare(context):
+                value = value_node(context)
+                write(context, value)
+                return value
+
+            return var_declare
+
+        def var_assign(context):
+            if read(context) is None:
+                raise Failure(
+                    RTError(
+                        pos_start,
+                        pos_end,
+                        f"{var_name} नेमणूक करण्यापूर्वी संदर्भ(reference before assignment)",
+                        context,
+                    )
+                )
+            value = value_node(context)
+            write(context, value)
+            return value
+
+        return var_assign
+
+    def compile_BinOpNode(self, node):
+        left_node = self.compile(node.left_node)
+        right_node = self.compile(node.right_node)
+        pos_start, pos_end = node.pos_start, node.pos_end
+
+        op_type = node.op_token.type
+        if op_type == TT_KEYWORD:
+            method = BINARY_KEYWORD_METHODS[node.op_token.keyword]
+        else:
+            method = BINARY_METHODS[op_type]
+
+        def bin_op(context):
+            left = left_node(context)
+            right = right_node(context)
+            result, error = getattr(left, method)(right)
+            if error:
+                raise Failure(error)
+            return result.set_pos(pos_start, pos_end)
+
+        if op_type not in NUMBER_ARITHMETIC and op_type not in NUMBER_COMPARISONS:
+            return bin_op
+
+        # the same results as the Number methods, without the call, the tuple
+        # and the copies of variables read as operands
+        left_operand, right_operand = self.operand(node.left_node), self.operand(node.right_node)
+        left_copy, right_copy = self.materializer(node.left_node), self.materializer(node.right_node)
+        # a result has the context of its left operand, which for a copy of a
+        # variable is the running one
+        left_is_copy = left_copy is not None
+
+        def method_call(left, right, context):
+            if left_copy:
+                left = left_copy(left, context)
+            if right_copy:
+                right = right_copy(right, context)
+            result, error = getattr(left, method)(right)
+            if error:
+                raise Failure(error)
+            return result.set_pos(pos_start, pos_end)
+
+        if op_type in NUMBER_ARITHMETIC:
+            arithmetic = NUMBER_ARITHMETIC[op_type]
+
+            def number_arithmetic(context):
+                left = left_operand(context)
+                right = right_operand(context)
+                if type(left) is Number and type(right) is Number:
+                    return (
+                        Number(arithmetic(left.value, right.value))
+                        .set_context(context if left_is_copy else left.context)
+                        .set_pos(pos_start, pos_end)
+                    )
+                return method_call(left, right, context)
+
+            return number_arithmetic
+
+        comparison = NUMBER_COMPARISONS[op_type]
+
+        def number_comparison(context):
+            left = left_operand(context)
+            right = right_operand(context)
+            if type(left) is Number and type(right) is Number:
+                return (
+                    Number(int(comparison(left.value, right.value)))
+                    .set_context(context if left_is_copy else left.context)
+                    .set_pos(pos_start, pos_end)
+                )
+            return method_call(left, right, context)
+
+        return number_comparison
+
+    def compile_UnaryOpNode(self, node):
+        operand = self.compile(node.node)
+        pos_start, pos_end = node.pos_start, node.pos_end
+
+        # as in compile_BinOpNode, a Number operand is used without a copy
+        number_operand = self.operand(node.node)
+        copy = self.materializer(node.node)
+        is_copy = copy is not None
+
+        if node.op_token.type == TT_MINUS:
+            def negate(context):
+                value = number_operand(context)
+                if type(value) is Number:
+                    return (
+                        Number(value.value * -1)
+                        .set_context(context if is_copy else value.context)
+                        .set_pos(pos_start, pos_end)
+                    )
+                if copy:
+                    value = copy(value, context)
+                number, error = value.multed_by(MINUS_ONE)
+                if error:
+                    raise Failure(error)
+                return number.set_pos(pos_start, pos_end)
+
+            return negate
+
+        if node.op_token.keyword == KW_NOT:
+            def not_(context):
+                value = number_operand(context)
+                if type(value) is Number:
+                    return (
+                        Number(1 if value.value == 0 else 0)
+                        .set_context(context if is_copy else value.context)
+                        .set_pos(pos_start, pos_end)
+                    )
+                if copy:
+                    value = copy(value, context)
+                number, error = value.notted()
+                if error:
+                    raise Failure(error)
+                return number.set_pos(pos_start, pos_end)
+
+            return not_
+
+        def plus(context):
+            return operand(context).set_pos(pos_start, pos_end)
+
+        return plus
+
+    def compile_IfNode(self, node):
+        cases = [
+            (self.operand(condition), self.compile(expr), should_return_null)
+            for condition, expr, should_return_null in node.cases
+        ]
+        else_case = None
+        if node.else_case:
+            expr, should_return_null = node.else_case
+            else_case = self.compile(expr), should_return_null
+
+        def if_(context):
+            for condition, expr, should_return_null in cases:
+                if condition(context).is_true():
+                    expr_value = expr(context)
+                    return Number.null if should_return_null else expr_value
+
+            if else_case:
+                expr, should_return_null = else_case
+                else_value = expr(context)
+                return Number.null if should_return_null else else_value
+
+            return Number.null
+
+        return if_
+
+    def compile_ForNode(self, node):
+        var_name = node.var_name_token.value
+        slot = self.slot(var_name)
+        start_value_node = self.operand(node.start_value_node)
+        end_value_node = self.operand(node.end_value_node)
+        step_value_node = node.step_value_node and self.operand(node.step_value_node)
+        body_node = self.compile(node.body_node)
+        should_return_null = node.should_return_null
+        pos_start, pos_end = node.pos_start, node.pos_end
+
+        def for_(context):
+            elements = []
+            start_value = start_value_node(context)
+            end_value = end_value_node(context)
+            step_value = step_value_node(context) if step_value_node else None
+
+            i = start_value.value
+            step = step_value.value if step_value_node else 1
+            ascending = step >= 0
+            end = end_value.value
+            # the loop variable is an item of the frame values or of the symbols
+            if slot is None:
+                variables, key = context.symbol_table.symbols, var_name
+                if context.symbol_table.parent is not None:
+                    context.symbol_table.root.local_names.add(var_name)
+            else:
+                variables, key = context.symbol_table.values, slot
+
+            while i < end if ascending else i > end:
+                variables[key] = Number(i)
+                i += step
+
+                try:
+                    value = body_node(context)
+                except Continue:
+                    continue
+                except Break:
+                    break
+                if not should_return_null:
+                    elements.append(value)
+
+            if should_return_null:
+                return Number.null
+            return List(elements).set_context(context).set_pos(pos_start, pos_end)
+
+        return for_
+
+    def compile_WhileNode(self, node):
+        condition_node = self.operand(node.condition_node)
+        body_node = self.compile(node.body_node)
+        should_return_null = node.should_return_null
+        pos_start, pos_end = node.pos_start, node.pos_end
+
+        def while_(context):
+            while True:
+                condition = condition_node(context)
+                # as in Interpreter.visit_WhileNode, only the last pass is kept
+                elements = []
+                if not condition.is_true():
+                    break
+
+                try:
+                    value = body_node(context)
+                except Continue:
+                    continue
+                except Break:
+                    break
+                if not should_return_null:
+                    elements.append(value)
+
+            if should_return_null:
+                return Number.null
+            return List(elements).set_context(context).set_pos(pos_start, pos_end)
+
+        return while_
+
+    def compile_FuncDefNode(self, node):
+        func_name = node.var_name_token.value if node.var_name_token else None
+        body_node = node.body_node
+        arg_names = [arg_name.value for arg_name in node.arg_name_tokens]
+        should_auto_return = node.should_auto_return
+        write = func_name and self.writer(func_name)
+        pos_start, pos_end = node.pos_start, node.pos_end
+
+        def func_def(context):
+            func_value = (
+                Function(func_name, body_node, arg_names, should_auto_return)
+                .set_context(context)
+                .set_pos(pos_start, pos_end)
+            )
+            if func_name:
+                write(context, func_value)
+            return func_value
+
+        return func_def
+
+    def compile_CallNode(self, node):
+        try:
+            func_name = node.node_to_call.var_name_token.value
+        except AttributeError:
+            # the interpreter fails the same way when it reaches the call
+            def bad_call(context):
+                return node.node_to_call.var_name_token.value
+
+            return bad_call
+
+        node_to_call = self.compile(node.node_to_call)
+        arg_nodes = [self.compile(arg_node) for arg_node in node.arg_nodes]
+        read = self.reader(func_name)
+        pos_start, pos_end = node.pos_start, node.pos_end
+        calls_variable = type(node.node_to_call) is VarAccessNode
+
+        def call(context):
+            value = read(context)
+            if not value:
+                raise Failure(
+                    RTError(
+                        pos_start,
+                        pos_end,
+                        f"अज्ञात कार्य बोलावले(call to unknown function)'{func_name}' ",
+                        context,
+                    )
+                )
+
+            if calls_variable and type(value) is Function:
+                args = [arg_node(context) for arg_node in arg_nodes]
+                return self.call_function(value, args, context, pos_start, pos_end, context)
+
+            value_to_call = node_to_call(context)
+            # a function runs in the context its value carries, as in Function.execute
+            parent = value_to_call.context
+            args = [arg_node(context) for arg_node in arg_nodes]
+            if type(value_to_call) is Function:
+                return self.call_function(value_to_call, args, context, pos_start, pos_end, parent)
+
+            value_to_call = value_to_call.copy().set_pos(pos_start, pos_end)
+            return_value = unwrap(value_to_call.execute(args, self))
+            return return_value.copy().set_pos(pos_start, pos_end).set_context(context)
+
+        return call
+
+    def call_function(self, function, args, context, pos_start, pos_end, parent):
+        # Function.execute on a Frame, without the two copies of the function
+        # that only carry the position of the call
+        if self.depth >= self.max_depth:
+            raise Failure(too_deep(pos_start, pos_end, context, self.max_depth))
+        arg_names = function.arg_names
+        if len(args) != len(arg_names):
+            callee = function.copy().set_pos(pos_start, pos_end).set_context(parent)
+            unwrap(callee.check_args(arg_names, args))
+
+        scope = self.scope_of(function)
+        exec_ctx = Context(function.name, parent, pos_start)
+        exec_ctx.symbol_table = frame = Frame(scope.slots, parent.symbol_table)
+        values = frame.values
+        for slot, arg_value in zip(scope.arg_slots, args):
+            arg_value.set_context(exec_ctx)
+            values[slot] = arg_value
+
+        self.depth += 1
+        try:
+            value = scope.body(exec_ctx)
+            return_value = None
+        except Return as returned:
+            value = None
+            return_value = returned.value
+        except RecursionError:
+            # a body nested deeper than the host stack allows
+            raise Failure(host_stack_full(pos_start, pos_end, context, self.depth))
+        finally:
+            self.depth -= 1
+
+        # as (value if should_auto_return else None) or return_value or Number.null,
+        # copied unless no variable or list can hold the value
+        if function.should_auto_return and value:
+            return_value, is_fresh = value, scope.fresh_body
+        elif return_value:
+            is_fresh = scope.fresh_returns
+        else:
+            return_value, is_fresh = Number.null, False
+        if not is_fresh:
+            return_value = return_value.copy()
+        return return_value.set_pos(pos_start, pos_end).set_context(context)
+
+    def compile_ReturnNode(self, node):
+        node_to_return = node.node_to_return and self.compile(node.node_to_return)
+        if self.scope and not (node.node_to_return and fresh(node.node_to_return)):
+            self.scope.fresh_returns = False
+
+        def return_(context):
+            value = node_to_return(context) if node_to_return else Number.null
+            # an empty list is not a return value to the interpreter either
+            if value:
+                raise Return(value)
+            return None
+
+        return return_
+
+    def compile_ContinueNode(self, node):
+        def continue_(context):
+            raise Continue()
+
+        return continue_
+
+    def compile_BreakNode(self, node):
+        def break_(context):
+            raise Break()
+
+        return break_
+
+    def index_target(self, node):
+        index_node = self.operand(node)
+
+        def target(context):
+            # Interpreter.visit_IndexNode does not check this result, so an
+            # error or exit here is dropped and the target is None
+            try:
+                return index_node(context)
+            except (Failure, Return, Continue, Break):
+                return None
+
+        return target
+
+    def compile_IndexNode(self, node):
+        index_node = self.index_target(node.index_node)
+        expr = self.operand(node.expr)
+        pos_start, pos_end = node.pos_start, node.pos_end
+
+        def index(context):
+            value_to_call = index_node(context)
+            value = expr(context)
+
+            try:
+                return value_to_call.elements[value.value]
+            except Exception:
+                raise Failure(
+                    RTError(
+                        pos_start,
+                        pos_end,
+                        f"{value_to_call} अनुक्रमणिका मर्यादित नाही(Index out of bound) ",
+                        context,
+                    )
+                )
+
+        return index
+
+    def compile_IndexAssignNode(self, node):
+        index_node = self.index_target(node.index_node)
+        expr = self.operand(node.expr)
+        assgin_expr = self.compile(node.assgin_expr)
+        pos_start, pos_end = node.pos_start, node.pos_end
+
+        def index_assign(context):
+            value_to_call = index_node(context)
+            value = expr(context)
+            assgin_value = assgin_expr(context)
+
+            try:
+                value_to_call.elements[value.value] = assgin_value
+            except Exception:
+                raise Failure(
+                    RTError(
+                        pos_start,
+                        pos_end,
+                        f"{value_to_call} अनुक्रमणिका मर्यादित नाही(Index out of bound)",
+                        context,
+                    )
+                )
+            return assgin_value
+
+        return index_assign
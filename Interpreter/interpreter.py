@@ -1,6 +1,7 @@
 from Nodes.functions import FuncDefNode
 from Nodes import loop, value
-from Values import Number, Function, String, List
+from Nodes import ListNode, IfNode, CallNode, ReturnNode
+from Values import Number, Function, String, List, MemoCache
 from Errors import RTError
 from Constants import *
 from Results import ParseResult, RTResult
@@ -8,15 +9,112 @@ from Results import ParseResult, RTResult
 
 # ------------Interpreter----------------
 
+# calls a script can nest before it fails, main.run_ast takes another
+MAX_DEPTH = 10000
+
+
+def too_deep(pos_start, pos_end, context, max_depth):
+    # the error of a call nested more than max_depth calls deep
+    return RTError(
+        pos_start,
+        pos_end,
+        f"कमाल पुनरावृत्ती खोली ओलांडली(maximum recursion depth of {max_depth} exceeded)",
+        context,
+    )
+
+
+def host_stack_full(pos_start, pos_end, context, depth):
+    # the error of a call that does not fit the host stack, though it is not
+    # nested max_depth calls deep, see main.host_frames
+    return RTError(
+        pos_start,
+        pos_end,
+        f"यजमान स्टॅक संपला(host stack exhausted at call depth {depth})",
+        context,
+    )
+
+
+class TailCall:
+    # what a call in tail position evaluates to, the function and arguments
+    # of the call. Function.execute gives it back as the value of the body,
+    # and the CallNode that called that function makes the call in its place,
+    # so a chain of tail calls runs in one host stack frame.
+    __slots__ = ("function", "args")
+
+    def __init__(self, function, args):
+        self.function = function
+        self.args = args
+
+
+def tail_calls(body_node, should_auto_return):
+    # the CallNodes of a function body in tail position: the call of a
+    # परत reached through statement lists and IF branches, and for
+    # FUN f() -> <expr>, a call that is the expression or a branch of it.
+    # A परत inside a loop or an index target is not, as those catch the
+    # CONTINUE, BREAK or error of the call that would no longer reach them.
+    calls = set()
+
+    def returns(node):
+        if type(node) is ListNode:
+            for element_node in node.element_nodes:
+                returns(element_node)
+        elif type(node) is IfNode:
+            for _, expr, _ in node.cases:
+                returns(expr)
+            if node.else_case:
+                returns(node.else_case[0])
+        elif type(node) is ReturnNode and type(node.node_to_return) is CallNode:
+            calls.add(node.node_to_return)
+
+    def values(node):
+        if type(node) is CallNode:
+            calls.add(node)
+        elif type(node) is IfNode:
+            for _, expr, should_return_null in node.cases:
+                if not should_return_null:
+                    values(expr)
+            if node.else_case and not node.else_case[1]:
+                values(node.else_case[0])
+
+    returns(body_node)
+    if should_auto_return:
+        values(body_node)
+    return calls
+
+
+class Visitors(dict):
+    # node class -> bound <prefix><class name> method, looked up once per class
+    def __init__(self, interpreter, prefix="visit_"):
+        super().__init__()
+        self.interpreter = interpreter
+        self.prefix = prefix
+
+    def __missing__(self, node_class):
+        visitor = getattr(
+            self.interpreter, self.prefix + node_class.__name__, self.interpreter.no_visit_method
+        )
+        self[node_class] = visitor
+        return visitor
+
 
 class Interpreter:
-    def __init__(self):
-        pass
+    def __init__(self, max_depth=MAX_DEPTH):
+        self.visitors = Visitors(self)
+        self.max_depth = max_depth
+        self.depth = 0
+        # the function bodies called so far, and the tail calls in them
+        self.bodies = set()
+        self.tail_calls = set()
+        # the bodies of the FUNs to memoize, see memoize, and the MemoCaches
+        # of this run, as a FUN of an earlier run may call what has changed
+        self.pure_bodies = ()
+        self.memo_size = 0
+        self.memos = set()
+        # CallNode -> the inline cache of its callee, see cached_callee
+        self.callees = {}
 
     def visit(self, node, context):
-        method_name = f"visit_{type(node).__name__}"
-        method = getattr(self, method_name, self.no_visit_method)
-        return method(node, context)
+        return self.visitors[type(node)](node, context)
 
     def no_visit_method(self, node, context):
         raise Exception(f"No visit_{type(node).__name__} method defined")
@@ -24,6 +122,9 @@ class Interpreter:
     ###################################
 
     def visit_NumberNode(self, node, context):
+        # a new Number per visit, folded constants too: the value carries the
+        # context of this visit, which its errors report, and a recursive
+        # call can visit the node again before the value is used
         return RTResult().success(
             Number(node.token.value)
             .set_context(context)
@@ -118,9 +219,9 @@ class Interpreter:
             result, error = left.get_comparison_lte(right)
         elif node.op_token.type == TT_GTE:
             result, error = left.get_comparison_gte(right)
-        elif node.op_token.matches(TT_KEYWORD, ("AND", "आणि")):
+        elif node.op_token.keyword == KW_AND:
             result, error = left.anded_by(right)
-        elif node.op_token.matches(TT_KEYWORD, ("OR", "किंवा")):
+        elif node.op_token.keyword == KW_OR:
             result, error = left.ored_by(right)
 
         if error:
@@ -138,7 +239,7 @@ class Interpreter:
 
         if node.op_token.type == TT_MINUS:
             number, error = number.multed_by(Number(-1))
-        elif node.op_token.matches(TT_KEYWORD, ("NOT", "नाही")):
+        elif node.op_token.keyword == KW_NOT:
             number, error = number.notted()
 
         if error:
@@ -188,6 +289,14 @@ class Interpreter:
         else:
             step_value = Number(1)
 
+        if (
+            type(start_value.value) is int
+            and type(end_value.value) is int
+            and type(step_value.value) is int
+            and step_value.value != 0
+        ):
+            return self.int_for(node, context, start_value.value, end_value.value, step_value.value)
+
         i = start_value.value
 
         if step_value.value >= 0:
@@ -196,7 +305,7 @@ class Interpreter:
             condition = lambda: i > end_value.value
 
         while condition():
-            context.symbol_table.set(node.var_name_token.value, Number(i))
+            context.symbol_table.set(node.var_name_token.value, Number.shared(i))
             i += step_value.value
 
             value_ = res.register(self.visit(node.body_node, context))
@@ -209,7 +318,8 @@ class Interpreter:
             if res.loop_should_break:
                 break
 
-            elements.append(value_)
+            if not node.should_return_null:
+                elements.append(value_)
 
             
 
@@ -221,6 +331,37 @@ class Interpreter:
             .set_pos(node.pos_start, node.pos_end)
         )
 
+    def int_for(self, node, context, start, end, step):
+        # a FOR with int bounds and a step that is not 0, counting over a
+        # range. The body result is read as is, as the flags it can have set
+        # are checked here in turn instead of through res.register
+        elements = []
+        symbols = context.symbol_table.symbols
+        var_name = node.var_name_token.value
+        if context.symbol_table.parent:
+            context.symbol_table.root.local_names.add(var_name)
+        visit = self.visitors[type(node.body_node)]
+        body_node = node.body_node
+        should_return_null = node.should_return_null
+
+        for i in range(start, end, step):
+            symbols[var_name] = Number.shared(i)
+            result = visit(body_node, context)
+            if result.loop_should_continue:
+                continue
+            if result.loop_should_break:
+                break
+            if result.error or result.func_return_value:
+                return result
+            if not should_return_null:
+                elements.append(result.value)
+
+        if should_return_null:
+            return RTResult().success(Number.null)
+        return RTResult().success(
+            List(elements).set_context(context).set_pos(node.pos_start, node.pos_end)
+        )
+
     def visit_WhileNode(self, node, context):
         res = RTResult()
 
@@ -243,7 +384,8 @@ class Interpreter:
             if res.loop_should_break:
                 break
 
-            elements.append(value_)
+            if not node.should_return_null:
+                elements.append(value_)
 
 
 
@@ -267,6 +409,10 @@ class Interpreter:
             .set_pos(node.pos_start, node.pos_end)
         )
 
+        if body_node in self.pure_bodies:
+            func_value.memo = MemoCache(self.memo_size)
+            self.memos.add(func_value.memo)
+
         if node.var_name_token:
             context.symbol_table.set(func_name, func_value)
 
@@ -275,27 +421,36 @@ class Interpreter:
     def visit_CallNode(self, node, context):
         res = RTResult()
         args = []
-        func_name =node.node_to_call.var_name_token.value
-        if not context.symbol_table.get(func_name):
-            print("EERPR")
-            return res.failure(
-                RTError(
-                    node.pos_start, node.pos_end, f"अज्ञात कार्य बोलावले(call to unknown function)'{func_name}' ", context
-                )
+        value_to_call = self.cached_callee(node, context)
+        if value_to_call:
+            value_to_call = (
+                value_to_call.copy().set_pos(node.pos_start, node.pos_end).set_context(context)
             )
+        else:
+            func_name =node.node_to_call.var_name_token.value
+            if not context.symbol_table.get(func_name):
+                return res.failure(
+                    RTError(
+                        node.pos_start, node.pos_end, f"अज्ञात कार्य बोलावले(call to unknown function)'{func_name}' ", context
+                    )
+                )
 
 
-        value_to_call = res.register(self.visit(node.node_to_call, context))
-        if res.should_return():
-            return res
-        value_to_call = value_to_call.copy().set_pos(node.pos_start, node.pos_end)
+            value_to_call = res.register(self.visit(node.node_to_call, context))
+            if res.should_return():
+                return res
+            value_to_call = value_to_call.copy().set_pos(node.pos_start, node.pos_end)
+            self.cache_callee(node, context)
 
         for arg_node in node.arg_nodes:
             args.append(res.register(self.visit(arg_node, context)))
             if res.should_return():
                 return res
 
-        return_value = res.register(value_to_call.execute(args))
+        if node in self.tail_calls:
+            return res.success(TailCall(value_to_call, args))
+
+        return_value = res.register(self.call(value_to_call, args, node, context))
         if res.should_return():
             return res
         return_value = (
@@ -304,6 +459,84 @@ class Interpreter:
             .set_context(context)
         )
         return res.success(return_value)
+
+    def cached_callee(self, node, context):
+        # the value the inline cache of CallNode node holds, as long as its
+        # name is still bound to it in the table at the root of the chain and
+        # no table with a parent has set the name in this run, so none can
+        # shadow it. None if the callee has to be looked up
+        cached = self.callees.get(node)
+        if cached is None:
+            return None
+        func_name, value = cached
+        root = context.symbol_table.root
+        if func_name in root.local_names or root.symbols.get(func_name) is not value:
+            return None
+        return value
+
+    def cache_callee(self, node, context):
+        # after the callee of node is looked up, the name as the root table has it
+        func_name = node.node_to_call.var_name_token.value
+        root = context.symbol_table.root
+        if func_name in root.local_names:
+            return
+        value = root.symbols.get(func_name)
+        if value:
+            self.callees[node] = (func_name, value)
+
+    def call(self, value_to_call, args, node, context):
+        # value_to_call.execute, then the tail calls it ends with one by one
+        if self.depth >= self.max_depth:
+            return RTResult().failure(
+                too_deep(node.pos_start, node.pos_end, context, self.max_depth)
+            )
+
+        # the MemoCaches and keys of the calls of pure functions in the chain,
+        # which all give the value its last call gives
+        memos = []
+        self.depth += 1
+        try:
+            while True:
+                if type(value_to_call) is Function and value_to_call.body_node not in self.bodies:
+                    self.bodies.add(value_to_call.body_node)
+                    self.tail_calls.update(
+                        tail_calls(value_to_call.body_node, value_to_call.should_auto_return)
+                    )
+
+                memo = value_to_call.memo if type(value_to_call) is Function else None
+                key = memo.key(args) if memo in self.memos else None
+                if key is not None:
+                    value = memo.get(key)
+                    if value is not None:
+                        result = RTResult().success(value)
+                        break
+                    memos.append((memo, key))
+
+                result = value_to_call.execute(args, self)
+                if type(result.value) is not TailCall:
+                    break
+                value_to_call, args = result.value.function, result.value.args
+        except RecursionError:
+            # a body nested deeper than the host stack allows
+            return RTResult().failure(
+                host_stack_full(node.pos_start, node.pos_end, context, self.depth)
+            )
+        finally:
+            self.depth -= 1
+
+        # a List could be changed by the caller, so only Numbers and Strings
+        # are kept, without the context of the call that gave them
+        if memos and not result.should_return() and type(result.value) in (Number, String):
+            value = result.value.copy().set_context()
+            for memo, key in memos:
+                memo.store(key, value)
+        return result
+
+    def memoize(self, pure_bodies, size):
+        # from now on FUNs with a body in pure_bodies get a MemoCache of size
+        self.pure_bodies = pure_bodies
+        self.memo_size = size
+
     def visit_ReturnNode(self, node, context):
         res = RTResult()
 
@@ -0,0 +1,216 @@
+from Interpreter.interpreter import Visitors
+from Nodes import VarAccessNode
+from Values import BuiltInFunction
+from SymbolTable import global_symbol_table
+
+
+# ------------PURITY----------------
+# Finds the functions of a program whose calls can be memoized: what a call
+# gives depends only on its arguments, and making it changes nothing else.
+# A body is pure if it
+#   reads no names but its arguments, its own variables and the builtin
+#   constants, as Baji scopes are dynamic and any other name would be
+#   whatever the caller has, and a global can be set again by a later input.
+#   A variable is its own only where every way to the read has set it,
+#   else the read may be of the caller's variable,
+#   calls only the pure builtins and pure functions, by a name nothing in the
+#   program declares as a variable or argument, and a builtin by a name no
+#   FUN of the program takes,
+#   sets no list element, defines no FUN, and has no BREAK or CONTINUE
+#   outside its own loops, which would end a loop of the caller.
+# Arguments that are not Numbers or Strings are checked when the call is made.
+
+# builtins that neither print, read, sleep, draw random numbers nor change a list
+PURE_BUILTINS = {"print_ret", "is_number", "is_string", "is_list", "is_function", "len"}
+
+# the Numbers the global table starts with
+CONSTANTS = {"NULL", "FALSE", "TRUE", "MATH_PI"}
+
+
+class Body:
+    # what one FUN body reads and calls, from Purity.visit. reads are the
+    # names read where they may not be set yet
+    def __init__(self, arg_names):
+        self.own_names = set(arg_names)
+        self.reads = set()
+        self.calls = set()
+        self.pure = True
+
+
+class Purity:
+    def __init__(self):
+        self.visitors = Visitors(self, "check_")
+        # FUN name -> its FuncDefNodes, and every name declared as a variable
+        self.functions = {}
+        self.variables = set()
+        self.bodies = {}
+        self.body = None
+        self.loops = 0
+        # the names every way to the node being visited has set
+        self.assigned = set()
+
+    def pure_functions(self, node):
+        # the body_nodes of the pure FUNs of the program node
+        self.visit(node)
+
+        constants = CONSTANTS - self.variables
+        builtins = {
+            name
+            for name, value in global_symbol_table.symbols.items()
+            if type(value) is BuiltInFunction and value.name in PURE_BUILTINS
+        } - self.variables - set(self.functions)
+        callable_names = {
+            name for name, defs in self.functions.items() if len(defs) == 1
+        } - self.variables
+        for body in self.bodies.values():
+            if body.reads - constants:
+                body.pure = False
+            if body.calls & body.own_names:
+                body.pure = False
+
+        # a function is impure if anything it calls is, until nothing changes
+        changed = True
+        while changed:
+            changed = False
+            for body in self.bodies.values():
+                if not body.pure:
+                    continue
+                for name in body.calls - builtins:
+                    if (
+                        name in self.variables
+                        or name not in callable_names
+                        or not self.bodies[self.functions[name][0].body_node].pure
+                    ):
+                        body.pure = False
+                        changed = True
+                        break
+
+        return {body_node for body_node, body in self.bodies.items() if body.pure}
+
+    def visit(self, node):
+        self.visitors[type(node)](node)
+
+    def visit_all(self, nodes):
+        for node in nodes:
+            self.visit(node)
+
+    def branch(self, node, assigned):
+        # visits node as run after assigned are set, and gives what is set after it
+        self.assigned = set(assigned)
+        self.visit(node)
+        return self.assigned
+
+    def no_visit_method(self, node):
+        # nodes without child nodes read and call nothing
+        pass
+
+    def impure(self):
+        if self.body:
+            self.body.pure = False
+
+    ###################################
+
+    def check_ListNode(self, node):
+        self.visit_all(node.element_nodes)
+
+    def check_VarAccessNode(self, node):
+        if self.body and node.var_name_token.value not in self.assigned:
+            self.body.reads.add(node.var_name_token.value)
+
+    def check_VarAssignNode(self, node):
+        self.visit(node.value_node)
+        self.variables.add(node.var_name_token.value)
+        self.assigned.add(node.var_name_token.value)
+        if self.body:
+            self.body.own_names.add(node.var_name_token.value)
+
+    def check_BinOpNode(self, node):
+        self.visit(node.left_node)
+        self.visit(node.right_node)
+
+    def check_UnaryOpNode(self, node):
+        self.visit(node.node)
+
+    def check_IfNode(self, node):
+        # a condition runs when the ones before it were false, and what is set
+        # after the IF is what every branch, or no branch, has set
+        ends = []
+        for condition, expr, _ in node.cases:
+            self.visit(condition)
+            after_condition = self.assigned
+            ends.append(self.branch(expr, after_condition))
+            self.assigned = after_condition
+        if node.else_case:
+            ends.append(self.branch(node.else_case[0], self.assigned))
+        else:
+            ends.append(self.assigned)
+        self.assigned = set.intersection(*ends)
+
+    def check_ForNode(self, node):
+        self.visit(node.start_value_node)
+        self.visit(node.end_value_node)
+        if node.step_value_node:
+            self.visit(node.step_value_node)
+        self.variables.add(node.var_name_token.value)
+        if self.body:
+            self.body.own_names.add(node.var_name_token.value)
+        # the body may run no time, so it sets nothing for what follows
+        before = self.assigned
+        self.loops += 1
+        self.branch(node.body_node, before | {node.var_name_token.value})
+        self.loops -= 1
+        self.assigned = before
+
+    def check_WhileNode(self, node):
+        self.visit(node.condition_node)
+        before = self.assigned
+        self.loops += 1
+        self.branch(node.body_node, before)
+        self.loops -= 1
+        self.assigned = before
+
+    def check_ContinueNode(self, node):
+        if not self.loops:
+            self.impure()
+
+    def check_BreakNode(self, node):
+        if not self.loops:
+            self.impure()
+
+    def check_FuncDefNode(self, node):
+        self.impure()
+        arg_names = [arg_name.value for arg_name in node.arg_name_tokens]
+        self.variables.update(arg_names)
+        if node.var_name_token:
+            self.functions.setdefault(node.var_name_token.value, []).append(node)
+
+        outer_body, outer_loops, outer_assigned = self.body, self.loops, self.assigned
+        self.body, self.loops = Body(arg_names), 0
+        self.bodies[node.body_node] = self.body
+        self.branch(node.body_node, arg_names)
+        self.body, self.loops, self.assigned = outer_body, outer_loops, outer_assigned
+        if node.var_name_token:
+            self.assigned.add(node.var_name_token.value)
+
+    def check_CallNode(self, node):
+        if type(node.node_to_call) is VarAccessNode:
+            if self.body:
+                self.body.calls.add(node.node_to_call.var_name_token.value)
+        else:
+            self.impure()
+            self.visit(node.node_to_call)
+        self.visit_all(node.arg_nodes)
+
+    def check_ReturnNode(self, node):
+        if node.node_to_return:
+            self.visit(node.node_to_return)
+
+    def check_IndexNode(self, node):
+        self.visit(node.index_node)
+        self.visit(node.expr)
+
+    def check_IndexAssignNode(self, node):
+        self.impure()
+        self.visit(node.index_node)
+        self.visit(node.expr)
+        self.visit(node.assgin_expr)
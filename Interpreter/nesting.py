@@ -0,0 +1,73 @@
+from Interpreter.interpreter import Visitors
+
+
+# ------------NESTING----------------
+# Finds how deep the nodes of a program nest, for the host stack of the
+# engines that recurse on the tree. A call runs the body of its function on
+# top of the frames of the call, so each call nested in another can take as
+# many frames as the deepest FUN body is deep, while the nodes around the
+# first call add their depth once.
+
+
+class Nesting:
+    def __init__(self):
+        self.depths = Visitors(self, "depth_")
+        # the depth of the deepest FUN body found so far
+        self.deepest_body = 0
+
+    def depth(self, node):
+        # how many nodes deep node goes, itself included
+        return self.depths[type(node)](node)
+
+    def deepest(self, nodes):
+        return max((self.depth(node) for node in nodes), default=0)
+
+    def no_visit_method(self, node):
+        # nodes without child nodes
+        return 1
+
+    ###################################
+
+    def depth_ListNode(self, node):
+        return 1 + self.deepest(node.element_nodes)
+
+    def depth_VarAssignNode(self, node):
+        return 1 + self.depth(node.value_node)
+
+    def depth_BinOpNode(self, node):
+        return 1 + self.deepest((node.left_node, node.right_node))
+
+    def depth_UnaryOpNode(self, node):
+        return 1 + self.depth(node.node)
+
+    def depth_IfNode(self, node):
+        nodes = [child for condition, expr, _ in node.cases for child in (condition, expr)]
+        if node.else_case:
+            nodes.append(node.else_case[0])
+        return 1 + self.deepest(nodes)
+
+    def depth_ForNode(self, node):
+        nodes = [node.start_value_node, node.end_value_node, node.body_node]
+        if node.step_value_node:
+            nodes.append(node.step_value_node)
+        return 1 + self.deepest(nodes)
+
+    def depth_WhileNode(self, node):
+        return 1 + self.deepest((node.condition_node, node.body_node))
+
+    def depth_FuncDefNode(self, node):
+        # the body runs when the function is called, not here
+        self.deepest_body = max(self.deepest_body, self.depth(node.body_node))
+        return 1
+
+    def depth_CallNode(self, node):
+        return 1 + self.deepest([node.node_to_call, *node.arg_nodes])
+
+    def depth_ReturnNode(self, node):
+        return 1 + (self.depth(node.node_to_return) if node.node_to_return else 0)
+
+    def depth_IndexNode(self, node):
+        return 1 + self.deepest((node.index_node, node.expr))
+
+    def depth_IndexAssignNode(self, node):
+        return 1 + self.deepest((node.index_node, node.expr, node.assgin_expr))
@@ -0,0 +1,279 @@
+import copy
+from Interpreter.interpreter import Visitors
+from Lexer.token import Token
+from Nodes import make_node, NumberNode, StringNode, ListNode, UnaryOpNode, IfNode
+from Values import Number
+from Constants import *
+
+
+# ------------OPTIMIZER----------------
+# Rewrites an AST before it runs, for every engine:
+#   constant subtrees of numbers are folded into one NumberNode,
+#   IF cases whose condition is a constant are dropped or become the ELSE,
+#   a WHILE whose condition is a constant false never runs its body,
+#   chains of the same unary operator are shortened.
+# A subtree is only folded when evaluating it cannot fail, so every runtime
+# error still comes from the node, and the position, it came from before.
+# Nodes are never changed in place, a node with a rewritten child is a copy,
+# so a parsed tree kept by the AST cache or the incremental parser stays as
+# it was parsed.
+
+BINARY_METHODS = {
+    TT_PLUS: "added_to",
+    TT_MINUS: "subbed_by",
+    TT_MUL: "multed_by",
+    TT_DIV: "dived_by",
+    TT_MOD: "moded_by",
+    TT_POWER: "power_by",
+    TT_EE: "get_comparison_eq",
+    TT_NE: "get_comparison_ne",
+    TT_LT: "get_comparison_lt",
+    TT_GT: "get_comparison_gt",
+    TT_LTE: "get_comparison_lte",
+    TT_GTE: "get_comparison_gte",
+}
+BINARY_KEYWORD_METHODS = {
+    KW_AND: "anded_by",
+    KW_OR: "ored_by",
+}
+
+# a power whose result could be bigger than this many bits is left to run
+# time, where it is only computed if the script gets there
+MAX_FOLDED_POWER_BITS = 4096
+
+
+def replace(original, **fields):
+    # a copy of the original node with some fields changed
+    new_node = copy.copy(original)
+    for name, value in fields.items():
+        setattr(new_node, name, value)
+    return new_node
+
+
+def constant(value, node):
+    # a NumberNode of value, spanning node
+    token_type = TT_INT if type(value) is int else TT_FLOAT
+    return make_node(NumberNode, (Token(token_type, value), node.pos_start, node.pos_end))
+
+
+def small_power(base, exponent):
+    # True if base ** exponent is cheap to compute now
+    if type(base) is not int or type(exponent) is not int or abs(base) <= 1:
+        return True
+    return exponent <= 0 or base.bit_length() * exponent <= MAX_FOLDED_POWER_BITS
+
+
+def unary_kind(node):
+    # the operator of a UnaryOpNode as Interpreter.visit_UnaryOpNode tells it apart
+    if node.op_token.type == TT_MINUS:
+        return TT_MINUS
+    if node.op_token.keyword == KW_NOT:
+        return KW_NOT
+    return TT_PLUS
+
+
+class Optimizer:
+    def __init__(self):
+        self.optimizers = Visitors(self, "optimize_")
+
+    def optimize(self, node):
+        return self.optimizers[type(node)](node)
+
+    def no_visit_method(self, node):
+        # nodes without child nodes are kept as they are
+        return node
+
+    def optimize_all(self, nodes):
+        # the optimized nodes, or nodes itself when none of them changed
+        optimized = [self.optimize(node) for node in nodes]
+        if all(new_node is node for new_node, node in zip(optimized, nodes)):
+            return nodes
+        return optimized
+
+    def constant_truth(self, node):
+        # is_true() of the value node always has, or None if it is not a constant
+        if type(node) is NumberNode:
+            return node.token.value != 0
+        if type(node) is StringNode:
+            return len(node.token.value) > 0
+        return None
+
+    ###################################
+
+    def optimize_ListNode(self, node):
+        element_nodes = self.optimize_all(node.element_nodes)
+        if element_nodes is node.element_nodes:
+            return node
+        return replace(node, element_nodes=element_nodes)
+
+    def optimize_VarAssignNode(self, node):
+        value_node = self.optimize(node.value_node)
+        if value_node is node.value_node:
+            return node
+        return replace(node, value_node=value_node)
+
+    def optimize_BinOpNode(self, node):
+        left_node = self.optimize(node.left_node)
+        right_node = self.optimize(node.right_node)
+
+        if type(left_node) is NumberNode and type(right_node) is NumberNode:
+            folded = self.fold(node, left_node.token.value, right_node.token.value)
+            if folded:
+                return folded
+
+        if left_node is node.left_node and right_node is node.right_node:
+            return node
+        return replace(node, left_node=left_node, right_node=right_node)
+
+    def fold(self, node, left, right):
+        # the NumberNode of left <op> right, or None if that can fail
+        # in the order Interpreter.visit_BinOpNode checks the operator
+        method = BINARY_METHODS.get(node.op_token.type) or BINARY_KEYWORD_METHODS.get(
+            node.op_token.keyword
+        )
+        if not method:
+            return None
+        if method == "power_by" and not small_power(left, right):
+            return None
+
+        try:
+            # the Number methods, so the value is exactly the one the engines compute
+            result, error = getattr(Number(left), method)(Number(right))
+        except Exception:
+            return None
+        if error:
+            return None
+        return constant(result.value, node)
+
+    def optimize_UnaryOpNode(self, node):
+        operand = self.optimize(node.node)
+        kind = unary_kind(node)
+
+        if type(operand) is NumberNode:
+            value = operand.token.value
+            if kind == TT_MINUS:
+                value, _ = Number(value).multed_by(Number(-1))
+                value = value.value
+            elif kind == KW_NOT:
+                value = 1 if value == 0 else 0
+            return constant(value, node)
+
+        if type(operand) is UnaryOpNode and unary_kind(operand) == kind:
+            # + only moves the value it gets, so + + x is + x
+            if kind == TT_PLUS:
+                return replace(node, node=operand.node)
+            # - - - x is - x and NOT NOT NOT x is NOT x, for any x, and the
+            # first one to fail is the innermost either way
+            inner = operand.node
+            if type(inner) is UnaryOpNode and unary_kind(inner) == kind:
+                return replace(node, node=inner.node)
+
+        if operand is node.node:
+            return node
+        return replace(node, node=operand)
+
+    def optimize_IfNode(self, node):
+        cases = []
+        else_case = node.else_case
+        changed = False
+
+        for condition, expr, should_return_null in node.cases:
+            condition_node = self.optimize(condition)
+            expr_node = self.optimize(expr)
+            changed = changed or condition_node is not condition or expr_node is not expr
+
+            truth = self.constant_truth(condition_node)
+            if truth is False:
+                # never taken
+                changed = True
+                continue
+            if truth is True:
+                # always taken once the cases before it are not, nothing after it runs
+                else_case = (expr_node, should_return_null)
+                changed = True
+                break
+            cases.append((condition_node, expr_node, should_return_null))
+        else:
+            if else_case:
+                expr, should_return_null = else_case
+                expr_node = self.optimize(expr)
+                if expr_node is not expr:
+                    else_case = (expr_node, should_return_null)
+                    changed = True
+
+        if not changed:
+            return node
+        if not cases and else_case and not else_case[1]:
+            # the IF always evaluates to this expression
+            return else_case[0]
+        return replace(node, cases=cases, else_case=else_case)
+
+    def optimize_ForNode(self, node):
+        start_value_node = self.optimize(node.start_value_node)
+        end_value_node = self.optimize(node.end_value_node)
+        step_value_node = node.step_value_node and self.optimize(node.step_value_node)
+        body_node = self.optimize(node.body_node)
+
+        if (
+            start_value_node is node.start_value_node
+            and end_value_node is node.end_value_node
+            and step_value_node is node.step_value_node
+            and body_node is node.body_node
+        ):
+            return node
+        return replace(
+            node,
+            start_value_node=start_value_node,
+            end_value_node=end_value_node,
+            step_value_node=step_value_node,
+            body_node=body_node,
+        )
+
+    def optimize_WhileNode(self, node):
+        condition_node = self.optimize(node.condition_node)
+
+        if self.constant_truth(condition_node) is False:
+            if node.should_return_null:
+                # an IF without cases, it evaluates to Number.null itself
+                return make_node(IfNode, ([], None, node.pos_start, node.pos_end))
+            # the empty list of a loop that never ran
+            return ListNode([], node.pos_start, node.pos_end)
+
+        body_node = self.optimize(node.body_node)
+        if condition_node is node.condition_node and body_node is node.body_node:
+            return node
+        return replace(node, condition_node=condition_node, body_node=body_node)
+
+    def optimize_FuncDefNode(self, node):
+        body_node = self.optimize(node.body_node)
+        if body_node is node.body_node:
+            return node
+        return replace(node, body_node=body_node)
+
+    def optimize_CallNode(self, node):
+        node_to_call = self.optimize(node.node_to_call)
+        arg_nodes = self.optimize_all(node.arg_nodes)
+        if node_to_call is node.node_to_call and arg_nodes is node.arg_nodes:
+            return node
+        return replace(node, node_to_call=node_to_call, arg_nodes=arg_nodes)
+
+    def optimize_ReturnNode(self, node):
+        node_to_return = node.node_to_return and self.optimize(node.node_to_return)
+        if node_to_return is node.node_to_return:
+            return node
+        return replace(node, node_to_return=node_to_return)
+
+    def optimize_IndexNode(self, node):
+        index_node = self.optimize(node.index_node)
+        expr = self.optimize(node.expr)
+        if index_node is node.index_node and expr is node.expr:
+            return node
+        return replace(node, index_node=index_node, expr=expr)
+
+    def optimize_IndexAssignNode(self, node):
+        index_node = self.optimize(node.index_node)
+        expr = self.optimize(node.expr)
+        assgin_expr = self.optimize(node.assgin_expr)
+        if index_node is node.index_node and expr is node.expr and assgin_expr is node.assgin_expr:
+            return node
+        return replace(node, index_node=index_node, expr=expr, assgin_expr=assgin_expr)
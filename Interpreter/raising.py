@@ -0,0 +1,314 @@
+from Interpreter.interpreter import Visitors, Interpreter, TailCall, MAX_DEPTH
+from Interpreter.closures import (
+    Failure,
+    Return,
+    Continue,
+    Break,
+    unwrap,
+    BINARY_METHODS,
+    BINARY_KEYWORD_METHODS,
+)
+from Values import Number, Function, String, List, MemoCache
+from Errors import RTError
+from Constants import *
+from Results import RTResult
+
+
+# ------------RAISING INTERPRETER----------------
+# The Interpreter walking the AST the same way, with the evaluate_ method of a
+# node returning its value instead of an RTResult. Errors, RETURN, CONTINUE
+# and BREAK are raised as the exceptions of the closure engine, the loops
+# catch CONTINUE and BREAK, and visit turns them back into the RTResult that
+# Function.execute and main.run_ast expect, so RETURN ends at the call.
+
+
+def float_passes(i, end, step):
+    # the values of a FOR variable whose bounds are not all ints
+    ascending = step >= 0
+    while i < end if ascending else i > end:
+        yield i
+        i += step
+
+
+class RaisingInterpreter:
+    def __init__(self, max_depth=MAX_DEPTH):
+        self.evaluators = Visitors(self, "evaluate_")
+        self.max_depth = max_depth
+        self.depth = 0
+        self.bodies = set()
+        self.tail_calls = set()
+        self.pure_bodies = ()
+        self.memo_size = 0
+        self.memos = set()
+        self.callees = {}
+
+    def visit(self, node, context):
+        res = RTResult()
+        try:
+            return res.success(self.evaluate(node, context))
+        except Failure as failure:
+            return res.failure(failure.error)
+        except Return as returned:
+            return res.success_return(returned.value)
+        except Continue:
+            return res.success_continue()
+        except Break:
+            return res.success_break()
+
+    def evaluate(self, node, context):
+        return self.evaluators[type(node)](node, context)
+
+    def no_visit_method(self, node, context):
+        raise Exception(f"No evaluate_{type(node).__name__} method defined")
+
+    ###################################
+
+    def evaluate_NumberNode(self, node, context):
+        # a new Number per visit, as in Interpreter.visit_NumberNode
+        return Number(node.token.value).set_context(context).set_pos(node.pos_start, node.pos_end)
+
+    def evaluate_StringNode(self, node, context):
+        return String(node.token.value).set_context(context).set_pos(node.pos_start, node.pos_end)
+
+    def evaluate_ListNode(self, node, context):
+        elements = [self.evaluate(element_node, context) for element_node in node.element_nodes]
+        return List(elements).set_context(context).set_pos(node.pos_start, node.pos_end)
+
+    def evaluate_VarAccessNode(self, node, context):
+        var_name = node.var_name_token.value
+        value = context.symbol_table.get(var_name)
+
+        if value == None:
+            raise Failure(
+                RTError(
+                    node.pos_start, node.pos_end, f"{var_name} परिभाषित नाही (not defined)", context
+                )
+            )
+        return value.copy().set_pos(node.pos_start, node.pos_end).set_context(context)
+
+    def evaluate_VarAssignNode(self, node, context):
+        var_name = node.var_name_token.value
+
+        if node.declare == False and context.symbol_table.get(var_name) == None:
+            raise Failure(
+                RTError(
+                    node.pos_start,
+                    node.pos_end,
+                    f"{var_name} नेमणूक करण्यापूर्वी संदर्भ(reference before assignment)",
+                    context,
+                )
+            )
+        value = self.evaluate(node.value_node, context)
+        context.symbol_table.set(var_name, value)
+        return value
+
+    def evaluate_BinOpNode(self, node, context):
+        left = self.evaluate(node.left_node, context)
+        right = self.evaluate(node.right_node, context)
+
+        op_token = node.op_token
+        method = BINARY_METHODS.get(op_token.type) or BINARY_KEYWORD_METHODS[op_token.keyword]
+        result, error = getattr(left, method)(right)
+
+        if error:
+            raise Failure(error)
+        return result.set_pos(node.pos_start, node.pos_end)
+
+    def evaluate_UnaryOpNode(self, node, context):
+        number = self.evaluate(node.node, context)
+        error = None
+
+        if node.op_token.type == TT_MINUS:
+            number, error = number.multed_by(Number(-1))
+        elif node.op_token.keyword == KW_NOT:
+            number, error = number.notted()
+
+        if error:
+            raise Failure(error)
+        return number.set_pos(node.pos_start, node.pos_end)
+
+    def evaluate_IfNode(self, node, context):
+        for condition, expr, should_return_null in node.cases:
+            if self.evaluate(condition, context).is_true():
+                expr_value = self.evaluate(expr, context)
+                return Number.null if should_return_null else expr_value
+
+        if node.else_case:
+            expr, should_return_null = node.else_case
+            else_value = self.evaluate(expr, context)
+            return Number.null if should_return_null else else_value
+
+        return Number.null
+
+    def evaluate_ForNode(self, node, context):
+        elements = []
+
+        start_value = self.evaluate(node.start_value_node, context)
+        end_value = self.evaluate(node.end_value_node, context)
+        if node.step_value_node:
+            step_value = self.evaluate(node.step_value_node, context)
+        else:
+            step_value = Number(1)
+
+        i = start_value.value
+        step = step_value.value
+        end = end_value.value
+        if type(i) is int and type(end) is int and type(step) is int and step != 0:
+            # int bounds count over a range, as Interpreter.int_for
+            passes = range(i, end, step)
+        else:
+            passes = float_passes(i, end, step)
+
+        symbols = context.symbol_table.symbols
+        var_name = node.var_name_token.value
+        if context.symbol_table.parent:
+            context.symbol_table.root.local_names.add(var_name)
+        for i in passes:
+            symbols[var_name] = Number.shared(i)
+
+            try:
+                value = self.evaluate(node.body_node, context)
+            except Continue:
+                continue
+            except Break:
+                break
+            if not node.should_return_null:
+                elements.append(value)
+
+        if node.should_return_null:
+            return Number.null
+        return List(elements).set_context(context).set_pos(node.pos_start, node.pos_end)
+
+    def evaluate_WhileNode(self, node, context):
+        while True:
+            condition = self.evaluate(node.condition_node, context)
+            # as in Interpreter.visit_WhileNode, only the last pass is kept
+            elements = []
+            if not condition.is_true():
+                break
+
+            try:
+                value = self.evaluate(node.body_node, context)
+            except Continue:
+                continue
+            except Break:
+                break
+            if not node.should_return_null:
+                elements.append(value)
+
+        if node.should_return_null:
+            return Number.null
+        return List(elements).set_context(context).set_pos(node.pos_start, node.pos_end)
+
+    def evaluate_FuncDefNode(self, node, context):
+        func_name = node.var_name_token.value if node.var_name_token else None
+        arg_names = [arg_name.value for arg_name in node.arg_name_tokens]
+        func_value = (
+            Function(func_name, node.body_node, arg_names, node.should_auto_return)
+            .set_context(context)
+            .set_pos(node.pos_start, node.pos_end)
+        )
+
+        if node.body_node in self.pure_bodies:
+            func_value.memo = MemoCache(self.memo_size)
+            self.memos.add(func_value.memo)
+
+        if node.var_name_token:
+            context.symbol_table.set(func_name, func_value)
+        return func_value
+
+    def evaluate_CallNode(self, node, context):
+        value_to_call = self.cached_callee(node, context)
+        if value_to_call:
+            value_to_call = (
+                value_to_call.copy().set_pos(node.pos_start, node.pos_end).set_context(context)
+            )
+        else:
+            func_name = node.node_to_call.var_name_token.value
+            if not context.symbol_table.get(func_name):
+                raise Failure(
+                    RTError(
+                        node.pos_start,
+                        node.pos_end,
+                        f"अज्ञात कार्य बोलावले(call to unknown function)'{func_name}' ",
+                        context,
+                    )
+                )
+
+            value_to_call = self.evaluate(node.node_to_call, context)
+            value_to_call = value_to_call.copy().set_pos(node.pos_start, node.pos_end)
+            self.cache_callee(node, context)
+        args = [self.evaluate(arg_node, context) for arg_node in node.arg_nodes]
+
+        if node in self.tail_calls:
+            return TailCall(value_to_call, args)
+
+        # Function.execute runs the body through visit, which stops its RETURN
+        return_value = unwrap(self.call(value_to_call, args, node, context))
+        return return_value.copy().set_pos(node.pos_start, node.pos_end).set_context(context)
+
+    # the depth check, tail calls, memoizing and inline caches of the
+    # interpreter, on RTResults as well
+    call = Interpreter.call
+    memoize = Interpreter.memoize
+    cached_callee = Interpreter.cached_callee
+    cache_callee = Interpreter.cache_callee
+
+    def evaluate_ReturnNode(self, node, context):
+        if node.node_to_return:
+            value = self.evaluate(node.node_to_return, context)
+        else:
+            value = Number.null
+
+        # an empty list is not a return value to the interpreter either
+        if value:
+            raise Return(value)
+        return None
+
+    def evaluate_ContinueNode(self, node, context):
+        raise Continue()
+
+    def evaluate_BreakNode(self, node, context):
+        raise Break()
+
+    def index_target(self, node, context):
+        # Interpreter.visit_IndexNode does not check this result, so an error
+        # or exit here is dropped and the target is None
+        try:
+            return self.evaluate(node, context)
+        except (Failure, Return, Continue, Break):
+            return None
+
+    def evaluate_IndexNode(self, node, context):
+        value_to_call = self.index_target(node.index_node, context)
+        value = self.evaluate(node.expr, context)
+
+        try:
+            return value_to_call.elements[value.value]
+        except Exception:
+            raise Failure(
+                RTError(
+                    node.pos_start,
+                    node.pos_end,
+                    f"{value_to_call} अनुक्रमणिका मर्यादित नाही(Index out of bound) ",
+                    context,
+                )
+            )
+
+    def evaluate_IndexAssignNode(self, node, context):
+        value_to_call = self.index_target(node.index_node, context)
+        value = self.evaluate(node.expr, context)
+        assgin_value = self.evaluate(node.assgin_expr, context)
+
+        try:
+            value_to_call.elements[value.value] = assgin_value
+        except Exception:
+            raise Failure(
+                RTError(
+                    node.pos_start,
+                    node.pos_end,
+                    f"{value_to_call} अनुक्रमणिका मर्यादित नाही(Index out of bound)",
+                    context,
+                )
+            )
+        return assgin_value
@@ -0,0 +1,117 @@
+from Interpreter.interpreter import Visitors
+
+
+# ------------RESOLVER----------------
+# Finds every name a function body can set: its arguments, then the चल
+# declarations, assignments, FOR variables and named FUNs in the body, in the
+# order they are written. Each gets a slot of the Frame the function runs in.
+# Bodies of FUNs inside the body are scopes of their own and are not entered.
+#
+# Baji scopes are dynamic, a function sees the variables of whoever called
+# it, so a name is resolved to a slot of the running frame only. Any other
+# name, and a slot that is not set yet, is looked up through the callers.
+
+
+class Scope:
+    def __init__(self, name, arg_names):
+        self.name = name
+        self.slots = {}
+        for arg_name in arg_names:
+            self.add(arg_name)
+        # FUN f(a, a) keeps the last a, as populate_args does
+        self.arg_slots = [self.slots[arg_name] for arg_name in arg_names]
+        # the closures compiled for the nodes of the body, and whether what the
+        # body and its RETURNs give is always a new value
+        self.closures = {}
+        self.body = None
+        self.fresh_body = False
+        self.fresh_returns = True
+
+    def add(self, name):
+        if name not in self.slots:
+            self.slots[name] = len(self.slots)
+
+    def slot(self, name):
+        # the slot of name, or None if it is looked up through the callers
+        return self.slots.get(name)
+
+    def __repr__(self):
+        return f"<scope {self.name} {list(self.slots)}>"
+
+
+class Resolver:
+    def __init__(self):
+        self.resolvers = Visitors(self, "resolve_")
+        self.scope = None
+
+    def resolve_function(self, name, body_node, arg_names):
+        self.scope = Scope(name, arg_names)
+        self.resolve(body_node)
+        return self.scope
+
+    def resolve(self, node):
+        self.resolvers[type(node)](node)
+
+    def resolve_all(self, nodes):
+        for node in nodes:
+            self.resolve(node)
+
+    def no_visit_method(self, node):
+        # nodes without child nodes set no names
+        pass
+
+    ###################################
+
+    def resolve_ListNode(self, node):
+        self.resolve_all(node.element_nodes)
+
+    def resolve_VarAssignNode(self, node):
+        self.resolve(node.value_node)
+        self.scope.add(node.var_name_token.value)
+
+    def resolve_BinOpNode(self, node):
+        self.resolve(node.left_node)
+        self.resolve(node.right_node)
+
+    def resolve_UnaryOpNode(self, node):
+        self.resolve(node.node)
+
+    def resolve_IfNode(self, node):
+        for condition, expr, _ in node.cases:
+            self.resolve(condition)
+            self.resolve(expr)
+        if node.else_case:
+            self.resolve(node.else_case[0])
+
+    def resolve_ForNode(self, node):
+        self.resolve(node.start_value_node)
+        self.resolve(node.end_value_node)
+        if node.step_value_node:
+            self.resolve(node.step_value_node)
+        self.scope.add(node.var_name_token.value)
+        self.resolve(node.body_node)
+
+    def resolve_WhileNode(self, node):
+        self.resolve(node.condition_node)
+        self.resolve(node.body_node)
+
+    def resolve_FuncDefNode(self, node):
+        if node.var_name_token:
+            self.scope.add(node.var_name_token.value)
+
+    def resolve_CallNode(self, node):
+        self.resolve(node.node_to_call)
+        self.resolve_all(node.arg_nodes)
+
+    def resolve_ReturnNode(self, node):
+        if node.node_to_return:
+            self.resolve(node.node_to_return)
+
+    def resolve_IndexNode(self, node):
+        self.resolve(node.index_node)
+        self.resolve(node.expr)
+
+    def resolve_IndexAssignNode(self, node):
+        self.resolve(node.index_node)
+        self.resolve(node.expr)
+        self.resolve(node.assgin_expr)
@@ -0,0 +1,652 @@
+import linecache
+from Interpreter.interpreter import Visitors, MAX_DEPTH, too_deep, host_stack_full
+from Interpreter.closures import (
+    ClosureCompiler,
+    Failure,
+    Return,
+    Continue,
+    Break,
+    unwrap,
+    lookup,
+    MINUS_ONE,
+)
+from Nodes import VarAccessNode
+from Values import Number, Function, String, List
+from Context import Context
+from SymbolTable import SymbolTable
+from Errors import RTError
+from Constants import *
+from Results import RTResult
+
+
+# ------------PYTHON TRANSPILER----------------
+# A third engine for the same AST. A node is translated to the source of a
+# Python function, which compile() turns into CPython bytecode, so loops run
+# as Python for/while loops, Baji functions as Python functions and
+# arithmetic on Numbers as Python arithmetic. Values stay the usual Values,
+# variables stay in the symbol tables of the contexts, so scoping, printing
+# and errors are those of the interpreter. Every line of the source knows the
+# Baji line it came from, Python exceptions raised by the source are noted
+# with it.
+
+BINARY_METHODS = {
+    TT_PLUS: "added_to",
+    TT_MINUS: "subbed_by",
+    TT_MUL: "multed_by",
+    TT_DIV: "dived_by",
+    TT_MOD: "moded_by",
+    TT_POWER: "power_by",
+    TT_EE: "get_comparison_eq",
+    TT_NE: "get_comparison_ne",
+    TT_LT: "get_comparison_lt",
+    TT_GT: "get_comparison_gt",
+    TT_LTE: "get_comparison_lte",
+    TT_GTE: "get_comparison_gte",
+}
+BINARY_KEYWORD_METHODS = {
+    KW_AND: "anded_by",
+    KW_OR: "ored_by",
+}
+# operators done by Python itself when both sides are Numbers
+PYTHON_ARITHMETIC = {
+    TT_PLUS: "+",
+    TT_MINUS: "-",
+    TT_MUL: "*",
+}
+PYTHON_COMPARISONS = {
+    TT_EE: "==",
+    TT_NE: "!=",
+    TT_LT: "<",
+    TT_GT: ">",
+    TT_LTE: "<=",
+    TT_GTE: ">=",
+}
+
+INDENT = "    "
+
+
+def binary(left, method, right, pos_start, pos_end):
+    result, error = getattr(left, method)(right)
+    if error:
+        raise Failure(error)
+    return result.set_pos(pos_start, pos_end)
+
+
+def negate(value, pos_start, pos_end):
+    number, error = value.multed_by(MINUS_ONE)
+    if error:
+        raise Failure(error)
+    return number.set_pos(pos_start, pos_end)
+
+
+def not_(value, pos_start, pos_end):
+    number, error = value.notted()
+    if error:
+        raise Failure(error)
+    return number.set_pos(pos_start, pos_end)
+
+
+def loop_range(start_value, end_value, step_value):
+    # the values of i in Interpreter.visit_ForNode, read in the same order
+    i = start_value.value
+    step = step_value.value
+    ascending = step >= 0
+    end = end_value.value
+    if type(i) is int and type(step) is int and type(end) is int and step:
+        return range(i, end, step)
+    return steps(i, step, end, ascending)
+
+
+def steps(i, step, end, ascending):
+    while i < end if ascending else i > end:
+        yield i
+        i += step
+
+
+class Program:
+    # the Python source of a node, and the Baji line of every line of it
+    def __init__(self, filename, source, line_map):
+        self.filename = filename
+        self.source = source
+        self.line_map = line_map
+
+    def baji_line(self, traceback):
+        # the Baji line of the innermost frame of the source in traceback
+        line = None
+        while traceback:
+            if traceback.tb_frame.f_code.co_filename == self.filename:
+                line = self.line_map[traceback.tb_lineno - 1]
+            traceback = traceback.tb_next
+        return line
+
+
+class Transpiler:
+    def __init__(self, max_depth=MAX_DEPTH):
+        self.max_depth = max_depth
+        self.depth = 0
+        # node -> the Python function running it
+        self.functions = {}
+        # body_node of a Function -> the Python function of the body
+        self.bodies = {}
+        self.programs = []
+        self.closures = None
+
+    def visit(self, node, context):
+        # same contract as Interpreter.visit, used by main.run_ast and Function.execute
+        res = RTResult()
+        function = self.function_of(node)
+        try:
+            return res.success(function(context))
+        except Failure as failure:
+            return res.failure(failure.error)
+        except Return as returned:
+            return res.success_return(returned.value)
+        except Continue:
+            return res.success_continue()
+        except Break:
+            return res.success_break()
+        except Exception as exception:
+            self.note_line(exception)
+            raise
+
+    def function_of(self, node):
+        function = self.functions.get(node)
+        if function is None:
+            try:
+                program, namespace = self.transpile(node)
+                code = compile(program.source, program.filename, "exec")
+            except (SyntaxError, RecursionError, MemoryError):
+                # nested deeper than CPython compiles, the closure engine runs it
+                self.closures = self.closures or ClosureCompiler(self.max_depth)
+                function = lambda context: unwrap(self.closures.visit(node, context))
+            else:
+                exec(code, namespace)
+                function = namespace["program"]
+            self.functions[node] = function
+        return function
+
+    def transpile(self, node):
+        filename = f"<baji {len(self.programs)}>"
+        generator = PythonGenerator(self)
+        program = Program(filename, *generator.generate(node))
+        self.programs.append(program)
+        # so Python tracebacks can show the generated lines
+        linecache.cache[filename] = (
+            len(program.source),
+            None,
+            program.source.splitlines(True),
+            filename,
+        )
+        return program, generator.namespace
+
+    def note_line(self, exception):
+        for program in self.programs:
+            line = program.baji_line(exception.__traceback__)
+            # noted once, by the innermost visit it passes
+            if line and hasattr(exception, "add_note") and not getattr(exception, "__notes__", None):
+                exception.add_note(f"while running Baji line {line}")
+                return
+
+    def call(self, callee, args, context, pos_start, pos_end, by_name):
+        # CallNode after its callee and arguments are evaluated
+        if self.depth >= self.max_depth:
+            raise Failure(too_deep(pos_start, pos_end, context, self.max_depth))
+        self.depth += 1
+        try:
+            return self.call_value(callee, args, context, pos_start, pos_end, by_name)
+        except RecursionError:
+            # a body nested deeper than the host stack allows
+            raise Failure(host_stack_full(pos_start, pos_end, context, self.depth))
+        finally:
+            self.depth -= 1
+
+    def call_value(self, callee, args, context, pos_start, pos_end, by_name):
+        body = self.bodies.get(callee.body_node) if type(callee) is Function else None
+
+        if body is None:
+            value_to_call = callee.copy().set_pos(pos_start, pos_end)
+            if by_name:
+                value_to_call.set_context(context)
+            return_value = unwrap(value_to_call.execute(args, self))
+            return return_value.copy().set_pos(pos_start, pos_end).set_context(context)
+
+        # Function.execute, with the body run as its Python function
+        parent = context if by_name else callee.context
+        arg_names = callee.arg_names
+        if len(args) != len(arg_names):
+            value_to_call = callee.copy().set_pos(pos_start, pos_end).set_context(parent)
+            unwrap(value_to_call.check_args(arg_names, args))
+
+        exec_ctx = Context(callee.name, parent, pos_start)
+        exec_ctx.symbol_table = SymbolTable(parent.symbol_table)
+        symbols = exec_ctx.symbol_table.symbols
+        for arg_name, arg_value in zip(arg_names, args):
+            arg_value.set_context(exec_ctx)
+            symbols[arg_name] = arg_value
+
+        return body(exec_ctx).copy().set_pos(pos_start, pos_end).set_context(context)
+
+
+class PythonGenerator:
+    # writes the Python source of one node and the function bodies in it
+    def __init__(self, transpiler):
+        self.transpilers = Visitors(self, "transpile_")
+        self.namespace = {
+            "Number": Number,
+            "String": String,
+            "List": List,
+            "Function": Function,
+            "NULL": Number.null,
+            # the step of a FOR without STEP, as in the interpreter
+            "ONE": Number(1),
+            "Failure": Failure,
+            "Return": Return,
+            "Continue": Continue,
+            "Break": Break,
+            "RTError": RTError,
+            "lookup": lookup,
+            "binary": binary,
+            "negate": negate,
+            "not_": not_,
+            "loop_range": loop_range,
+            "call": transpiler.call,
+            "BODIES": transpiler.bodies,
+        }
+        self.functions = []
+        self.registrations = []
+        self.positions = {}
+        self.lines = None
+        self.indent = 0
+        self.temps = 0
+        self.in_function = False
+        self.in_loop = False
+        self.line = None
+        self.stored = set()
+
+    def generate(self, node):
+        # the source and its line map
+        self.function("program", node, in_function=False)
+
+        lines = []
+        line_map = []
+        for function in self.functions:
+            for indent, text, line in function:
+                lines.append(INDENT * indent + text)
+                line_map.append(line)
+            lines.append("")
+            line_map.append(None)
+        for text, line in self.registrations:
+            lines.append(text)
+            line_map.append(line)
+
+        return "\n".join(lines) + "\n", line_map
+
+    def function(self, name, node, in_function, should_auto_return=False, arg_names=()):
+        outer = (
+            self.lines,
+            self.indent,
+            self.temps,
+            self.in_function,
+            self.in_loop,
+            self.line,
+            self.stored,
+        )
+        self.lines = []
+        # the names the function sets in symbols, not through SymbolTable.set
+        self.stored = set(arg_names)
+        self.indent = 1
+        self.temps = 0
+        # a RETURN leaves the Python function, BREAK and CONTINUE the Python loop
+        self.in_function = in_function
+        self.in_loop = False
+        self.line = node.pos_start.ln + 1
+
+        self.lines.append((0, f"def {name}(context):", self.line))
+        self.emit("symbols = context.symbol_table.symbols")
+        value = self.visit(node)
+        if not in_function:
+            self.emit(f"return {value}")
+        elif should_auto_return:
+            self.emit(f"return {value} or NULL")
+        else:
+            self.emit("return NULL")
+
+        if self.stored:
+            # so lookups do not read them from the root, see SymbolTable.root
+            stored = self.const(frozenset(self.stored), "L")
+            self.lines[2:2] = [
+                (1, "if context.symbol_table.parent is not None:", self.line),
+                (2, f"context.symbol_table.root.local_names.update({stored})", self.line),
+            ]
+
+        self.functions.append(self.lines)
+        (
+            self.lines,
+            self.indent,
+            self.temps,
+            self.in_function,
+            self.in_loop,
+            self.line,
+            self.stored,
+        ) = outer
+
+    def visit(self, node):
+        # emits the statements of node, and gives the local or literal holding its value
+        line = self.line
+        self.line = node.pos_start.ln + 1
+        value = self.transpilers[type(node)](node)
+        self.line = line
+        return value
+
+    def no_visit_method(self, node):
+        raise Exception(f"No transpile_{type(node).__name__} method defined")
+
+    def emit(self, text):
+        self.lines.append((self.indent, text, self.line))
+
+    def temp(self):
+        self.temps += 1
+        return f"t{self.temps}"
+
+    def const(self, value, prefix="K"):
+        name = f"{prefix}{len(self.namespace)}"
+        self.namespace[name] = value
+        return name
+
+    def pos(self, node):
+        # the names of node's positions, for set_pos and RTError
+        if node not in self.positions:
+            self.positions[node] = f"{self.const(node.pos_start, 'S')}, {self.const(node.pos_end, 'E')}"
+        return self.positions[node]
+
+    def fail(self, node, details):
+        # details is Python source of a str
+        self.emit(f"raise Failure(RTError({self.pos(node)}, {details}, context))")
+
+    def block(self):
+        return Block(self)
+
+    ###################################
+
+    def transpile_NumberNode(self, node):
+        value = self.temp()
+        self.emit(f"{value} = Number({node.token.value!r}).set_context(context).set_pos({self.pos(node)})")
+        return value
+
+    def transpile_StringNode(self, node):
+        value = self.temp()
+        self.emit(f"{value} = String({node.token.value!r}).set_context(context).set_pos({self.pos(node)})")
+        return value
+
+    def transpile_ListNode(self, node):
+        elements = [self.visit(element_node) for element_node in node.element_nodes]
+        value = self.temp()
+        self.emit(
+            f"{value} = List([{', '.join(elements)}]).set_context(context).set_pos({self.pos(node)})"
+        )
+        return value
+
+    def transpile_VarAccessNode(self, node):
+        var_name = node.var_name_token.value
+        value = self.temp()
+        self.emit(f"{value} = symbols.get({var_name!r})")
+        self.emit(f"if {value} is None:")
+        with self.block():
+            self.emit(f"{value} = lookup(context.symbol_table, {var_name!r})")
+            self.emit(f"if {value} is None:")
+            with self.block():
+                self.fail(node, repr(f"{var_name} परिभाषित नाही (not defined)"))
+        self.emit(f"{value} = {value}.copy().set_pos({self.pos(node)}).set_context(context)")
+        return value
+
+    def transpile_VarAssignNode(self, node):
+        var_name = node.var_name_token.value
+
+        if not node.declare:
+            self.emit(f"if lookup(context.symbol_table, {var_name!r}) is None:")
+            with self.block():
+                self.fail(
+                    node,
+                    repr(f"{var_name} नेमणूक करण्यापूर्वी संदर्भ(reference before assignment)"),
+                )
+
+        value = self.visit(node.value_node)
+        self.emit(f"symbols[{var_name!r}] = {value}")
+        self.stored.add(var_name)
+        return value
+
+    def transpile_BinOpNode(self, node):
+        left = self.visit(node.left_node)
+        right = self.visit(node.right_node)
+        value = self.temp()
+
+        op_type = node.op_token.type
+        if op_type == TT_KEYWORD:
+            method = BINARY_KEYWORD_METHODS[node.op_token.keyword]
+        else:
+            method = BINARY_METHODS[op_type]
+        pos = self.pos(node)
+
+        if op_type in PYTHON_ARITHMETIC:
+            result = f"{left}.value {PYTHON_ARITHMETIC[op_type]} {right}.value"
+        elif op_type in PYTHON_COMPARISONS:
+            result = f"1 if {left}.value {PYTHON_COMPARISONS[op_type]} {right}.value else 0"
+        else:
+            self.emit(f"{value} = binary({left}, {method!r}, {right}, {pos})")
+            return value
+
+        # the same result as the Number method
+        self.emit(f"if type({left}) is Number and type({right}) is Number:")
+        with self.block():
+            self.emit(f"{value} = Number({result}).set_context({left}.context).set_pos({pos})")
+        self.emit("else:")
+        with self.block():
+            self.emit(f"{value} = binary({left}, {method!r}, {right}, {pos})")
+        return value
+
+    def transpile_UnaryOpNode(self, node):
+        operand = self.visit(node.node)
+        value = self.temp()
+
+        if node.op_token.type == TT_MINUS:
+            self.emit(f"{value} = negate({operand}, {self.pos(node)})")
+        elif node.op_token.keyword == KW_NOT:
+            self.emit(f"{value} = not_({operand}, {self.pos(node)})")
+        else:
+            self.emit(f"{value} = {operand}.set_pos({self.pos(node)})")
+        return value
+
+    def transpile_IfNode(self, node):
+        # the cases follow each other instead of nesting, so a long ELIF
+        # chain does not indent the source past what Python parses
+        value = self.temp()
+        done = self.temp()
+        self.emit(f"{done} = False")
+
+        for condition, expr, should_return_null in node.cases:
+            self.emit(f"if not {done}:")
+            with self.block():
+                condition_value = self.visit(condition)
+                self.emit(f"if {condition_value}.is_true():")
+                with self.block():
+                    self.emit(f"{done} = True")
+                    self.branch(value, expr, should_return_null)
+
+        self.emit(f"if not {done}:")
+        with self.block():
+            if node.else_case:
+                expr, should_return_null = node.else_case
+                self.branch(value, expr, should_return_null)
+            else:
+                self.emit(f"{value} = NULL")
+        return value
+
+    def branch(self, value, expr, should_return_null):
+        expr_value = self.visit(expr)
+        self.emit(f"{value} = {'NULL' if should_return_null else expr_value}")
+
+    def transpile_ForNode(self, node):
+        start_value = self.visit(node.start_value_node)
+        end_value = self.visit(node.end_value_node)
+        step_value = self.visit(node.step_value_node) if node.step_value_node else "ONE"
+        elements = self.temp()
+        i = self.temp()
+
+        self.emit(f"{elements} = []")
+        self.emit(f"for {i} in loop_range({start_value}, {end_value}, {step_value}):")
+        var_name = node.var_name_token.value
+        self.stored.add(var_name)
+        return self.loop(node, elements, f"symbols[{var_name!r}] = Number.shared({i})")
+
+    def transpile_WhileNode(self, node):
+        elements = self.temp()
+
+        self.emit("while True:")
+        with self.block():
+            # an exit in the condition is not one of this loop
+            in_loop, self.in_loop = self.in_loop, False
+            condition = self.visit(node.condition_node)
+            self.in_loop = in_loop
+            # as in Interpreter.visit_WhileNode, only the last pass is kept
+            self.emit(f"{elements} = []")
+            self.emit(f"if not {condition}.is_true():")
+            self.emit(f"{INDENT}break")
+        return self.loop(node, elements)
+
+    def loop(self, node, elements, first=None):
+        # the body of the loop whose header was just emitted, and its value
+        with self.block():
+            if first:
+                self.emit(first)
+            self.emit("try:")
+            with self.block():
+                in_loop, self.in_loop = self.in_loop, True
+                body = self.visit(node.body_node)
+                self.in_loop = in_loop
+            self.emit("except Continue:")
+            self.emit(f"{INDENT}continue")
+            self.emit("except Break:")
+            self.emit(f"{INDENT}break")
+            if not node.should_return_null:
+                self.emit(f"{elements}.append({body})")
+
+        value = self.temp()
+        if node.should_return_null:
+            self.emit(f"{value} = NULL")
+        else:
+            self.emit(f"{value} = List({elements}).set_context(context).set_pos({self.pos(node)})")
+        return value
+
+    def transpile_FuncDefNode(self, node):
+        func_name = node.var_name_token.value if node.var_name_token else None
+        arg_names = [arg_name.value for arg_name in node.arg_name_tokens]
+        body_node = self.const(node.body_node, "B")
+
+        python_name = f"body_{body_node}"
+        self.function(python_name, node.body_node, True, node.should_auto_return, arg_names)
+        self.registrations.append((f"BODIES[{body_node}] = {python_name}", self.line))
+
+        value = self.temp()
+        self.emit(
+            f"{value} = Function({func_name!r}, {body_node}, {arg_names!r}, "
+            f"{node.should_auto_return!r}).set_context(context).set_pos({self.pos(node)})"
+        )
+        if func_name:
+            self.emit(f"symbols[{func_name!r}] = {value}")
+            self.stored.add(func_name)
+        return value
+
+    def transpile_CallNode(self, node):
+        try:
+            func_name = node.node_to_call.var_name_token.value
+        except AttributeError:
+            # the interpreter fails the same way when it reaches the call
+            self.emit(f"{self.const(node.node_to_call, 'N')}.var_name_token.value")
+            return "None"
+
+        self.emit(f"if not lookup(context.symbol_table, {func_name!r}):")
+        with self.block():
+            self.fail(node, repr(f"अज्ञात कार्य बोलावले(call to unknown function)'{func_name}' "))
+
+        by_name = type(node.node_to_call) is VarAccessNode
+        if by_name:
+            callee = self.temp()
+            self.emit(f"{callee} = lookup(context.symbol_table, {func_name!r})")
+        else:
+            callee = self.visit(node.node_to_call)
+
+        args = [self.visit(arg_node) for arg_node in node.arg_nodes]
+        value = self.temp()
+        self.emit(
+            f"{value} = call({callee}, [{', '.join(args)}], context, {self.pos(node)}, {by_name})"
+        )
+        return value
+
+    def transpile_ReturnNode(self, node):
+        value = self.visit(node.node_to_return) if node.node_to_return else "NULL"
+        # an empty list is not a return value to the interpreter either
+        self.emit(f"if {value}:")
+        with self.block():
+            self.emit(f"return {value}" if self.in_function else f"raise Return({value})")
+        return "None"
+
+    def transpile_ContinueNode(self, node):
+        self.emit("continue" if self.in_loop else "raise Continue()")
+        return "None"
+
+    def transpile_BreakNode(self, node):
+        self.emit("break" if self.in_loop else "raise Break()")
+        return "None"
+
+    def index_target(self, node):
+        # Interpreter.visit_IndexNode does not check this result, so an error
+        # or exit here is dropped and the target is None
+        target = self.temp()
+        in_function, in_loop = self.in_function, self.in_loop
+        self.in_function = self.in_loop = False
+
+        self.emit("try:")
+        with self.block():
+            value = self.visit(node)
+            self.emit(f"{target} = {value}")
+        self.emit("except (Failure, Return, Continue, Break):")
+        self.emit(f"{INDENT}{target} = None")
+
+        self.in_function, self.in_loop = in_function, in_loop
+        return target
+
+    def transpile_IndexNode(self, node):
+        target = self.index_target(node.index_node)
+        index = self.visit(node.expr)
+        value = self.temp()
+
+        self.emit("try:")
+        self.emit(f"{INDENT}{value} = {target}.elements[{index}.value]")
+        self.emit("except Exception:")
+        with self.block():
+            self.fail(node, f"str({target}) + {' अनुक्रमणिका मर्यादित नाही(Index out of bound) '!r}")
+        return value
+
+    def transpile_IndexAssignNode(self, node):
+        target = self.index_target(node.index_node)
+        index = self.visit(node.expr)
+        value = self.visit(node.assgin_expr)
+
+        self.emit("try:")
+        self.emit(f"{INDENT}{target}.elements[{index}.value] = {value}")
+        self.emit("except Exception:")
+        with self.block():
+            self.fail(node, f"str({target}) + {' अनुक्रमणिका मर्यादित नाही(Index out of bound)'!r}")
+        return value
+
+
+class Block:
+    # with generator.block(): indents what is emitted inside
+    def __init__(self, generator):
+        self.generator = generator
+
+    def __enter__(self):
+        self.generator.indent += 1
+
+    def __exit__(self, *exc_info):
+        self.generator.indent -= 1
@@ -0,0 +1,154 @@
+from Interpreter.interpreter import Visitors
+from Interpreter.optimizer import replace
+
+
+# ------------USAGE----------------
+# Finds the nodes whose value nothing reads and rewrites the loops among them
+# to the block form, with should_return_null set, so no engine keeps the value
+# of every pass of a loop that runs as a statement. A value is discarded when
+# it is
+#   the program, unless the caller of main.run_ast reads it,
+#   an element of a discarded list of statements,
+#   a branch of an IF that is discarded or gives Number.null for it,
+#   the body of a loop that is discarded or gives Number.null,
+#   the body of a FUN that only gives what RETURN gives.
+# As in the Optimizer, a node with a rewritten child is a copy.
+
+
+class Usage:
+    def __init__(self):
+        self.rewriters = Visitors(self, "rewrite_")
+
+    def rewrite(self, node, used=True):
+        return self.rewriters[type(node)](node, used)
+
+    def rewrite_all(self, nodes, used):
+        rewritten = [self.rewrite(node, used) for node in nodes]
+        if all(new_node is node for new_node, node in zip(rewritten, nodes)):
+            return nodes
+        return rewritten
+
+    def no_visit_method(self, node, used):
+        # nodes without statements in them are kept as they are
+        return node
+
+    ###################################
+
+    def rewrite_ListNode(self, node, used):
+        element_nodes = self.rewrite_all(node.element_nodes, used)
+        if element_nodes is node.element_nodes:
+            return node
+        return replace(node, element_nodes=element_nodes)
+
+    def rewrite_VarAssignNode(self, node, used):
+        value_node = self.rewrite(node.value_node)
+        if value_node is node.value_node:
+            return node
+        return replace(node, value_node=value_node)
+
+    def rewrite_BinOpNode(self, node, used):
+        left_node = self.rewrite(node.left_node)
+        right_node = self.rewrite(node.right_node)
+        if left_node is node.left_node and right_node is node.right_node:
+            return node
+        return replace(node, left_node=left_node, right_node=right_node)
+
+    def rewrite_UnaryOpNode(self, node, used):
+        operand = self.rewrite(node.node)
+        if operand is node.node:
+            return node
+        return replace(node, node=operand)
+
+    def rewrite_IfNode(self, node, used):
+        cases = [
+            (self.rewrite(condition), self.rewrite(expr, used and not should_return_null), should_return_null)
+            for condition, expr, should_return_null in node.cases
+        ]
+        else_case = node.else_case
+        if else_case:
+            expr, should_return_null = else_case
+            else_case = (self.rewrite(expr, used and not should_return_null), should_return_null)
+
+        if all(
+            new[0] is old[0] and new[1] is old[1] for new, old in zip(cases, node.cases)
+        ) and (not else_case or else_case[0] is node.else_case[0]):
+            return node
+        return replace(node, cases=cases, else_case=else_case)
+
+    def rewrite_ForNode(self, node, used):
+        should_return_null = node.should_return_null or not used
+        start_value_node = self.rewrite(node.start_value_node)
+        end_value_node = self.rewrite(node.end_value_node)
+        step_value_node = node.step_value_node and self.rewrite(node.step_value_node)
+        body_node = self.rewrite(node.body_node, not should_return_null)
+
+        if (
+            start_value_node is node.start_value_node
+            and end_value_node is node.end_value_node
+            and step_value_node is node.step_value_node
+            and body_node is node.body_node
+            and should_return_null == node.should_return_null
+        ):
+            return node
+        return replace(
+            node,
+            start_value_node=start_value_node,
+            end_value_node=end_value_node,
+            step_value_node=step_value_node,
+            body_node=body_node,
+            should_return_null=should_return_null,
+        )
+
+    def rewrite_WhileNode(self, node, used):
+        should_return_null = node.should_return_null or not used
+        condition_node = self.rewrite(node.condition_node)
+        body_node = self.rewrite(node.body_node, not should_return_null)
+
+        if (
+            condition_node is node.condition_node
+            and body_node is node.body_node
+            and should_return_null == node.should_return_null
+        ):
+            return node
+        return replace(
+            node,
+            condition_node=condition_node,
+            body_node=body_node,
+            should_return_null=should_return_null,
+        )
+
+    def rewrite_FuncDefNode(self, node, used):
+        body_node = self.rewrite(node.body_node, node.should_auto_return)
+        if body_node is node.body_node:
+            return node
+        return replace(node, body_node=body_node)
+
+    def rewrite_CallNode(self, node, used):
+        node_to_call = self.rewrite(node.node_to_call)
+        arg_nodes = self.rewrite_all(node.arg_nodes, True)
+        if node_to_call is node.node_to_call and arg_nodes is node.arg_nodes:
+            return node
+        return replace(node, node_to_call=node_to_call, arg_nodes=arg_nodes)
+
+    def rewrite_ReturnNode(self, node, used):
+        if not node.node_to_return:
+            return node
+        node_to_return = self.rewrite(node.node_to_return)
+        if node_to_return is node.node_to_return:
+            return node
+        return replace(node, node_to_return=node_to_return)
+
+    def rewrite_IndexNode(self, node, used):
+        index_node = self.rewrite(node.index_node)
+        expr = self.rewrite(node.expr)
+        if index_node is node.index_node and expr is node.expr:
+            return node
+        return replace(node, index_node=index_node, expr=expr)
+
+    def rewrite_IndexAssignNode(self, node, used):
+        index_node = self.rewrite(node.index_node)
+        expr = self.rewrite(node.expr)
+        assgin_expr = self.rewrite(node.assgin_expr)
+        if index_node is node.index_node and expr is node.expr and assgin_expr is node.assgin_expr:
+            return node
+        return replace(node, index_node=index_node, expr=expr, assgin_expr=assgin_expr)
@@ -0,0 +1,471 @@
+import operator
+from Interpreter.bytecode import *
+from Interpreter.interpreter import MAX_DEPTH, too_deep
+from Interpreter.closures import Failure, Return, Continue, Break, unwrap, lookup, MINUS_ONE
+from Values import Number, Function, String, List
+from Context import Context
+from SymbolTable import SymbolTable
+from Errors import RTError
+from Results import RTResult
+
+
+# ------------VIRTUAL MACHINE----------------
+# Runs the Code of Interpreter.bytecode on a value stack per call. Calling a
+# Function pushes a Frame instead of recursing, so how deep a script can
+# recurse does not depend on Python's recursion limit. Errors and exits are
+# raised as the exceptions of Interpreter.closures and unwind the blocks of a
+# frame (loop bodies, index targets) and then the frames themselves, the way
+# the RTResult flags travel up in the interpreter.
+
+# in the order of bytecode.ARITHMETIC and bytecode.COMPARISONS
+ARITHMETIC_OPERATIONS = (operator.add, operator.sub, operator.mul)
+ARITHMETIC_METHODS = ("added_to", "subbed_by", "multed_by")
+COMPARE_OPERATIONS = (
+    operator.eq,
+    operator.ne,
+    operator.lt,
+    operator.gt,
+    operator.le,
+    operator.ge,
+)
+COMPARE_METHODS = (
+    "get_comparison_eq",
+    "get_comparison_ne",
+    "get_comparison_lt",
+    "get_comparison_gt",
+    "get_comparison_lte",
+    "get_comparison_gte",
+)
+
+# kinds of block
+LOOP = 0
+GUARD = 1
+
+
+class Frame:
+    __slots__ = ("code", "ip", "stack", "blocks", "context", "function", "pos_start", "pos_end")
+
+    def __init__(self, code, context, function=None, pos_start=None, pos_end=None):
+        self.code = code
+        self.ip = 0
+        self.stack = []
+        # (kind, stack height, target) of the blocks the frame is in
+        self.blocks = []
+        self.context = context
+        # the Function this is a call of, and where it was called
+        self.function = function
+        self.pos_start = pos_start
+        self.pos_end = pos_end
+
+
+class VirtualMachine:
+    def __init__(self, max_depth=MAX_DEPTH):
+        # calls run in frames of the vm rather than on the host stack, so only
+        # max_depth limits how deep they go
+        self.max_depth = max_depth
+        self.codes = {}
+        self.compiler = Compiler(self.codes)
+
+    def visit(self, node, context):
+        # same contract as Interpreter.visit, used by main.run_ast and Function.execute
+        return self.run(self.compiler.compile(node), context)
+
+    def code_of(self, function):
+        return self.codes.get(function.body_node) or self.compiler.compile(
+            function.body_node, function.name, function.arg_names, function.should_auto_return
+        )
+
+    def run(self, code, context):
+        frames = [Frame(code, context)]
+        while True:
+            try:
+                return RTResult().success(self.execute(frames))
+            except (Failure, Return, Continue, Break) as signal:
+                res = self.unwind(frames, signal)
+                if res is not None:
+                    return res
+
+    def unwind(self, frames, signal):
+        # moves to whatever handles signal and returns None to go on from
+        # there, or returns the RTResult the first frame is left with
+        while True:
+            frame = frames[-1]
+            stack, blocks = frame.stack, frame.blocks
+
+            while blocks:
+                kind, height, target = blocks.pop()
+                if kind == GUARD:
+                    del stack[height:]
+                    stack.append(None)
+                    frame.ip = target
+                    return None
+                if type(signal) is Continue:
+                    del stack[height:]
+                    frame.ip = target - 1
+                    return None
+                if type(signal) is Break:
+                    del stack[height:]
+                    frame.ip = target
+                    return None
+
+            if len(frames) == 1:
+                return self.result(signal)
+
+            frames.pop()
+            if type(signal) is Return:
+                # Function.execute stops the RETURN, CONTINUE and BREAK go on
+                # to the loop of the caller
+                frames[-1].stack.append(self.returned(frame, frames[-1], signal.value))
+                return None
+
+    def result(self, signal):
+        res = RTResult()
+        if type(signal) is Failure:
+            return res.failure(signal.error)
+        if type(signal) is Return:
+            return res.success_return(signal.value)
+        if type(signal) is Continue:
+            return res.success_continue()
+        return res.success_break()
+
+    def returned(self, frame, caller, value):
+        # what the CallNode of a finished frame evaluates to
+        return value.copy().set_pos(frame.pos_start, frame.pos_end).set_context(caller.context)
+
+    def execute(self, frames):
+        # runs from the frame on top until the first frame ends, and gives
+        # the value it ended with
+        frame = frames[-1]
+        code = frame.code
+        ops, args, consts, names, positions = (
+            code.ops,
+            code.args,
+            code.consts,
+            code.names,
+            code.positions,
+        )
+        stack, blocks, context = frame.stack, frame.blocks, frame.context
+        ip = frame.ip
+
+        while True:
+            op = ops[ip]
+            arg = args[ip]
+            ip += 1
+
+            if op == LOAD_NAME:
+                value = lookup(context.symbol_table, names[arg])
+                pos_start, pos_end = positions[ip - 1]
+                if value is None:
+                    raise Failure(
+                        RTError(
+                            pos_start, pos_end, f"{names[arg]} परिभाषित नाही (not defined)", context
+                        )
+                    )
+                stack.append(value.copy().set_pos(pos_start, pos_end).set_context(context))
+
+            elif op == LOAD_NUMBER:
+                pos_start, pos_end = positions[ip - 1]
+                stack.append(Number(consts[arg]).set_context(context).set_pos(pos_start, pos_end))
+
+            elif op == BINARY_ARITHMETIC:
+                right = stack.pop()
+                left = stack[-1]
+                pos_start, pos_end = positions[ip - 1]
+                # the same result as the Number method, without the call and the tuple
+                if type(left) is Number and type(right) is Number:
+                    stack[-1] = (
+                        Number(ARITHMETIC_OPERATIONS[arg](left.value, right.value))
+                        .set_context(left.context)
+                        .set_pos(pos_start, pos_end)
+                    )
+                    continue
+                result, error = getattr(left, ARITHMETIC_METHODS[arg])(right)
+                if error:
+                    raise Failure(error)
+                stack[-1] = result.set_pos(pos_start, pos_end)
+
+            elif op == BINARY_COMPARE:
+                right = stack.pop()
+                left = stack[-1]
+                pos_start, pos_end = positions[ip - 1]
+                if type(left) is Number and type(right) is Number:
+                    stack[-1] = (
+                        Number(int(COMPARE_OPERATIONS[arg](left.value, right.value)))
+                        .set_context(left.context)
+                        .set_pos(pos_start, pos_end)
+                    )
+                    continue
+                result, error = getattr(left, COMPARE_METHODS[arg])(right)
+                if error:
+                    raise Failure(error)
+                stack[-1] = result.set_pos(pos_start, pos_end)
+
+            elif op == POP_JUMP_IF_FALSE:
+                if not stack.pop().is_true():
+                    ip = arg
+
+            elif op == JUMP:
+                ip = arg
+
+            elif op == STORE_NAME:
+                context.symbol_table.set(names[arg], stack[-1])
+
+            elif op == POP:
+                stack.pop()
+
+            elif op == LOAD_NULL:
+                stack.append(Number.null)
+
+            elif op == LOAD_CALLEE or op == CHECK_CALLEE:
+                value = lookup(context.symbol_table, names[arg])
+                if not value:
+                    pos_start, pos_end = positions[ip - 1]
+                    raise Failure(
+                        RTError(
+                            pos_start,
+                            pos_end,
+                            f"अज्ञात कार्य बोलावले(call to unknown function)'{names[arg]}' ",
+                            context,
+                        )
+                    )
+                if op == LOAD_CALLEE:
+                    stack.append(value)
+
+            elif op == CALL_NAME or op == CALL:
+                if arg:
+                    call_args = stack[-arg:]
+                    del stack[-arg:]
+                else:
+                    call_args = []
+                callee = stack.pop()
+                pos_start, pos_end = positions[ip - 1]
+
+                if type(callee) is not Function:
+                    # built-in functions, or a value that fails to be called
+                    value_to_call = callee.copy().set_pos(pos_start, pos_end)
+                    if op == CALL_NAME:
+                        value_to_call.set_context(context)
+                    return_value = unwrap(value_to_call.execute(call_args, self))
+                    stack.append(
+                        return_value.copy().set_pos(pos_start, pos_end).set_context(context)
+                    )
+                    continue
+
+                # Function.execute, with the body run in a new frame
+                if len(frames) > self.max_depth:
+                    raise Failure(too_deep(pos_start, pos_end, context, self.max_depth))
+                parent = context if op == CALL_NAME else callee.context
+                arg_names = callee.arg_names
+                if len(call_args) != len(arg_names):
+                    value_to_call = callee.copy().set_pos(pos_start, pos_end).set_context(parent)
+                    unwrap(value_to_call.check_args(arg_names, call_args))
+
+                exec_ctx = Context(callee.name, parent, pos_start)
+                exec_ctx.symbol_table = SymbolTable(parent.symbol_table)
+                symbols = exec_ctx.symbol_table.symbols
+                for arg_name, arg_value in zip(arg_names, call_args):
+                    arg_value.set_context(exec_ctx)
+                    symbols[arg_name] = arg_value
+                exec_ctx.symbol_table.root.local_names.update(arg_names)
+
+                frame.ip = ip
+                frame = Frame(self.code_of(callee), exec_ctx, callee, pos_start, pos_end)
+                frames.append(frame)
+                code = frame.code
+                ops, args, consts, names, positions = (
+                    code.ops,
+                    code.args,
+                    code.consts,
+                    code.names,
+                    code.positions,
+                )
+                stack, blocks, context = frame.stack, frame.blocks, frame.context
+                ip = 0
+
+            elif op == END or op == RETURN_VALUE:
+                value = stack.pop()
+                if op == RETURN_VALUE:
+                    if not value:
+                        # an empty list is not a return value to the interpreter either
+                        stack.append(None)
+                        continue
+                    if blocks or frame.function is None:
+                        raise Return(value)
+                elif frame.function is None:
+                    return value
+                elif frame.function.should_auto_return:
+                    value = value or Number.null
+                else:
+                    value = Number.null
+
+                frames.pop()
+                caller = frames[-1]
+                caller.stack.append(self.returned(frame, caller, value))
+
+                frame = caller
+                code = frame.code
+                ops, args, consts, names, positions = (
+                    code.ops,
+                    code.args,
+                    code.consts,
+                    code.names,
+                    code.positions,
+                )
+                stack, blocks, context = frame.stack, frame.blocks, frame.context
+                ip = frame.ip
+
+            elif op == FOR_ITER:
+                state = stack[-1]
+                i = state[1]
+                if i < state[3] if state[4] else i > state[3]:
+                    context.symbol_table.set(state[5], Number.shared(i))
+                    state[1] = i + state[2]
+                else:
+                    ip = arg
+
+            elif op == SETUP_LOOP:
+                blocks.append((LOOP, len(stack), arg))
+
+            elif op == POP_BLOCK:
+                blocks.pop()
+
+            elif op == APPEND_ELEMENT:
+                value = stack.pop()
+                stack[-1][0].append(value)
+
+            elif op == WHILE_TEST:
+                condition = stack.pop()
+                # as in Interpreter.visit_WhileNode, only the last pass is kept
+                stack[-1][0] = []
+                if not condition.is_true():
+                    ip = arg
+
+            elif op == LOAD_STRING:
+                pos_start, pos_end = positions[ip - 1]
+                stack.append(String(consts[arg]).set_context(context).set_pos(pos_start, pos_end))
+
+            elif op == BUILD_LIST:
+                if arg:
+                    elements = stack[-arg:]
+                    del stack[-arg:]
+                else:
+                    elements = []
+                pos_start, pos_end = positions[ip - 1]
+                stack.append(List(elements).set_context(context).set_pos(pos_start, pos_end))
+
+            elif op == CHECK_NAME:
+                if lookup(context.symbol_table, names[arg]) is None:
+                    pos_start, pos_end = positions[ip - 1]
+                    raise Failure(
+                        RTError(
+                            pos_start,
+                            pos_end,
+                            f"{names[arg]} नेमणूक करण्यापूर्वी संदर्भ(reference before assignment)",
+                            context,
+                        )
+                    )
+
+            elif op == BINARY_OP:
+                right = stack.pop()
+                result, error = getattr(stack[-1], consts[arg])(right)
+                if error:
+                    raise Failure(error)
+                stack[-1] = result.set_pos(*positions[ip - 1])
+
+            elif op == NEGATE:
+                number, error = stack[-1].multed_by(MINUS_ONE)
+                if error:
+                    raise Failure(error)
+                stack[-1] = number.set_pos(*positions[ip - 1])
+
+            elif op == NOT:
+                number, error = stack[-1].notted()
+                if error:
+                    raise Failure(error)
+                stack[-1] = number.set_pos(*positions[ip - 1])
+
+            elif op == SET_POS:
+                stack[-1] = stack[-1].set_pos(*positions[ip - 1])
+
+            elif op == FOR_PREP:
+                step_value = stack.pop()
+                end_value = stack.pop()
+                start_value = stack.pop()
+                # the attributes are read in the order the interpreter reads them
+                i = start_value.value
+                step = step_value.value
+                ascending = step >= 0
+                stack.append([[], i, step, end_value.value, ascending, names[arg]])
+
+            elif op == WHILE_PREP:
+                stack.append([[]])
+
+            elif op == END_LOOP:
+                elements = stack.pop()[0]
+                if arg:
+                    stack.append(Number.null)
+                else:
+                    pos_start, pos_end = positions[ip - 1]
+                    stack.append(List(elements).set_context(context).set_pos(pos_start, pos_end))
+
+            elif op == SETUP_GUARD:
+                blocks.append((GUARD, len(stack), arg))
+
+            elif op == MAKE_FUNCTION:
+                body = consts[arg]
+                pos_start, pos_end = positions[ip - 1]
+                func_value = (
+                    Function(body.name, body.node, body.arg_names, body.should_auto_return)
+                    .set_context(context)
+                    .set_pos(pos_start, pos_end)
+                )
+                if body.name:
+                    context.symbol_table.set(body.name, func_value)
+                stack.append(func_value)
+
+            elif op == CONTINUE:
+                raise Continue()
+
+            elif op == BREAK:
+                raise Break()
+
+            elif op == INDEX:
+                value = stack.pop()
+                value_to_call = stack[-1]
+                try:
+                    stack[-1] = value_to_call.elements[value.value]
+                except Exception:
+                    pos_start, pos_end = positions[ip - 1]
+                    raise Failure(
+                        RTError(
+                            pos_start,
+                            pos_end,
+                            f"{value_to_call} अनुक्रमणिका मर्यादित नाही(Index out of bound) ",
+                            context,
+                        )
+                    )
+
+            elif op == INDEX_ASSIGN:
+                assgin_value = stack.pop()
+                value = stack.pop()
+                value_to_call = stack[-1]
+                try:
+                    value_to_call.elements[value.value] = assgin_value
+                except Exception:
+                    pos_start, pos_end = positions[ip - 1]
+                    raise Failure(
+                        RTError(
+                            pos_start,
+                            pos_end,
+                            f"{value_to_call} अनुक्रमणिका मर्यादित नाही(Index out of bound)",
+                            context,
+                        )
+                    )
+                stack[-1] = assgin_value
+
+            elif op == CALLEE_ERROR:
+                # an AttributeError, the callee has no var_name_token or it is None
+                consts[arg].var_name_token.value
+
+            else:
+                raise Exception(f"Unknown opcode {op}")
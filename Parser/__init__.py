@@ -1 +1,3 @@
-from Parser.parser import Parser
\ No newline at end of file
+from Parser.parser import Parser
+from Parser.incremental import IncrementalParser
+from Parser.ast_cache import ASTCache
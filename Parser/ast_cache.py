@@ -0,0 +1,112 @@
+import gc
+import hashlib
+import os
+import pickle
+import sys
+from contextlib import contextmanager
+from Lexer.position import Source
+
+
+# ------------AST CACHE----------------
+# Parsed scripts are kept in __bajicache__ next to the script, like Python's
+# __pycache__. An entry is the sha256 of the script followed by the pickled
+# AST, and is only used while that hash still matches the script. The script
+# is hashed in chunks and not kept, so a script that is not in the cache is
+# still lexed as it is read.
+
+CACHE_DIR = "__bajicache__"
+# bump whenever nodes, tokens or positions change shape
+CACHE_VERSION = 2
+CACHE_TAG = f"baji-v{CACHE_VERSION}-py{sys.version_info[0]}{sys.version_info[1]}"
+
+# the only classes an entry may contain
+CACHE_MODULES = ("Nodes.", "Lexer.token", "Lexer.position")
+
+# bytes of the script hashed at a time
+CHUNK_SIZE = 1 << 16
+
+
+@contextmanager
+def gc_paused():
+    # an AST is millions of small objects that all stay alive, collecting
+    # while they are built only costs time
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+class ASTUnpickler(pickle.Unpickler):
+    def __init__(self, file, source):
+        super().__init__(file)
+        self.source = source
+
+    def persistent_load(self, pid):
+        # every position points back at the script being run
+        return self.source
+
+    def find_class(self, module, name):
+        if not module.startswith(CACHE_MODULES):
+            raise pickle.UnpicklingError(f"{module}.{name} is not an AST class")
+        return super().find_class(module, name)
+
+
+class ASTPickler(pickle.Pickler):
+    def persistent_id(self, obj):
+        if isinstance(obj, Source):
+            return "source"
+        return None
+
+
+class ASTCache:
+    def __init__(self, fn, path):
+        self.path = path
+        # the text is only read whole if an error from the entry is shown
+        self.source = Source(fn, path=path)
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+                digest.update(chunk)
+        self.digest = digest.digest()
+
+        directory, name = os.path.split(path)
+        name = os.path.splitext(name)[0]
+        self.directory = os.path.join(directory, CACHE_DIR)
+        self.cache_path = os.path.join(self.directory, f"{name}.{CACHE_TAG}.ast")
+
+    def is_current(self):
+        # whether there is an entry for this script text, without loading it
+        try:
+            with open(self.cache_path, "rb") as f:
+                return f.read(len(self.digest)) == self.digest
+        except OSError:
+            return False
+
+    def load(self):
+        # the cached node, or None if there is no entry for this script text
+        try:
+            with open(self.cache_path, "rb") as f:
+                if f.read(len(self.digest)) != self.digest:
+                    return None
+                with gc_paused():
+                    return ASTUnpickler(f, self.source).load()
+        except (OSError, EOFError, RecursionError, pickle.UnpicklingError, AttributeError):
+            return None
+
+    def store(self, node):
+        # written to a temporary file first, so a reader never sees half an entry
+        temp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(temp_path, "wb") as f, gc_paused():
+                f.write(self.digest)
+                ASTPickler(f, pickle.HIGHEST_PROTOCOL).dump(node)
+            os.replace(temp_path, self.cache_path)
+        except (OSError, RecursionError, pickle.PicklingError):
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
@@ -0,0 +1,232 @@
+from bisect import bisect_right
+from itertools import chain
+from Errors import InvalidSyntaxError
+from Lexer import Lexer, TokenStream
+from Lexer.position import Source
+from Parser.parser import Parser
+from Constants import *
+from Results import ParseResult
+from Nodes import ListNode
+
+
+# ------------INCREMENTAL PARSER----------------
+# Keeps an edited buffer parsed. The buffer is split into segments, runs of
+# top-level statements that begin on a fresh line. An edit re-lexes and
+# re-parses from the segment it lands in until the new segments line up with
+# an old boundary past the edit again, everything after that is reused as is.
+
+
+class SegmentSource(Source):
+    # token offsets stay as they were lexed, so a segment that moves with an
+    # edit keeps its tokens and nodes untouched and only its base changes
+    def __init__(self, document, segment):
+        super().__init__(document.fn)
+        self.document = document
+        self.segment = segment
+
+    @property
+    def base(self):
+        return self.document.segment_start(self.segment) - self.segment.origin
+
+    @property
+    def text(self):
+        return self.document.text
+
+    def line_col(self, idx):
+        return self.document.source.line_col(self.base + idx)
+
+
+class Segment:
+    def __init__(self, document, origin):
+        # where the segment started when it was lexed
+        self.origin = origin
+        self.length = 0
+        self.source = SegmentSource(document, self)
+        self.statements = []
+        self.pos_start = None
+        self.pos_end = None
+        self.lex_error = None
+        # error of the failed statement, and the one reported when it is
+        # not the first statement of the buffer (see Parser.statements)
+        self.error = None
+        self.generic_error = None
+        self.first_failed = False
+        self.empty_error = None
+        self.final = False
+
+    @property
+    def failed(self):
+        return bool(self.error or self.lex_error)
+
+
+class IncrementalParser:
+    def __init__(self, fn, text):
+        self.fn = fn
+        self.text = text
+        self.source = Source(fn, text)
+        self.segments = []
+        self.starts = []
+        # statements of all segments in order, and how many each one holds
+        self.statements = []
+        self.counts = []
+        self.failures = 0
+        self.replace(0, *self.parse_segments(0))
+
+    def parse(self):
+        res = ParseResult()
+        if self.failures:
+            error = self.first_error()
+            if error:
+                return res.failure(error)
+
+        statements = list(self.statements)
+        if not statements:
+            # an empty buffer fails on its first statement
+            return res.failure(self.segments[-1].empty_error)
+        return res.success(
+            ListNode(statements, self.segments[0].pos_start, self.segments[-1].pos_end)
+        )
+
+    def first_error(self):
+        error = None
+        has_statements = False
+
+        for segment in self.segments:
+            # a lexer error anywhere in the buffer is reported first
+            if segment.lex_error:
+                return segment.lex_error
+            if not error and segment.error:
+                if segment.first_failed and not has_statements:
+                    error = segment.error
+                else:
+                    error = segment.generic_error
+            has_statements = has_statements or bool(segment.statements)
+
+        return error
+
+    def edit(self, start, end, text):
+        # replace self.text[start:end] with text and parse the result
+        self.text = self.text[:start] + text + self.text[end:]
+        self.source = Source(self.fn, self.text)
+        delta = len(text) - (end - start)
+
+        first = max(bisect_right(self.starts, start) - 1, 0)
+        segments, starts, last = self.parse_segments(self.starts[first], first + 1, end, delta)
+        if delta:
+            starts += [start + delta for start in self.starts[last:]]
+        else:
+            starts += self.starts[last:]
+        self.replace(first, segments, starts, last)
+        return self.parse()
+
+    def replace(self, first, segments, starts, last):
+        self.failures -= sum(segment.failed for segment in self.segments[first:last])
+        self.failures += sum(segment.failed for segment in segments)
+        self.segments[first:last] = segments
+        self.starts[first:] = starts
+
+        idx = sum(self.counts[:first])
+        self.statements[idx : idx + sum(self.counts[first:last])] = chain.from_iterable(
+            segment.statements for segment in segments
+        )
+        self.counts[first:last] = [len(segment.statements) for segment in segments]
+
+    def segment_start(self, segment):
+        # only needed to report a position, so it is looked up, not kept
+        try:
+            return self.starts[self.segments.index(segment)]
+        except ValueError:
+            # dropped by a later edit
+            return segment.origin
+
+    def parse_segments(self, start, old_idx=0, old_end=0, delta=0):
+        segments, starts = [], []
+
+        while True:
+            segment = self.parse_segment(start)
+            segments.append(segment)
+            starts.append(start)
+            if segment.final:
+                return segments, starts, len(self.segments)
+            start += segment.length
+
+            # the text after an old boundary past the edit is unchanged,
+            # so everything parsed from there on can be kept
+            while old_idx < len(self.starts) and self.starts[old_idx] + delta < start:
+                old_idx += 1
+            if (
+                old_idx < len(self.starts)
+                and self.starts[old_idx] + delta == start
+                and self.starts[old_idx] >= old_end
+            ):
+                return segments, starts, old_idx
+
+    def parse_segment(self, start):
+        segment = Segment(self, start)
+        stream = TokenStream.from_lexer(Lexer(self.fn, self.text, segment.source, start))
+        parser = Parser(stream)
+        segment.pos_start = parser.current_token.pos_start
+
+        while parser.current_type == TT_NEWLINE:
+            parser.advance()
+
+        while parser.current_type != TT_EOF:
+            stream.release(parser.token_idx)
+            start = parser.token_idx
+            res = parser.statement()
+            if res.error:
+                segment.error = res.error
+                segment.first_failed = not segment.statements
+                parser.restore(start)
+                segment.generic_error = self.generic_error(parser)
+                return self.recover(segment, stream)
+            segment.statements.append(res.node)
+
+            if parser.current_type == TT_EOF:
+                break
+            if parser.current_type != TT_NEWLINE:
+                segment.error = segment.generic_error = self.generic_error(parser)
+                return self.recover(segment, stream)
+
+            while parser.current_type == TT_NEWLINE:
+                token = parser.current_token
+                # nothing past a line break the parser has not looked beyond
+                # can change this segment
+                if self.text[token.start] == "\n" and parser.token_idx == stream.end - 1:
+                    segment.length = token.end - segment.origin
+                    return segment
+                parser.advance()
+
+        if not segment.statements:
+            # only reported if the whole buffer turns out to be empty
+            segment.empty_error = parser.statement().error
+        segment.pos_end = parser.current_token.pos_end
+        return self.finish(segment, stream)
+
+    def generic_error(self, parser):
+        return InvalidSyntaxError(
+            parser.current_token.pos_start,
+            parser.current_token.pos_end,
+            "अपेक्षित(Expected) '+','-', '*' or  '/'",
+        )
+
+    def recover(self, segment, stream):
+        # keep lexing to the next line break so the lexer error, if any, is
+        # the one the whole buffer would give
+        idx = stream.end - 1
+        while stream.type_at(idx) != TT_EOF:
+            if stream.type_at(idx) == TT_NEWLINE:
+                token = stream.get(idx)
+                if self.text[token.start] == "\n":
+                    segment.length = token.end - segment.origin
+                    return segment
+            idx += 1
+        segment.pos_end = stream.get(idx).pos_end
+        return self.finish(segment, stream)
+
+    def finish(self, segment, stream):
+        # the lexer stops at its first error, so nothing after it is parsed
+        segment.lex_error = stream.error
+        segment.length = len(self.text) - segment.origin
+        segment.final = True
+        return segment
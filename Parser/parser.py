@@ -1,42 +1,111 @@
 from Errors import InvalidSyntaxError
+from Lexer.token_stream import TokenStream
 from Constants import *
 from Results import ParseResult
 from Nodes import *
 
 
+# Tokens that can start an expression or a statement. The parser commits to
+# a branch by looking at the current token only (see grammar.md).
+EXPR_START_TYPES = frozenset(
+    (TT_INT, TT_FLOAT, TT_STRING, TT_IDENTIFIER, TT_PLUS, TT_MINUS, TT_LPAREN, TT_LSQUARE)
+)
+EXPR_START_KEYWORDS = frozenset((KW_VAR, KW_NOT, KW_IF, KW_FOR, KW_WHILE, KW_FUN))
+STATEMENT_START_KEYWORDS = EXPR_START_KEYWORDS | {KW_RETURN, KW_CONTINUE, KW_BREAK}
+
+# Operator precedence, loosest first. An operator is taken while its
+# precedence is at least the one being parsed, and its right operand is
+# parsed at the precedence given next to it (see grammar.md).
+(
+    PREC_LOGIC,
+    PREC_COMP,
+    PREC_ARITH,
+    PREC_TERM,
+    PREC_FACTOR,
+    PREC_MOD,
+    PREC_POWER,
+) = range(1, 8)
+
+BINARY_OPS = {
+    TT_EE: (PREC_COMP, PREC_ARITH),
+    TT_NE: (PREC_COMP, PREC_ARITH),
+    TT_LT: (PREC_COMP, PREC_ARITH),
+    TT_GT: (PREC_COMP, PREC_ARITH),
+    TT_LTE: (PREC_COMP, PREC_ARITH),
+    TT_GTE: (PREC_COMP, PREC_ARITH),
+    TT_PLUS: (PREC_ARITH, PREC_TERM),
+    TT_MINUS: (PREC_ARITH, PREC_TERM),
+    TT_MUL: (PREC_TERM, PREC_FACTOR),
+    TT_DIV: (PREC_TERM, PREC_FACTOR),
+    # the right operand takes a sign and binds '%' and '**' again,
+    # so both are right associative
+    TT_MOD: (PREC_MOD, PREC_FACTOR),
+    TT_POWER: (PREC_POWER, PREC_MOD),
+}
+BINARY_KEYWORDS = {
+    KW_AND: (PREC_LOGIC, PREC_COMP),
+    KW_OR: (PREC_LOGIC, PREC_COMP),
+}
+
+
 # ------------PARSER----------------
 
 
 class Parser:
     def __init__(self, tokens):
+        if not isinstance(tokens, TokenStream):
+            tokens = TokenStream(tokens)
         self.tokens = tokens
         self.token_idx = -1
+        self.current_idx = -1
+        self.current_type = None
         self.advance()
 
     def advance(self):
         self.token_idx += 1
         self.update_current_token()
-        return self.current_token
 
-    def reverse(self, amount=1):
-        self.token_idx -= amount
+    def restore(self, token_idx):
+        # back to a statement that turned out not to parse
+        self.token_idx = token_idx
         self.update_current_token()
-        return self.current_token
 
     def update_current_token(self):
-        if self.token_idx >= 0 and self.token_idx < len(self.tokens):
-            self.current_token = self.tokens[self.token_idx]
+        if self.token_idx >= 0:
+            token_type = self.tokens.type_at(self.token_idx)
+            if token_type is not None:
+                self.current_idx = self.token_idx
+                self.current_type = token_type
+
+    @property
+    def current_token(self):
+        # only built when a node or an error needs the whole token
+        return self.tokens.get(self.current_idx)
+
+    @property
+    def current_keyword(self):
+        if self.current_type != TT_KEYWORD:
+            return 0
+        return self.tokens.keyword_at(self.current_idx)
+
+    def starts_expr(self):
+        return self.current_type in EXPR_START_TYPES or (
+            self.current_type == TT_KEYWORD and self.current_keyword in EXPR_START_KEYWORDS
+        )
+
+    def starts_statement(self):
+        return self.current_type in EXPR_START_TYPES or (
+            self.current_type == TT_KEYWORD and self.current_keyword in STATEMENT_START_KEYWORDS
+        )
 
     def peak(self):
-        idx = self.token_idx + 1
-        if idx < len(self.tokens):
-            return self.tokens[idx]
+        return self.tokens.get(self.token_idx + 1)
 
     # -------------------#
 
     def parse(self):
-        res = self.statements()
-        if not res.error and self.current_token.type != TT_EOF:
+        res = self.statements(top_level=True)
+        if not res.error and self.current_type != TT_EOF:
             return res.failure(
                 InvalidSyntaxError(
                     self.current_token.pos_start,
@@ -46,13 +115,12 @@ class Parser:
             )
         return res
 
-    def statements(self):
+    def statements(self, top_level=False):
         res = ParseResult()
         statements = []
-        pos_start = self.current_token.pos_start.copy()
+        pos_start = self.current_token.pos_start
 
-        while self.current_token.type == TT_NEWLINE:
-            res.register_advancement()
+        while self.current_type == TT_NEWLINE:
             self.advance()
 
         statement = res.register(self.statement())
@@ -60,62 +128,66 @@ class Parser:
             return res
         statements.append(statement)
 
-        more_statements = True
+        more_statements = self.current_type == TT_NEWLINE
 
-        while True:
-            newline_count = -1
-            while self.current_token.type == TT_NEWLINE:
-                res.register_advancement()
+        while more_statements:
+            while self.current_type == TT_NEWLINE:
                 self.advance()
-                newline_count += 1
-            if newline_count == -1:
-                more_statements = False
 
-            if not more_statements:
+            if not self.starts_statement():
                 break
-            statement = res.try_register(self.statement())
-            if not statement:
-                self.reverse(res.to_reverse_count)
-                more_statements = False
-                continue
-            statements.append(statement)
+            if top_level:
+                # a failed statement only rewinds to its own start
+                self.tokens.release(self.token_idx)
+            start = self.token_idx
+            statement = self.statement()
+            if statement.error:
+                # the statements end before one that does not parse
+                self.restore(start)
+                break
+            statements.append(statement.node)
+            more_statements = self.current_type == TT_NEWLINE
 
         return res.success(
-            ListNode(statements, pos_start, self.current_token.pos_end.copy())
+            ListNode(statements, pos_start, self.current_token.pos_end)
         )
 
     def statement(self):
         res = ParseResult()
-        pos_start = self.current_token.pos_start.copy()
+        pos_start = self.current_token.pos_start
 
-        if self.current_token.matches(TT_KEYWORD, ("RETURN", "परत")):
-            res.register_advancement()
+        if self.current_keyword == KW_RETURN:
             self.advance()
 
-            expr = res.try_register(self.expr())
-            if not expr:
-                self.reverse(res.to_reverse_count)
+            expr = None
+            if self.starts_expr():
+                start = self.token_idx
+                expr = self.expr()
+                if expr.error:
+                    self.restore(start)
+                expr = expr.node
             return res.success(
-                ReturnNode(expr, pos_start, self.current_token.pos_start.copy())
+                ReturnNode(expr, pos_start, self.current_token.pos_start)
             )
 
-        if self.current_token.matches(TT_KEYWORD, ("CONTINUE", "सुरू")):
-            res.register_advancement()
+        if self.current_keyword == KW_CONTINUE:
             self.advance()
             return res.success(
-                ContinueNode(pos_start, self.current_token.pos_start.copy())
+                ContinueNode(pos_start, self.current_token.pos_start)
             )
 
-        if self.current_token.matches(TT_KEYWORD, ("BREAK", "थांबवा")):
-            res.register_advancement()
+        if self.current_keyword == KW_BREAK:
             self.advance()
             return res.success(
-                BreakNode(pos_start, self.current_token.pos_start.copy())
+                BreakNode(pos_start, self.current_token.pos_start)
             )
 
+        start = self.token_idx
         expr = res.register(self.expr())
         if res.error:
-            return res.failure(
+            if self.token_idx != start:
+                return res
+            return ParseResult().failure(
                 InvalidSyntaxError(
                     self.current_token.pos_start,
                     self.current_token.pos_end,
@@ -126,10 +198,9 @@ class Parser:
 
     def expr(self):
         res = ParseResult()
-        if self.current_token.matches(TT_KEYWORD, ("VAR", "चल")):
-            res.register_advancement()
+        if self.current_keyword == KW_VAR:
             self.advance()
-            if self.current_token.type != "IDENTIFIER":
+            if self.current_type != TT_IDENTIFIER:
                 return res.failure(
                     InvalidSyntaxError(
                         self.current_token.pos_start,
@@ -138,10 +209,9 @@ class Parser:
                     )
                 )
             var_name = self.current_token
-            res.register_advancement()
             self.advance()
 
-            if self.current_token.type != TT_EQ:
+            if self.current_type != TT_EQ:
                 return res.failure(
                     InvalidSyntaxError(
                         self.current_token.pos_start,
@@ -149,36 +219,29 @@ class Parser:
                         "अपेक्षित = (Expected =)",
                     )
                 )
-            res.register_advancement()
             self.advance()
             expr = res.register(self.expr())
             if res.error:
                 return res
             return res.success(VarAssignNode(var_name, expr, True))
 
-        if self.current_token.type == "IDENTIFIER":
+        if self.current_type == TT_IDENTIFIER:
             var_name = self.current_token
-            next_token = self.peak()
-            if next_token != None and next_token.type == TT_EQ:
-                res.register_advancement()
+            if self.tokens.type_at(self.token_idx + 1) == TT_EQ:
                 self.advance()
-                res.register_advancement()
                 self.advance()
                 expr = res.register(self.expr())
                 if res.error:
                     return res
                 return res.success(VarAssignNode(var_name, expr, False))
 
-        pass_keywords = (
-            (TT_KEYWORD, "AND"),
-            (TT_KEYWORD, "आणि"),
-            (TT_KEYWORD, "OR"),
-            (TT_KEYWORD, "किंवा"),
-        )
-        node = res.register(self.bin_op(self.comp_expr, pass_keywords))
+        start = self.token_idx
+        node = res.register(self.binary_expr(PREC_LOGIC))
 
         if res.error:
-            return res.failure(
+            if self.token_idx != start:
+                return res
+            return ParseResult().failure(
                 InvalidSyntaxError(
                     self.current_token.pos_start,
                     self.current_token.pos_end,
@@ -187,59 +250,51 @@ class Parser:
             )
         return res.success(node)
 
-    def comp_expr(self):
+    def binary_expr(self, precedence):
         res = ParseResult()
+        start = self.token_idx
 
-        if self.current_token.matches(TT_KEYWORD, ("NOT", "नाही")):
+        if precedence <= PREC_COMP and self.current_keyword == KW_NOT:
             op_token = self.current_token
-            res.register_advancement()
             self.advance()
-
-            node = res.register(self.comp_expr())
+            node = res.register(self.binary_expr(PREC_COMP))
             if res.error:
                 return res
-            return res.success(UnaryOpNode(op_token, node))
-
-        node = res.register(
-            self.bin_op(self.arith_expr, (TT_EE, TT_NE, TT_LT, TT_GT, TT_LTE, TT_GTE))
-        )
-
-        if res.error:
-            return res.failure(
-                InvalidSyntaxError(
-                    self.current_token.pos_start,
-                    self.current_token.pos_end,
-                    "अपेक्षित(Expected),  'संख्या', 'शब्द', '+', '-', '(','['",
+            left = UnaryOpNode(op_token, node)
+        elif precedence <= PREC_FACTOR and self.current_type in (TT_PLUS, TT_MINUS):
+            op_token = self.current_token
+            self.advance()
+            node = res.register(self.binary_expr(PREC_FACTOR))
+            if res.error:
+                return res
+            left = UnaryOpNode(op_token, node)
+        else:
+            left = res.register(self.call())
+            if res.error:
+                if precedence > PREC_COMP or self.token_idx != start:
+                    return res
+                return ParseResult().failure(
+                    InvalidSyntaxError(
+                        self.current_token.pos_start,
+                        self.current_token.pos_end,
+                        "अपेक्षित(Expected),  'संख्या', 'शब्द', '+', '-', '(','['",
+                    )
                 )
-            )
-
-        return res.success(node)
-
-    def arith_expr(self):
-        return self.bin_op(self.term, (TT_PLUS, TT_MINUS))
 
-    def term(self):
-        return self.bin_op(self.factor, (TT_MUL, TT_DIV))
+        while True:
+            if self.current_type == TT_KEYWORD:
+                op = BINARY_KEYWORDS.get(self.current_keyword)
+            else:
+                op = BINARY_OPS.get(self.current_type)
+            if op is None or op[0] < precedence:
+                return res.success(left)
 
-    def factor(self):
-        res = ParseResult()
-        token = self.current_token
-        if token.type in (TT_PLUS, TT_MINUS):
-            res.register_advancement()
+            op_token = self.current_token
             self.advance()
-            factor = res.register(self.factor())
+            right = res.register(self.binary_expr(op[1]))
             if res.error:
                 return res
-            return res.success(UnaryOpNode(token, factor))
-
-        return self.mod()
-    
-    def mod(self):
-        return self.bin_op(self.power, (TT_MOD,), self.factor)
-
-    def power(self):
-        return self.bin_op(self.call, (TT_POWER,), self.mod)
-    
+            left = BinOpNode(left, op_token, right)
 
     def call(self):
         res = ParseResult()
@@ -247,13 +302,11 @@ class Parser:
         if res.error:
             return res
 
-        if self.current_token.type == TT_LPAREN:
-            res.register_advancement()
+        if self.current_type == TT_LPAREN:
             self.advance()
             arg_nodes = []
 
-            if self.current_token.type == TT_RPAREN:
-                res.register_advancement()
+            if self.current_type == TT_RPAREN:
                 self.advance()
             else:
                 arg_nodes.append(res.register(self.expr()))
@@ -266,15 +319,14 @@ class Parser:
                         )
                     )
 
-                while self.current_token.type == TT_COMMA:
-                    res.register_advancement()
+                while self.current_type == TT_COMMA:
                     self.advance()
 
                     arg_nodes.append(res.register(self.expr()))
                     if res.error:
                         return res
 
-                if self.current_token.type != TT_RPAREN:
+                if self.current_type != TT_RPAREN:
                     return res.failure(
                         InvalidSyntaxError(
                             self.current_token.pos_start,
@@ -283,15 +335,13 @@ class Parser:
                         )
                     )
 
-                res.register_advancement()
                 self.advance()
             return res.success(CallNode(atom, arg_nodes))
 
-        while self.current_token.type == TT_LSQUARE:
-            res.register_advancement()
+        while self.current_type == TT_LSQUARE:
             self.advance()
             expr = res.register(self.expr())
-            if self.current_token.type != TT_RSQUARE:
+            if self.current_type != TT_RSQUARE:
                 return res.failure(
                         InvalidSyntaxError(
                             self.current_token.pos_start,
@@ -299,11 +349,9 @@ class Parser:
                             f"अपेक्षित(Expected) ']'",
                         )
                     )
-            res.register_advancement()
             self.advance()
 
-            if self.current_token.type == TT_EQ:
-                res.register_advancement()
+            if self.current_type == TT_EQ:
                 self.advance()
                 assgin_expr = res.register(self.expr())
                 return res.success(IndexAssignNode(atom,expr,assgin_expr))
@@ -318,34 +366,32 @@ class Parser:
 
     def atom(self):
         res = ParseResult()
-        token = self.current_token
-        if self.current_token.type in (TT_INT, TT_FLOAT):
-            res.register_advancement()
+        if self.current_type in (TT_INT, TT_FLOAT):
+            token = self.current_token
             self.advance()
             return res.success(NumberNode(token))
 
-        if self.current_token.type in (TT_STRING):
-            res.register_advancement()
+        if self.current_type == TT_STRING:
+            token = self.current_token
             self.advance()
             return res.success(StringNode(token))
 
-        if self.current_token.type in (TT_IDENTIFIER):
-            res.register_advancement()
+        if self.current_type == TT_IDENTIFIER:
+            token = self.current_token
             self.advance()
             return res.success(VarAccessNode(token))
 
-        if token.type == TT_LSQUARE:
+        token = self.current_token
+        if self.current_type == TT_LSQUARE:
             list_expr = res.register(self.list_expr())
             if res.error:
                 return res
             return res.success(list_expr)
 
-        if token.type == TT_LPAREN:
-            res.register_advancement()
+        if self.current_type == TT_LPAREN:
             self.advance()
             expr = res.register(self.expr())
-            if self.current_token.type == TT_RPAREN:
-                res.register_advancement()
+            if self.current_type == TT_RPAREN:
                 self.advance()
                 return res.success(expr)
             else:
@@ -357,24 +403,24 @@ class Parser:
                     )
                 )
 
-        if token.matches(TT_KEYWORD, ("IF", "जर")):
+        if self.current_keyword == KW_IF:
             if_expr = res.register(self.if_expr())
             if res.error:
                 return res
             return res.success(if_expr)
-        if token.matches(TT_KEYWORD, ("FOR", "वारंवार")):
+        if self.current_keyword == KW_FOR:
             for_expr = res.register(self.for_expr())
             if res.error:
                 return res
             return res.success(for_expr)
 
-        if token.matches(TT_KEYWORD, ("WHILE", "जोपर्यंत")):
+        if self.current_keyword == KW_WHILE:
             while_expr = res.register(self.while_expr())
             if res.error:
                 return res
             return res.success(while_expr)
 
-        if token.matches(TT_KEYWORD, ("FUN", "कार्य")):
+        if self.current_keyword == KW_FUN:
             func_def = res.register(self.func_def())
             if res.error:
                 return res
@@ -391,9 +437,9 @@ class Parser:
     def list_expr(self):
         res = ParseResult()
         element_nodes = []
-        pos_start = self.current_token.pos_start.copy()
+        pos_start = self.current_token.pos_start
 
-        if self.current_token.type != TT_LSQUARE:
+        if self.current_type != TT_LSQUARE:
             return res.failure(
                 InvalidSyntaxError(
                     self.current_token.pos_start,
@@ -402,11 +448,9 @@ class Parser:
                 )
             )
 
-        res.register_advancement()
         self.advance()
 
-        if self.current_token.type == TT_RSQUARE:
-            res.register_advancement()
+        if self.current_type == TT_RSQUARE:
             self.advance()
         else:
             element_nodes.append(res.register(self.expr()))
@@ -419,15 +463,14 @@ class Parser:
                     )
                 )
 
-            while self.current_token.type == TT_COMMA:
-                res.register_advancement()
+            while self.current_type == TT_COMMA:
                 self.advance()
 
                 element_nodes.append(res.register(self.expr()))
                 if res.error:
                     return res
 
-            if self.current_token.type != TT_RSQUARE:
+            if self.current_type != TT_RSQUARE:
                 return res.failure(
                     InvalidSyntaxError(
                         self.current_token.pos_start,
@@ -436,34 +479,31 @@ class Parser:
                     )
                 )
 
-            res.register_advancement()
             self.advance()
 
         return res.success(
-            ListNode(element_nodes, pos_start, self.current_token.pos_end.copy())
+            ListNode(element_nodes, pos_start, self.current_token.pos_end)
         )
 
     def if_expr(self):
         res = ParseResult()
-        all_cases = res.register(self.if_expr_cases(("IF", "जर")))
+        all_cases = res.register(self.if_expr_cases(KW_IF))
         if res.error:
             return res
         cases, else_case = all_cases
         return res.success(IfNode(cases, else_case))
 
     def if_expr_b(self):
-        return self.if_expr_cases(("ELIF", "किंवाजर"))
+        return self.if_expr_cases(KW_ELIF)
 
     def if_expr_c(self):
         res = ParseResult()
         else_case = None
 
-        if self.current_token.matches(TT_KEYWORD, ("ELSE", "नाहीतर")):
-            res.register_advancement()
+        if self.current_keyword == KW_ELSE:
             self.advance()
 
-            if self.current_token.type == TT_NEWLINE:
-                res.register_advancement()
+            if self.current_type == TT_NEWLINE:
                 self.advance()
 
                 statements = res.register(self.statements())
@@ -471,8 +511,7 @@ class Parser:
                     return res
                 else_case = (statements, True)
 
-                if self.current_token.matches(TT_KEYWORD, ("END", "शेवट")):
-                    res.register_advancement()
+                if self.current_keyword == KW_END:
                     self.advance()
                 else:
                     return res.failure(
@@ -494,7 +533,7 @@ class Parser:
         res = ParseResult()
         cases, else_case = [], None
 
-        if self.current_token.matches(TT_KEYWORD, ("ELIF", "किंवाजर")):
+        if self.current_keyword == KW_ELIF:
             all_cases = res.register(self.if_expr_b())
             if res.error:
                 return res
@@ -511,23 +550,22 @@ class Parser:
         cases = []
         else_case = None
 
-        if not self.current_token.matches(TT_KEYWORD, case_keyword):
+        if self.current_keyword != case_keyword:
             return res.failure(
                 InvalidSyntaxError(
                     self.current_token.pos_start,
                     self.current_token.pos_end,
-                    f"अपेक्षित(Expected) '{case_keyword}'",
+                    f"अपेक्षित(Expected) '{KEYWORD_SPELLINGS[case_keyword]}'",
                 )
             )
 
-        res.register_advancement()
         self.advance()
 
         condition = res.register(self.expr())
         if res.error:
             return res
 
-        if not self.current_token.matches(TT_KEYWORD, ("THEN", "तर")):
+        if self.current_keyword != KW_THEN:
             return res.failure(
                 InvalidSyntaxError(
                     self.current_token.pos_start,
@@ -536,11 +574,9 @@ class Parser:
                 )
             )
 
-        res.register_advancement()
         self.advance()
 
-        if self.current_token.type == TT_NEWLINE:
-            res.register_advancement()
+        if self.current_type == TT_NEWLINE:
             self.advance()
 
             statements = res.register(self.statements())
@@ -548,8 +584,7 @@ class Parser:
                 return res
             cases.append((condition, statements, True))
 
-            if self.current_token.matches(TT_KEYWORD, ("END", "शेवट")):
-                res.register_advancement()
+            if self.current_keyword == KW_END:
                 self.advance()
             else:
                 all_cases = res.register(self.if_expr_b_or_c())
@@ -574,7 +609,7 @@ class Parser:
     def for_expr(self):
         res = ParseResult()
 
-        if not self.current_token.matches(TT_KEYWORD, ("FOR", "वारंवार")):
+        if self.current_keyword != KW_FOR:
             return res.failure(
                 InvalidSyntaxError(
                     self.current_token.pos_start,
@@ -583,10 +618,9 @@ class Parser:
                 )
             )
 
-        res.register_advancement()
         self.advance()
 
-        if self.current_token.type != TT_IDENTIFIER:
+        if self.current_type != TT_IDENTIFIER:
             return res.failure(
                 InvalidSyntaxError(
                     self.current_token.pos_start,
@@ -596,10 +630,9 @@ class Parser:
             )
 
         var_name = self.current_token
-        res.register_advancement()
         self.advance()
 
-        if self.current_token.type != TT_EQ:
+        if self.current_type != TT_EQ:
             return res.failure(
                 InvalidSyntaxError(
                     self.current_token.pos_start,
@@ -608,14 +641,13 @@ class Parser:
                 )
             )
 
-        res.register_advancement()
         self.advance()
 
         start_value = res.register(self.expr())
         if res.error:
             return res
 
-        if not self.current_token.matches(TT_KEYWORD, ("TO", "ते")):
+        if self.current_keyword != KW_TO:
             return res.failure(
                 InvalidSyntaxError(
                     self.current_token.pos_start,
@@ -624,15 +656,13 @@ class Parser:
                 )
             )
 
-        res.register_advancement()
         self.advance()
 
         end_value = res.register(self.expr())
         if res.error:
             return res
 
-        if self.current_token.matches(TT_KEYWORD, ("STEP", "पाऊल")):
-            res.register_advancement()
+        if self.current_keyword == KW_STEP:
             self.advance()
 
             step_value = res.register(self.expr())
@@ -641,7 +671,7 @@ class Parser:
         else:
             step_value = None
 
-        if not self.current_token.matches(TT_KEYWORD, ("THEN", "तर")):
+        if self.current_keyword != KW_THEN:
             return res.failure(
                 InvalidSyntaxError(
                     self.current_token.pos_start,
@@ -650,18 +680,16 @@ class Parser:
                 )
             )
 
-        res.register_advancement()
         self.advance()
 
-        if self.current_token.type == TT_NEWLINE:
-            res.register_advancement()
+        if self.current_type == TT_NEWLINE:
             self.advance()
 
             body = res.register(self.statements())
             if res.error:
                 return res
 
-            if not self.current_token.matches(TT_KEYWORD, ("END", "शेवट")):
+            if self.current_keyword != KW_END:
                 return res.failure(
                     InvalidSyntaxError(
                         self.current_token.pos_start,
@@ -670,7 +698,6 @@ class Parser:
                     )
                 )
 
-            res.register_advancement()
             self.advance()
 
             return res.success(
@@ -688,7 +715,7 @@ class Parser:
     def while_expr(self):
         res = ParseResult()
 
-        if not self.current_token.matches(TT_KEYWORD, ("WHILE", "जोपर्यंत")):
+        if self.current_keyword != KW_WHILE:
             return res.failure(
                 InvalidSyntaxError(
                     self.current_token.pos_start,
@@ -697,14 +724,13 @@ class Parser:
                 )
             )
 
-        res.register_advancement()
         self.advance()
 
         condition = res.register(self.expr())
         if res.error:
             return res
 
-        if not self.current_token.matches(TT_KEYWORD, ("THEN", "तर")):
+        if self.current_keyword != KW_THEN:
             return res.failure(
                 InvalidSyntaxError(
                     self.current_token.pos_start,
@@ -713,18 +739,16 @@ class Parser:
                 )
             )
 
-        res.register_advancement()
         self.advance()
 
-        if self.current_token.type == TT_NEWLINE:
-            res.register_advancement()
+        if self.current_type == TT_NEWLINE:
             self.advance()
 
             body = res.register(self.statements())
             if res.error:
                 return res
 
-            if not self.current_token.matches(TT_KEYWORD, ("END", "शेवट")):
+            if self.current_keyword != KW_END:
                 return res.failure(
                     InvalidSyntaxError(
                         self.current_token.pos_start,
@@ -733,7 +757,6 @@ class Parser:
                     )
                 )
 
-            res.register_advancement()
             self.advance()
 
             return res.success(WhileNode(condition, body, True))
@@ -747,7 +770,7 @@ class Parser:
     def func_def(self):
         res = ParseResult()
     
-        if not self.current_token.matches(TT_KEYWORD, ("FUN", "कार्य")):
+        if self.current_keyword != KW_FUN:
             return res.failure(
                 InvalidSyntaxError(
                     self.current_token.pos_start,
@@ -756,14 +779,12 @@ class Parser:
                 )
             )
 
-        res.register_advancement()
         self.advance()
 
-        if self.current_token.type == TT_IDENTIFIER:
+        if self.current_type == TT_IDENTIFIER:
             var_name_tok = self.current_token
-            res.register_advancement()
             self.advance()
-            if self.current_token.type != TT_LPAREN:
+            if self.current_type != TT_LPAREN:
                 return res.failure(
                     InvalidSyntaxError(
                         self.current_token.pos_start,
@@ -773,7 +794,7 @@ class Parser:
                 )
         else:
             var_name_tok = None
-            if self.current_token.type != TT_LPAREN:
+            if self.current_type != TT_LPAREN:
                 return res.failure(
                     InvalidSyntaxError(
                         self.current_token.pos_start,
@@ -782,20 +803,17 @@ class Parser:
                     )
                 )
 
-        res.register_advancement()
         self.advance()
         arg_name_toks = []
 
-        if self.current_token.type == TT_IDENTIFIER:
+        if self.current_type == TT_IDENTIFIER:
             arg_name_toks.append(self.current_token)
-            res.register_advancement()
             self.advance()
 
-            while self.current_token.type == TT_COMMA:
-                res.register_advancement()
+            while self.current_type == TT_COMMA:
                 self.advance()
 
-                if self.current_token.type != TT_IDENTIFIER:
+                if self.current_type != TT_IDENTIFIER:
                     return res.failure(
                         InvalidSyntaxError(
                             self.current_token.pos_start,
@@ -805,10 +823,9 @@ class Parser:
                     )
 
                 arg_name_toks.append(self.current_token)
-                res.register_advancement()
                 self.advance()
 
-            if self.current_token.type != TT_RPAREN:
+            if self.current_type != TT_RPAREN:
                 return res.failure(
                     InvalidSyntaxError(
                         self.current_token.pos_start,
@@ -817,7 +834,7 @@ class Parser:
                     )
                 )
         else:
-            if self.current_token.type != TT_RPAREN:
+            if self.current_type != TT_RPAREN:
                 return res.failure(
                     InvalidSyntaxError(
                         self.current_token.pos_start,
@@ -826,11 +843,9 @@ class Parser:
                     )
                 )
 
-        res.register_advancement()
         self.advance()
 
-        if self.current_token.type == TT_ARROW:
-            res.register_advancement()
+        if self.current_type == TT_ARROW:
             self.advance()
 
             body = res.register(self.expr())
@@ -839,7 +854,7 @@ class Parser:
 
             return res.success(FuncDefNode(var_name_tok, arg_name_toks, body, True))
 
-        if self.current_token.type != TT_NEWLINE:
+        if self.current_type != TT_NEWLINE:
             return res.failure(
                 InvalidSyntaxError(
                     self.current_token.pos_start,
@@ -848,14 +863,13 @@ class Parser:
                 )
             )
 
-        res.register_advancement()
         self.advance()
 
         body = res.register(self.statements())
         if res.error:
             return res
 
-        if not self.current_token.matches(TT_KEYWORD,("END", "शेवट")):
+        if self.current_keyword != KW_END:
             return res.failure(
                 InvalidSyntaxError(
                     self.current_token.pos_start,
@@ -864,30 +878,6 @@ class Parser:
                 )
             )
 
-        res.register_advancement()
         self.advance()
 
         return res.success(FuncDefNode(var_name_tok, arg_name_toks, body, False))
-
-    ################
-
-    def bin_op(self, func_a, ops, func_b=None):
-        if func_b == None:
-            func_b = func_a
-        res = ParseResult()
-        left = res.register(func_a())
-        if res.error:
-            return res
-
-        while (
-            self.current_token.type in ops
-            or (self.current_token.type, self.current_token.value) in ops
-        ):
-            op_token = self.current_token
-            res.register_advancement()
-            self.advance()
-            right = res.register(func_b())
-            if res.error:
-                return res
-            left = BinOpNode(left, op_token, right)
-        return res.success(left)
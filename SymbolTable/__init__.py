@@ -1,5 +1,6 @@
 from Values import *
 from SymbolTable.symbol_table import SymbolTable
+from SymbolTable.frame import Frame
 
 
 
@@ -0,0 +1,46 @@
+class Frame:
+    # The symbol table of one call of a function run by the closure engine.
+    # Every name the function can set has a slot, found by the Resolver before
+    # the body is compiled, so the table is a list of values by slot. None in a
+    # slot is a name not set yet, looked up in the parent as SymbolTable does.
+    # The names of the slots are local_names of the root from the start.
+    __slots__ = ("slots", "values", "parent", "root")
+
+    def __init__(self, slots, parent=None):
+        self.slots = slots
+        self.values = [None] * len(slots)
+        self.parent = parent
+        # as SymbolTable.root
+        self.root = parent.root if parent is not None else None
+        if self.root is not None:
+            self.root.local_names.update(slots)
+
+    @property
+    def symbols(self):
+        # the names that are set, as SymbolTable.symbols
+        return {
+            name: self.values[slot]
+            for name, slot in self.slots.items()
+            if self.values[slot] is not None
+        }
+
+    def get(self, name):
+        # from the root or in a loop, as SymbolTable.get
+        root = self.root
+        if root is not None and name not in root.local_names:
+            return root.symbols.get(name)
+        table = self
+        while type(table) is Frame:
+            slot = table.slots.get(name)
+            value = None if slot is None else table.values[slot]
+            if value == None and table.parent:
+                table = table.parent
+            else:
+                return value
+        return table.get(name)
+
+    def set(self, name, value):
+        self.values[self.slots[name]] = value
+
+    def remove(self, name):
+        self.values[self.slots[name]] = None
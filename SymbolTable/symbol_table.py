@@ -2,14 +2,34 @@ class SymbolTable:
     def __init__(self, parent=None):
         self.symbols = {}
         self.parent = parent
+        # the table at the root of the chain. It keeps local_names, every name
+        # a table with a parent has set since main.run_ast reset it, so a name
+        # that is not in it can only be in the root, see Interpreter.cached_callee
+        if parent is None:
+            self.root = self
+            self.local_names = set()
+        else:
+            self.root = parent.root
 
     def get(self, name):
-        value = self.symbols.get(name, None)
-        if value == None and self.parent:
-            return self.parent.get(name)
-        return value
+        # a name no table with a parent has set is read from the root at once,
+        # any other walks the parents in a loop, a chain of calls can be far
+        # longer than the host stack is deep
+        root = self.root
+        if name not in root.local_names:
+            return root.symbols.get(name)
+        table = self
+        while type(table) is SymbolTable:
+            value = table.symbols.get(name, None)
+            if value == None and table.parent:
+                table = table.parent
+            else:
+                return value
+        return table.get(name)
 
     def set(self, name, value):
+        if self.parent is not None:
+            self.root.local_names.add(name)
         self.symbols[name] = value
 
     def remove(self, name):
@@ -1,2 +1,19 @@
 from Tests.test_variables import *
-from Tests.tests_arithmetic import *
\ No newline at end of file
+from Tests.tests_arithmetic import *
+from Tests.test_lexer import *
+from Tests.test_incremental import *
+from Tests.test_ast_cache import *
+from Tests.test_parser import *
+from Tests.test_check import *
+from Tests.test_interpreter import *
+from Tests.test_closures import *
+from Tests.test_vm import *
+from Tests.test_transpiler import *
+from Tests.test_optimizer import *
+from Tests.test_resolver import *
+from Tests.test_allocations import *
+from Tests.test_raising import *
+from Tests.test_recursion import *
+from Tests.test_memo import *
+from Tests.test_usage import *
+from Tests.test_inline_cache import *
\ No newline at end of file
@@ -0,0 +1,65 @@
+import sys
+import unittest
+import main
+from Values.value import Value
+from Values import Number, String, List, BaseFunction, Function, BuiltInFunction
+
+
+LOOP = "चल s = 0\nFOR i = 0 TO 1000 THEN s = s + i * 2\ns"
+CALLS = "FUN add(a, b) -> a + b\nचल t = 0\nFOR i = 0 TO 1000 THEN t = add(t, i)\nt"
+
+
+def count_values(text, engine):
+    # Values created while running text, counted through the profiler as the
+    # calls of a Value __init__ that are not from another Value __init__
+    classes = (Value, Number, String, List, BaseFunction, Function, BuiltInFunction)
+    inits = {cls.__init__.__code__ for cls in classes}
+    count = 0
+
+    def profile(frame, event, arg):
+        nonlocal count
+        if event == "call" and frame.f_code in inits and frame.f_back.f_code not in inits:
+            count += 1
+
+    sys.setprofile(profile)
+    try:
+        main.run("<STDIN>", text, engine=engine)
+    finally:
+        sys.setprofile(None)
+    return count
+
+
+class TestAllocations(unittest.TestCase):
+    def test_loop_reads_do_not_copy(self):
+        # the loop variable, the 2 and the two results of each pass
+        self.assertLessEqual(count_values(LOOP, "closure"), 4 * 1000 + 20)
+        self.assertGreater(count_values(LOOP, "interpreter"), 5 * 1000)
+
+    def test_calls_do_not_copy(self):
+        # the loop variable, the two arguments and the sum of each call
+        self.assertLessEqual(count_values(CALLS, "closure"), 4 * 1000 + 20)
+        # the interpreter still copies, though a cached callee once a call
+        self.assertGreater(count_values(CALLS, "interpreter"), 7 * 1000)
+
+
+class TestValueSize(unittest.TestCase):
+    def test_values_have_no_dict(self):
+        for value in (Number(1), String("a"), List([]), Function("f", None, [], False)):
+            with self.subTest(type(value).__name__):
+                self.assertFalse(hasattr(value, "__dict__"))
+        self.assertLessEqual(sys.getsizeof(Number(1)), 64)
+
+    def test_shared_ints_stay_unpositioned(self):
+        self.assertIs(Number.shared(7), Number.shared(7))
+        self.assertIsNot(Number.shared(10**6), Number.shared(10**6))
+        for engine in ("interpreter", "raising", "vm", "python"):
+            with self.subTest(engine):
+                _, error = main.run("<STDIN>", "FOR i = 0 TO 3 THEN +i\nFOR i = 0 TO 3 THEN LEN([i])", engine=engine)
+                self.assertIsNone(error)
+                for i in range(4):
+                    self.assertIsNone(Number.shared(i).pos_start)
+                    self.assertIsNone(Number.shared(i).context)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+from unittest import mock
+import main
+from Parser import ASTCache
+
+
+class TestASTCache(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "script.baji")
+        self.write('चल क = 4\nदाखवा(क * 2)')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self, text):
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write(text)
+
+    def run_script(self, **options):
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            main.run_from_file(self.path, **options)
+        return out.getvalue()
+
+    def test_cached_run(self):
+        self.assertEqual(self.run_script(), "८")
+        self.assertIsNotNone(ASTCache("<script>", self.path).load())
+        self.assertEqual(self.run_script(), "८")
+
+    def test_changed_script(self):
+        self.run_script()
+        self.write('चल क = 5\nदाखवा(क * 2)\nक / 0')
+        self.assertIsNone(ASTCache("<script>", self.path).load())
+        self.assertIn("Division by zero", self.run_script())
+        self.assertIn("Division by zero", self.run_script())
+
+    def test_miss_streams_the_script(self):
+        fast = main.LEXERS["fast"]
+        with mock.patch.object(fast, "from_file", wraps=fast.from_file) as from_file:
+            self.assertEqual(self.run_script(lexer="fast"), "८")
+            self.assertEqual(from_file.call_count, 1)
+            # a hit neither lexes nor opens the script for it
+            self.assertEqual(self.run_script(lexer="fast"), "८")
+            self.assertEqual(from_file.call_count, 1)
+
+    def test_disabled(self):
+        self.assertEqual(self.run_script(cache=False), "८")
+        self.assertFalse(os.path.exists(os.path.join(self.directory.name, "__bajicache__")))
+
+
+if __name__ == "__main__":
+    unittest.main()
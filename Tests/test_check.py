@@ -0,0 +1,49 @@
+import os
+import tempfile
+import unittest
+import check
+from Parser import ASTCache
+
+
+class TestCheck(unittest.TestCase):
+    scripts = {
+        "good.baji": 'चल क = 4\nदाखवा(क * 2)',
+        "nested/syntax.baji": "चल क = (4",
+        "nested/illegal.baji": "चल क = 4 @",
+    }
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        for name, text in self.scripts.items():
+            path = os.path.join(self.directory.name, name)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(text)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def check(self, **options):
+        scripts = check.find_scripts(self.directory.name)
+        return {
+            os.path.relpath(path, self.directory.name).replace(os.sep, "/"): error
+            for path, error in check.check_scripts(scripts, **options)
+        }
+
+    def test_reports_every_error(self):
+        errors = self.check(jobs=2)
+        self.assertEqual(sorted(errors), sorted(self.scripts))
+        self.assertIsNone(errors["good.baji"])
+        self.assertIn("InvalidSyntax", errors["nested/syntax.baji"])
+        self.assertIn("'@'", errors["nested/illegal.baji"])
+
+    def test_precompile(self):
+        self.assertEqual(self.check(jobs=1, precompile=True), self.check(jobs=1))
+        path = os.path.join(self.directory.name, "good.baji")
+        self.assertIsNotNone(ASTCache("<good>", path).load())
+        # the cache directory is not searched for scripts
+        self.assertEqual(len(check.find_scripts(self.directory.name)), len(self.scripts))
+
+
+if __name__ == "__main__":
+    unittest.main()
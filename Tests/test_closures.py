@@ -0,0 +1,44 @@
+import unittest
+import main
+
+
+PROGRAMS = {
+    "fib": "FUN fib(n)\nIF n < 2 THEN\nRETURN n\nEND\nRETURN fib(n - 1) + fib(n - 2)\nEND\nfib(10)",
+    "loops": "चल a = 0\nFOR i = 0 TO 10 THEN\nIF i == 7 THEN BREAK\nIF i % 2 == 0 THEN CONTINUE\nचल a = a + i\nEND\na",
+    "while": "चल i = 0\nWHILE i < 5 THEN चल i = i + 1\ni",
+    "empty_return": "FUN f() -> 1\nFUN g()\nRETURN []\nEND\ng()",
+    "strings": 'चल s = "a" * 3\ns + "b"',
+    "list": "चल l = [1, 2, 3]\nl / 0",
+    "dynamic_scope": "FUN g() -> y\nFUN f(y)\nIF y > 1 THEN चल z = 1\nRETURN g()\nEND\nf(5)",
+    "shadowing": "चल x = 1\nFUN f(n)\nFOR i = 0 TO n THEN चल x = x + i\nRETURN x\nEND\n[f(3), x]",
+}
+
+ERRORS = {
+    "index": "चल l = [1]\nl / 5",
+    "undefined": "nope + 1",
+    "division": "FUN f(a) -> a / 0\nf(1)",
+    "arguments": "FUN f(a) -> a\nf(1, 2)",
+}
+
+
+class TestClosureEngine(unittest.TestCase):
+    def run_both(self, text):
+        return [main.run("<STDIN>", text, engine=engine) for engine in ("interpreter", "closure")]
+
+    def test_same_results(self):
+        for name, text in PROGRAMS.items():
+            with self.subTest(name):
+                (value, error), (closure_value, closure_error) = self.run_both(text)
+                self.assertIsNone(closure_error)
+                self.assertEqual(str(closure_value), str(value))
+
+    def test_same_errors(self):
+        for name, text in ERRORS.items():
+            with self.subTest(name):
+                (_, error), (_, closure_error) = self.run_both(text)
+                self.assertIsNotNone(closure_error)
+                self.assertEqual(closure_error.as_string(), error.as_string())
+
+
+if __name__ == "__main__":
+    unittest.main()
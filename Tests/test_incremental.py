@@ -0,0 +1,38 @@
+import unittest
+import main
+from Parser import IncrementalParser
+
+
+def error_string(result):
+    _, error = result
+    return error.as_string() if error else None
+
+
+class TestIncrementalParser(unittest.TestCase):
+    text = "चल क = 1\nFUN f(a)\n    परत a + क\nEND\nदाखवा_आणि_परत(f(2))\n"
+
+    def test_edit_reuses_segments(self):
+        parser = IncrementalParser("<STDIN>", self.text)
+        tail = parser.segments[-2]
+        parser.edit(7, 8, "41")
+        self.assertIs(parser.segments[-2], tail)
+
+        result, error = main.run_ast(parser.parse())
+        self.assertIsNone(error)
+        self.assertEqual(str(result), '[४१, <function f>, ४३]')
+
+    def test_errors_after_edits(self):
+        parser = IncrementalParser("<STDIN>", self.text)
+        text = self.text
+        for start, end, new in [(0, 0, "\n\n"), (12, 12, "@"), (12, 13, ""), (25, 25, " *"), (0, 2, "")]:
+            text = text[:start] + new + text[end:]
+            ast = parser.edit(start, end, new)
+            self.assertEqual(parser.text, text)
+            self.assertEqual(
+                error_string(main.run_ast(ast)),
+                error_string(main.run("<STDIN>", text)),
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+import unittest
+from unittest import mock
+import main
+from SymbolTable import SymbolTable, global_symbol_table
+
+ENGINES = ("interpreter", "raising")
+
+
+def run(text, engine):
+    value, error = main.run("<STDIN>", text, engine=engine)
+    if error:
+        raise AssertionError(error.as_string())
+    return str(value.elements[-1])
+
+
+def lookups(text, engine, name):
+    # how many times running text looks name up through SymbolTable.get
+    names = []
+    get = SymbolTable.get
+
+    def counted_get(table, name):
+        names.append(name)
+        return get(table, name)
+
+    with mock.patch.object(SymbolTable, "get", counted_get):
+        run(text, engine)
+    return names.count(name)
+
+
+class TestInlineCache(unittest.TestCase):
+    def test_repeated_calls_skip_lookup(self):
+        text = "FUN ic_add(a, b) -> a + b\nचल t = 0\nFOR i = 0 TO 100 THEN चल t = ic_add(t, i)\nt"
+        for engine in ENGINES:
+            with self.subTest(engine):
+                self.assertEqual(run(text, engine), "४९५०")
+                # the lookup of the first call and its VarAccessNode only
+                self.assertEqual(lookups(text, engine, "ic_add"), 2)
+
+    def test_local_names_of_earlier_runs(self):
+        text = "FUN ic_k() -> 1\nFOR i = 0 TO 10 THEN ic_k()"
+        for engine in ENGINES:
+            with self.subTest(engine):
+                run("FUN ic_set(ic_k) -> ic_k\nic_set(1)", engine)
+                self.assertEqual(lookups(text, engine, "ic_k"), 2)
+
+    def test_redefinition(self):
+        text = "FUN ic_g() -> 1\nचल r = []\nFOR i = 0 TO 3 THEN\nAPPEND(r, ic_g())\nFUN ic_g() -> i * 10\nEND\nr"
+        for engine in ENGINES:
+            with self.subTest(engine):
+                self.assertEqual(run(text, engine), "[१, १०, २०]")
+
+    def test_shadowing_by_argument(self):
+        # scopes are dynamic, so the ic_f of ic_call is the ic_f of its caller
+        text = (
+            "FUN ic_f() -> 1\nFUN ic_two() -> 2\nFUN ic_call() -> ic_f()\n"
+            "FUN ic_shadow(ic_f) -> ic_call()\n[ic_call(), ic_shadow(ic_two), ic_call()]"
+        )
+        for engine in ENGINES:
+            with self.subTest(engine):
+                self.assertEqual(run(text, engine), "[१, २, १]")
+
+    def test_loop_variables_are_local_names(self):
+        text = "FUN ic_loop(n)\nFOR ic_h = 0 TO n THEN ic_h\nEND\nic_loop(2)"
+        for engine in ENGINES:
+            with self.subTest(engine):
+                run(text, engine)
+                # FOR sets its variable without SymbolTable.set
+                self.assertIn("ic_h", global_symbol_table.local_names)
+
+    def test_builtins(self):
+        for engine in ENGINES:
+            with self.subTest(engine):
+                self.assertEqual(run("FOR i = 0 TO 3 THEN LEN([i, i])", engine), "[२, २, २]")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+import unittest
+import main
+from Context import Context
+from Interpreter import Interpreter
+from Nodes import Node, BinOpNode
+from SymbolTable import global_symbol_table
+
+
+class TestDispatch(unittest.TestCase):
+    def test_unknown_node(self):
+        class UnknownNode(Node):
+            __slots__ = ()
+
+        with self.assertRaisesRegex(Exception, "No visit_UnknownNode method defined"):
+            Interpreter().visit(UnknownNode(), None)
+
+    def test_function_runs_on_caller(self):
+        ast = main.parse(main.Lexer("<STDIN>", "FUN f(a) -> a + 1\nf(1)"))
+        context = Context("<program>")
+        context.symbol_table = global_symbol_table
+
+        interpreter = Interpreter()
+        result = interpreter.visit(ast.node, context)
+        self.assertEqual(str(result.value), "[<function f>, २]")
+        # only the body of f has a BinOpNode
+        self.assertIn(BinOpNode, interpreter.visitors)
+
+
+
+class TestFor(unittest.TestCase):
+    PROGRAMS = {
+        "ints": ("FOR i = 0 TO 4 THEN i", "[०, १, २, ३]"),
+        "step": ("FOR i = 10 TO 0 STEP -3 THEN i", "[१०, ७, ४, १]"),
+        "floats": ("FOR i = 0 TO 2 STEP 0.5 THEN i", "[०, ०.५, १.०, १.५]"),
+        "exits": (
+            "FOR i = 0 TO 9 THEN\nIF i == 1 THEN CONTINUE\nIF i == 3 THEN BREAK\ni\nEND\nFOR i = 0 TO 9 THEN IF i == 5 THEN BREAK ELSE i",
+            "[०, १, २, ३, ४]",
+        ),
+        "return": ("FUN f()\nFOR i = 3 TO 9 THEN\nRETURN i\nEND\nEND\nf()", "३"),
+        "empty_return": ("FUN f()\nFOR i = 0 TO 2 THEN\nRETURN []\nEND\nRETURN 7\nEND\nf()", "७"),
+        "variable": ("FOR i = 0 TO 3 THEN चल i = i * 10\ni", "२०"),
+    }
+
+    def test_same_in_both_tree_walkers(self):
+        for name, (text, expected) in self.PROGRAMS.items():
+            for engine in ("interpreter", "raising"):
+                with self.subTest(name, engine=engine):
+                    value, error = main.run("<STDIN>", text, engine=engine)
+                    self.assertIsNone(error)
+                    self.assertEqual(str(value.elements[-1]), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
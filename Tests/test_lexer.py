@@ -0,0 +1,75 @@
+import os
+import tempfile
+import unittest
+import main
+from Lexer import Lexer, FastLexer
+from Constants import KW_AND, KW_IF, KW_END
+
+
+def token_stream(lexer):
+    tokens, error = lexer.make_tokens()
+    if error:
+        return error.as_string()
+    return [
+        (
+            token.type,
+            token.value,
+            token.keyword,
+            token.pos_start.idx,
+            token.pos_start.ln,
+            token.pos_start.col,
+            token.pos_end.idx,
+            token.pos_end.ln,
+            token.pos_end.col,
+        )
+        for token in tokens
+    ]
+
+
+class TestFastLexer(unittest.TestCase):
+    texts = [
+        "चल क = १२.५ + 3 ** २\nदाखवा(क)",
+        "FUN add(a, b) -> a+b; add(1,2)",
+        'दाखवा("नमस्कार \\n विश्व\\t")\n"अपूर्ण',
+        "जर क<=2 तर\n\tपरत 1\nनाहीतर परत क!=2 शेवट",
+        "# टिप्पणी\nचल यादी = [1,2,3]\nयादी[0] = -1 >= 0",
+        "चल क = 5 ! 3",
+        "चल क = 5 @ 3",
+        "# टिप्पणी\n  क",
+    ]
+
+    def test_same_tokens(self):
+        for text in self.texts:
+            self.assertEqual(
+                token_stream(FastLexer("<STDIN>", text)),
+                token_stream(Lexer("<STDIN>", text)),
+            )
+
+    def test_stream_from_file(self):
+        text = 'चल क = "पहिली\nदुसरी"\nदाखवा(क)\n# टिप्पणी\nक = १२\n"अपूर्ण'
+        with tempfile.NamedTemporaryFile("w", encoding="utf-8", suffix=".baji", delete=False) as f:
+            f.write(text)
+        try:
+            self.assertEqual(
+                token_stream(FastLexer.from_file("<STDIN>", f.name)),
+                token_stream(Lexer("<STDIN>", text)),
+            )
+        finally:
+            os.remove(f.name)
+
+    def test_keyword_ids(self):
+        for lexer in (Lexer, FastLexer):
+            tokens, error = lexer("<STDIN>", "IF जर AND आणि शेवट END जरा").make_tokens()
+            self.assertEqual(
+                [token.keyword for token in tokens],
+                [KW_IF, KW_IF, KW_AND, KW_AND, KW_END, KW_END, 0, 0],
+            )
+            self.assertEqual(tokens[1].value, "जर")
+
+    def test_run_fast(self):
+        result, error = main.run("<STDIN>", "२२/७", lexer="fast")
+        self.assertEqual(str(result), "[३.१४२८५७१४२८५७१४३]")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+import unittest
+import main
+from Parser import Parser
+from Lexer import Lexer, TokenStream
+from Interpreter import Purity
+
+FIB = "FUN fib(n)\nIF n < 2 THEN RETURN n\nRETURN fib(n - 1) + fib(n - 2)\nEND\n"
+
+
+def pure_names(text):
+    node = Parser(TokenStream.from_lexer(Lexer("<STDIN>", text))).parse().node
+    pure_bodies = Purity().pure_functions(node)
+    return {
+        element.var_name_token.value
+        for element in node.element_nodes
+        if getattr(element, "body_node", None) in pure_bodies
+    }
+
+
+class TestPurity(unittest.TestCase):
+    def test_pure_functions(self):
+        text = FIB + "FUN sq(n) -> n * n\nFUN both(n) -> sq(n) + LEN([n])\nFUN area(r) -> MATH_PI * sq(r)"
+        self.assertEqual(pure_names(text), {"fib", "sq", "both", "area"})
+
+    def test_impure_functions(self):
+        programs = {
+            "print": "FUN f(n)\nPRINT(n)\nRETURN n\nEND",
+            "random": "FUN f(n) -> RAND_INT(0, n)",
+            "append": "FUN f(l) -> APPEND(l, 1)",
+            "index_assign": "चल l = [1]\nFUN f(n) -> l[0] = n",
+            "free_variable": "FUN f(n) -> y + n",
+            "impure_callee": "FUN g(n) -> PRINT(n)\nFUN f(n) -> g(n)",
+            "redefined_callee": "FUN g(n) -> n\nFUN f(n) -> g(n)\nचल g = 1",
+            "shadowed_builtin": "FUN LEN(x)\nPRINT(x)\nRETURN 1\nEND\nFUN f(n) -> LEN(n)",
+            "break": "FUN f(n)\nBREAK\nEND",
+        }
+        for name, text in programs.items():
+            with self.subTest(name):
+                self.assertNotIn("f", pure_names(text))
+
+    def test_globals_are_not_constants(self):
+        main.run("<STDIN>", "चल memo_global = 1")
+        self.assertEqual(pure_names("FUN f(x) -> x + memo_global\nFUN g(x) -> x + MATH_PI"), {"g"})
+
+    def test_variables_set_on_some_ways_only(self):
+        programs = {
+            "if": "FUN f(x)\nIF x == 1 THEN चल y = 5\nRETURN y\nEND",
+            "elif": "FUN f(x)\nIF x == 1 THEN चल y = 5 ELIF x == 2 THEN x ELSE चल y = 6\nRETURN y\nEND",
+            "for": "FUN f(x)\nFOR i = 0 TO x THEN चल y = i\nRETURN y\nEND",
+            "while": "FUN f(x)\nWHILE x > 0 THEN चल y = x\nRETURN y\nEND",
+            "before_set": "FUN f(x)\nचल z = y\nचल y = x\nRETURN y\nEND",
+        }
+        for name, text in programs.items():
+            with self.subTest(name):
+                self.assertNotIn("f", pure_names(text))
+
+        every_way = "FUN f(x)\nIF x == 1 THEN चल y = 5 ELSE चल y = 6\nRETURN y\nEND"
+        self.assertEqual(pure_names(every_way), {"f"})
+
+    def test_loop_exits_inside_loops_are_pure(self):
+        text = "FUN f(n)\nचल a = 0\nFOR i = 0 TO n THEN\nIF i == 3 THEN BREAK\nचल a = a + i\nEND\nRETURN a\nEND"
+        self.assertEqual(pure_names(text), {"f"})
+
+
+class TestMemo(unittest.TestCase):
+    def run_memo(self, text, memo=100, engine="interpreter"):
+        value, error = main.run("<STDIN>", text, engine=engine, memo=memo)
+        self.assertIsNone(error)
+        return str(value.elements[-1])
+
+    def test_same_results_and_stats(self):
+        for engine in ("interpreter", "raising"):
+            with self.subTest(engine):
+                text = FIB + "[fib(15), MEMO_STATS(fib)]"
+                self.assertEqual(self.run_memo(text, engine=engine), "[६१०, [१३, १६, १६]]")
+
+    def test_lru_size(self):
+        self.assertEqual(self.run_memo(FIB + "fib(15)\nस्मृती_आकडे(fib)", memo=3), "[१३, १६, ३]")
+
+    def test_off_by_default(self):
+        self.assertEqual(self.run_memo(FIB + "fib(5)\nMEMO_STATS(fib)", memo=0), "[०, ०, ०]")
+
+    def test_lists_are_not_kept(self):
+        text = "FUN l(n) -> [n]\nचल a = l(1)\nAPPEND(a, 2)\n[l(1), MEMO_STATS(l)]"
+        self.assertEqual(self.run_memo(text), "[[१], [०, २, ०]]")
+
+    def test_variable_of_the_caller(self):
+        text = (
+            "FUN f(x)\nIF x == 1 THEN चल y = 5\nRETURN y\nEND\n"
+            "FUN g(y) -> f(0)\n[g(1), g(2)]"
+        )
+        for engine in ("interpreter", "raising"):
+            with self.subTest(engine):
+                self.assertEqual(self.run_memo(text, memo=8, engine=engine), "[१, २]")
+
+    def test_shadowed_builtin_is_called(self):
+        text = 'FUN LEN(x)\nPRINT("")\nRETURN 1\nEND\nFUN f(n) -> LEN(n)\nf(1)\nf(1)\nMEMO_STATS(f)'
+        self.assertEqual(self.run_memo(text, memo=10), "[०, ०, ०]")
+
+    def test_function_of_an_earlier_run(self):
+        self.run_memo("FUN memo_g() -> 1\nFUN memo_h(n) -> memo_g()\nmemo_h(1)", memo=10)
+        # memo_h keeps the MemoCache of the first run, which this one does not use
+        self.assertEqual(self.run_memo("FUN memo_g() -> 2\nmemo_h(1)", memo=0), "२")
+        self.assertEqual(self.run_memo("FUN memo_g() -> 3\nmemo_h(1)", memo=10), "३")
+
+    def test_global_set_by_a_later_input(self):
+        # as the shell runs each line
+        for line in ("चल memo_g = 1", "FUN memo_f(x) -> x + memo_g", "memo_f(1)", "memo_g = 100"):
+            self.run_memo(line, memo=8)
+        self.assertEqual(self.run_memo("memo_f(1)", memo=8), "१०१")
+
+    def test_tail_calls_are_kept(self):
+        text = "FUN t(n, a) -> IF n == 0 THEN a ELSE t(n - 1, a + 1)\n[t(5, 0), t(3, 2), MEMO_STATS(t)]"
+        self.assertEqual(self.run_memo(text), "[५, ५, [१, ६, ६]]")
+
+
+if __name__ == "__main__":
+    unittest.main()
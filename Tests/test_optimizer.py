@@ -0,0 +1,54 @@
+import unittest
+import main
+from Lexer import Lexer
+from Interpreter import Optimizer
+from Nodes import NumberNode, ListNode, IfNode, UnaryOpNode, VarAccessNode
+
+
+class TestOptimizer(unittest.TestCase):
+    def optimize(self, text):
+        ast = main.parse(Lexer("<STDIN>", text))
+        self.assertIsNone(ast.error)
+        return ast.node, Optimizer().optimize(ast.node)
+
+    def test_folds_constants(self):
+        _, node = self.optimize("(1 + 2) * 3 == 9")
+        folded = node.element_nodes[0]
+        self.assertIsInstance(folded, NumberNode)
+        self.assertEqual(folded.token.value, 1)
+
+    def test_keeps_parsed_tree(self):
+        parsed, node = self.optimize("1 + 2")
+        self.assertIsNot(node, parsed)
+        self.assertEqual(type(parsed.element_nodes[0]).__name__, "BinOpNode")
+
+    def test_drops_dead_branches(self):
+        _, node = self.optimize("IF 5 == 5 THEN x ELSE y\nIF 0 THEN x\nWHILE 1 - 1 THEN x")
+        taken, never, loop = node.element_nodes
+        self.assertIsInstance(taken, VarAccessNode)
+        self.assertIsInstance(never, IfNode)
+        self.assertEqual(never.cases, [])
+        self.assertIsInstance(loop, ListNode)
+
+    def test_shortens_unary_chains(self):
+        _, node = self.optimize("- - - x\nNOT NOT x")
+        minus, nots = node.element_nodes
+        self.assertIsInstance(minus.node, VarAccessNode)
+        self.assertIsInstance(nots.node, UnaryOpNode)
+
+    def test_runtime_errors_keep_positions(self):
+        for text in ("1 + 2 / (3 - 3)", "चल x = 4 % 0", '1 + "a" - 2'):
+            with self.subTest(text):
+                _, error = main.run("<STDIN>", text)
+                self.assertIsNotNone(error)
+                self.assertEqual(error.as_string(), self.unoptimized_error(text))
+
+    def unoptimized_error(self, text):
+        ast = main.parse(Lexer("<STDIN>", text))
+        context = main.Context("<program>")
+        context.symbol_table = main.global_symbol_table
+        return main.Interpreter().visit(ast.node, context).error.as_string()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,35 @@
+import unittest
+import main
+
+
+class TestOperatorPrecedence(unittest.TestCase):
+    def assertResult(self, text, expected):
+        result, error = main.run("<STDIN>", text)
+        self.assertIsNone(error)
+        self.assertEqual(str(result), expected)
+
+    def test_mod_binds_tighter_than_mul(self):
+        self.assertResult("2 * 7 % 4", "[६]")
+
+    def test_power_takes_mod_operand(self):
+        self.assertResult("2 ** 3 % 2", "[२]")
+
+    def test_power_is_right_associative(self):
+        self.assertResult("2 ** 3 ** 2", "[५१२]")
+
+    def test_sign_applies_to_power(self):
+        self.assertResult("-2 ** 2", "[-४]")
+
+    def test_logic_and_comparison(self):
+        self.assertResult("1 + 2 == 3 AND NOT 0", "[१]")
+
+    def test_deep_nesting(self):
+        self.assertResult("(" * 200 + "1" + ")" * 200, "[१]")
+
+    def test_power_operand_takes_no_sign(self):
+        _, error = main.run("<STDIN>", "2 ** -1")
+        self.assertEqual(error.pos_start.col, 6)
+
+
+if __name__ == "__main__":
+    unittest.main()
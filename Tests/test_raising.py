@@ -0,0 +1,36 @@
+import unittest
+import main
+from Tests.test_closures import PROGRAMS, ERRORS
+
+
+class TestRaisingInterpreter(unittest.TestCase):
+    def run_both(self, text):
+        return [main.run("<STDIN>", text, engine=engine) for engine in ("interpreter", "raising")]
+
+    def test_same_results(self):
+        for name, text in PROGRAMS.items():
+            with self.subTest(name):
+                (value, error), (raising_value, raising_error) = self.run_both(text)
+                self.assertIsNone(raising_error)
+                self.assertEqual(str(raising_value), str(value))
+
+    def test_same_errors(self):
+        for name, text in ERRORS.items():
+            with self.subTest(name):
+                (_, error), (_, raising_error) = self.run_both(text)
+                self.assertIsNotNone(raising_error)
+                self.assertEqual(raising_error.as_string(), error.as_string())
+
+    def test_exits_reach_the_caller_loop(self):
+        text = "FUN f(i)\nIF i == 2 THEN BREAK\nIF i == 0 THEN CONTINUE\nEND\nFOR i = 0 TO 5 THEN\nf(i)\ni\nEND"
+        (value, _), (raising_value, _) = self.run_both(text)
+        self.assertEqual(str(raising_value), str(value))
+
+    def test_empty_return_does_not_exit(self):
+        text = "FUN f()\nRETURN []\nRETURN 2\nEND\nf()"
+        (value, _), (raising_value, _) = self.run_both(text)
+        self.assertEqual(str(raising_value), str(value))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+import sys
+import unittest
+from unittest import mock
+import main
+
+ENGINES = ("interpreter", "raising", "closure", "vm", "python")
+
+TAIL = "FUN count(n, acc)\nIF n == 0 THEN RETURN acc\nRETURN count(n - 1, acc + 1)\nEND\ncount(2000, 0)"
+ARROW = "FUN c(n) -> IF n == 0 THEN 7 ELSE c(n - 1)\nc(2000)"
+DEEP = "FUN d(n)\nIF n == 0 THEN RETURN 0\nRETURN 1 + d(n - 1)\nEND\nd(300)"
+
+
+def nested(n, levels):
+    # d recursing n calls deep from inside levels of FOR and IF, through an index
+    body = "चल r = [d(n - 1)][0]"
+    for level in range(levels):
+        body = f"FOR i{level} = 0 TO 1 THEN\nIF i{level} == 0 THEN\n{body}\nEND\nEND"
+    return f"FUN d(n)\nIF n == 0 THEN RETURN 0\nचल r = 0\n{body}\nRETURN r + 1\nEND\nd({n})"
+
+
+class TestRecursion(unittest.TestCase):
+    def test_tail_calls_run_past_the_depth_limit(self):
+        for engine in ("interpreter", "raising"):
+            for text, result in ((TAIL, "२०००"), (ARROW, "७")):
+                with self.subTest(engine):
+                    value, error = main.run("<STDIN>", text, engine=engine, max_depth=100)
+                    self.assertIsNone(error)
+                    self.assertEqual(str(value.elements[-1]), result)
+
+    def test_depth_limit_is_an_error(self):
+        for engine in ENGINES:
+            with self.subTest(engine):
+                value, error = main.run("<STDIN>", DEEP, engine=engine, max_depth=100)
+                self.assertIsNone(value)
+                self.assertIn("maximum recursion depth of 100 exceeded", error.as_string())
+
+    def test_recursion_within_the_limit(self):
+        for engine in ENGINES:
+            with self.subTest(engine):
+                value, error = main.run("<STDIN>", DEEP, engine=engine)
+                self.assertIsNone(error)
+                self.assertEqual(str(value.elements[-1]), "३००")
+
+    def test_nested_bodies_within_the_limit(self):
+        # the host stack is sized for how deep the bodies nest, whatever the
+        # limit was before
+        limit = sys.getrecursionlimit()
+        sys.setrecursionlimit(1000)
+        try:
+            for engine in ENGINES:
+                with self.subTest(engine):
+                    value, error = main.run("<STDIN>", nested(2990, 6), engine=engine, max_depth=3000)
+                    self.assertIsNone(error)
+                    self.assertEqual(str(value.elements[-1]), "२९९०")
+        finally:
+            sys.setrecursionlimit(limit)
+
+    def test_limit_is_restored(self):
+        limit = sys.getrecursionlimit()
+        for engine in ENGINES:
+            with self.subTest(engine):
+                main.run("<STDIN>", DEEP, engine=engine)
+                self.assertEqual(sys.getrecursionlimit(), limit)
+        _, error = main.run("<STDIN>", "1 / 0")
+        self.assertIsNotNone(error)
+        self.assertEqual(sys.getrecursionlimit(), limit)
+
+    def test_host_stack_is_its_own_error(self):
+        # not through an index, whose errors the interpreter drops
+        text = DEEP.replace("d(300)", "d(1000)")
+        limit = sys.getrecursionlimit()
+        sys.setrecursionlimit(1500)
+        try:
+            with mock.patch.object(main, "host_frames", return_value=0):
+                for engine in ("interpreter", "raising", "closure", "python"):
+                    with self.subTest(engine):
+                        _, error = main.run("<STDIN>", text, engine=engine)
+                        self.assertIn("host stack exhausted", error.as_string())
+        finally:
+            sys.setrecursionlimit(limit)
+
+    def test_tail_call_keeps_dynamic_scope(self):
+        text = "FUN g() -> y\nFUN f(y)\nRETURN g()\nEND\nf(5)"
+        value, error = main.run("<STDIN>", text)
+        self.assertIsNone(error)
+        self.assertEqual(str(value.elements[-1]), "५")
+
+    def test_exits_pass_through_tail_calls(self):
+        text = "FUN g(i)\nIF i == 2 THEN BREAK\nEND\nFUN f(i)\nRETURN g(i)\nEND\nचल a = 0\nFOR i = 0 TO 5 THEN\nf(i)\nचल a = i\nEND\na"
+        value, error = main.run("<STDIN>", text)
+        self.assertIsNone(error)
+        self.assertEqual(str(value.elements[-1]), "१")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+import unittest
+import main
+from Lexer import Lexer
+from Interpreter.resolver import Resolver
+from SymbolTable import Frame, SymbolTable
+
+
+class TestResolver(unittest.TestCase):
+    def resolve(self, text, arg_names):
+        ast = main.parse(Lexer("<STDIN>", text))
+        self.assertIsNone(ast.error)
+        return Resolver().resolve_function("f", ast.node, arg_names)
+
+    def test_slots_in_order(self):
+        scope = self.resolve("चल b = a\nFOR i = 0 TO 3 THEN c = i\nFUN g(d) -> e\nb", ["a"])
+        self.assertEqual(list(scope.slots), ["a", "b", "i", "c", "g"])
+
+    def test_repeated_arguments(self):
+        scope = self.resolve("a", ["a", "b", "a"])
+        self.assertEqual(scope.arg_slots, [0, 1, 0])
+
+    def test_frame_falls_back_to_parent(self):
+        parent = SymbolTable()
+        parent.set("a", 1)
+        frame = Frame({"a": 0, "b": 1}, parent)
+        self.assertEqual(frame.get("a"), 1)
+        frame.set("a", 2)
+        self.assertEqual(frame.get("a"), 2)
+        self.assertEqual(frame.symbols, {"a": 2})
+
+    def test_frame_slots_are_local_names(self):
+        parent = SymbolTable()
+        parent.set("a", 1)
+        frame = Frame({"a": 0}, parent)
+        self.assertEqual(parent.local_names, {"a"})
+        self.assertEqual(frame.get("a"), 1)
+        self.assertIsNone(frame.get("b"))
+
+
+class TestGlobalLookups(unittest.TestCase):
+    # names no frame sets are read from the global table at once, the others
+    # still through the callers
+    def test_callers_still_shadow(self):
+        text = (
+            "FUN show() -> v\nFUN arg(v) -> show()\n"
+            "FUN loop()\nFOR v = 5 TO 6 THEN चल r = show()\nRETURN r\nEND\n"
+            "FUN assign()\nचल v = 7\nRETURN show()\nEND\n"
+            "चल v = 1\n[show(), arg(2), loop(), assign(), show()]"
+        )
+        for engine in ("interpreter", "raising", "closure", "vm", "python"):
+            with self.subTest(engine):
+                value, error = main.run("<STDIN>", text, engine=engine)
+                self.assertIsNone(error)
+                self.assertEqual(str(value.elements[-1]), "[१, २, ५, ७, १]")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+import main
+from Tests.test_closures import PROGRAMS, ERRORS
+
+
+class TestTranspiler(unittest.TestCase):
+    def run_both(self, text):
+        return [main.run("<STDIN>", text, engine=engine) for engine in ("interpreter", "python")]
+
+    def test_same_results(self):
+        for name, text in PROGRAMS.items():
+            with self.subTest(name):
+                (value, error), (python_value, python_error) = self.run_both(text)
+                self.assertIsNone(python_error)
+                self.assertEqual(str(python_value), str(value))
+
+    def test_same_errors(self):
+        for name, text in ERRORS.items():
+            with self.subTest(name):
+                (_, error), (_, python_error) = self.run_both(text)
+                self.assertIsNotNone(python_error)
+                self.assertEqual(python_error.as_string(), error.as_string())
+
+    def test_exits_in_conditions_leave_the_outer_loop(self):
+        text = "FOR j = 0 TO 3 THEN\nWHILE (BREAK) THEN 1\nj\nEND"
+        (value, _), (python_value, _) = self.run_both(text)
+        self.assertEqual(str(python_value), str(value))
+
+    def test_python_source(self):
+        source, error = main.transpile("<STDIN>", "FUN f(a) -> a + 1\nFOR i = 0 TO 3 THEN f(i)")
+        self.assertIsNone(error)
+        self.assertIn("def program(context):", source)
+        self.assertIn("for t", source)
+        compile(source, "<test>", "exec")
+
+    def test_python_errors_name_the_baji_line(self):
+        with self.assertRaises(AttributeError) as raised:
+            main.run("<STDIN>", "चल a = 1\nFOR i = 0 TO 3 STEP [] THEN 1", engine="python")
+        # notes are only kept from Python 3.11 on
+        notes = getattr(raised.exception, "__notes__", None)
+        if notes is not None:
+            self.assertIn("while running Baji line 2", notes)
+
+    def test_nested_deeper_than_python(self):
+        text = "FOR i = 0 TO 1 THEN " * 30 + "i"
+        (value, _), (python_value, _) = self.run_both(text)
+        self.assertEqual(str(python_value), str(value))
+
+
+if __name__ == "__main__":
+    unittest.main()
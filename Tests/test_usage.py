@@ -0,0 +1,60 @@
+import unittest
+import main
+from Lexer import Lexer
+from Nodes import ForNode, WhileNode, FuncDefNode
+from Interpreter import Usage
+
+ENGINES = ("interpreter", "raising", "closure", "vm", "python")
+
+
+def parse(text):
+    ast = main.parse(Lexer("<STDIN>", text))
+    assert ast.error is None
+    return ast.node
+
+
+class TestUsage(unittest.TestCase):
+    def test_statement_loops_become_blocks(self):
+        node = Usage().rewrite(parse("FOR i = 0 TO 3 THEN i\nWHILE FALSE THEN 1"), used=False)
+        for_node, while_node = node.element_nodes
+        self.assertIs(type(for_node), ForNode)
+        self.assertIs(type(while_node), WhileNode)
+        self.assertTrue(for_node.should_return_null)
+        self.assertTrue(while_node.should_return_null)
+
+    def test_read_values_are_kept(self):
+        text = "चल l = FOR i = 0 TO 3 THEN i\nFUN f() -> FOR i = 0 TO 3 THEN i\nFOR i = 0 TO 3 THEN i"
+        original = parse(text)
+        node = Usage().rewrite(original)
+        self.assertIs(node, original)
+
+    def test_block_function_bodies_are_discarded(self):
+        node = Usage().rewrite(parse("FUN f()\nFOR i = 0 TO 3 THEN i\nRETURN 1\nEND"))
+        function = node.element_nodes[0]
+        self.assertIs(type(function), FuncDefNode)
+        self.assertTrue(function.body_node.element_nodes[0].should_return_null)
+
+    def test_tree_is_not_changed(self):
+        original = parse("FOR i = 0 TO 3 THEN i")
+        Usage().rewrite(original, used=False)
+        self.assertFalse(original.element_nodes[0].should_return_null)
+
+    def test_same_results(self):
+        text = "चल s = 0\nFUN f(n)\nFOR j = 0 TO n THEN चल s = s + j\nRETURN s\nEND\n[f(5), FOR i = 0 TO 3 THEN i * 2]"
+        for engine in ENGINES:
+            with self.subTest(engine):
+                value, error = main.run("<STDIN>", text, engine=engine)
+                self.assertIsNone(error)
+                self.assertEqual(str(value.elements[-1]), "[१०, [०, २, ४]]")
+
+    def test_unread_program_value(self):
+        for engine in ENGINES:
+            with self.subTest(engine):
+                ast = main.parse(Lexer("<STDIN>", "FOR i = 0 TO 3 THEN i"))
+                value, error = main.run_ast(ast, engine, keep_value=False)
+                self.assertIsNone(error)
+                self.assertEqual(str(value.elements[-1]), "०")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,44 @@
+import unittest
+import main
+from Tests.test_closures import PROGRAMS, ERRORS
+
+
+class TestVirtualMachine(unittest.TestCase):
+    def run_both(self, text):
+        return [main.run("<STDIN>", text, engine=engine) for engine in ("interpreter", "vm")]
+
+    def test_same_results(self):
+        for name, text in PROGRAMS.items():
+            with self.subTest(name):
+                (value, error), (vm_value, vm_error) = self.run_both(text)
+                self.assertIsNone(vm_error)
+                self.assertEqual(str(vm_value), str(value))
+
+    def test_same_errors(self):
+        for name, text in ERRORS.items():
+            with self.subTest(name):
+                (_, error), (_, vm_error) = self.run_both(text)
+                self.assertIsNotNone(vm_error)
+                self.assertEqual(vm_error.as_string(), error.as_string())
+
+    def test_exits_reach_the_caller_loop(self):
+        text = "FUN f(i)\nIF i == 2 THEN BREAK\nEND\nFOR i = 0 TO 5 THEN\nf(i)\ni\nEND"
+        (value, _), (vm_value, _) = self.run_both(text)
+        self.assertEqual(str(vm_value), str(value))
+
+    def test_deep_recursion(self):
+        text = "FUN depth(n)\nIF n == 0 THEN RETURN 0\nRETURN depth(n - 1) + 1\nEND\ndepth(2000)"
+        value, error = main.run("<STDIN>", text, engine="vm")
+        self.assertIsNone(error)
+        self.assertEqual(value.elements[-1].value, 2000)
+
+    def test_disassemble(self):
+        listing, error = main.disassemble("<STDIN>", "FUN f(a) -> a + 1\nf(2)")
+        self.assertIsNone(error)
+        self.assertIn("Disassembly of <code f>:", listing)
+        self.assertIn("CALL_NAME", listing)
+        self.assertIn("BINARY_ARITHMETIC     0 (PLUS)", listing)
+
+
+if __name__ == "__main__":
+    unittest.main()
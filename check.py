@@ -0,0 +1,89 @@
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import main
+from Parser import ASTCache
+from Parser.ast_cache import CACHE_DIR
+
+
+# ------------CHECK----------------
+# Lexes and parses every .baji script under a directory without running it,
+# spread over one process per core. With --compile the parsed scripts are
+# also written to __bajicache__, so running them later skips parsing.
+
+
+def find_scripts(path):
+    if os.path.isfile(path):
+        return [path]
+
+    scripts = []
+    for directory, dirs, files in os.walk(path):
+        dirs[:] = sorted(name for name in dirs if name != CACHE_DIR)
+        scripts.extend(
+            os.path.join(directory, name) for name in sorted(files) if name.lower().endswith(".baji")
+        )
+    return scripts
+
+
+def check_file(path, lexer="default", precompile=False):
+    # the error the script would fail with before running, or None
+    fn = f"<{os.path.splitext(path)[0]}>"
+    try:
+        if precompile:
+            ast_cache = ASTCache(fn, path)
+            if ast_cache.is_current():
+                return None
+        ast = main.parse(main.LEXERS[lexer].from_file(fn, path))
+        if precompile and not ast.error:
+            ast_cache.store(ast.node)
+    except Exception as e:
+        return f"Failed to check Script {path}\n{e}"
+
+    return ast.error.as_string() if ast.error else None
+
+
+def check_scripts(paths, jobs=None, lexer="default", precompile=False):
+    # [(path, error or None)] in the order of paths
+    jobs = jobs or os.cpu_count() or 1
+    check = partial(check_file, lexer=lexer, precompile=precompile)
+    if jobs == 1 or len(paths) < 2:
+        return list(zip(paths, map(check, paths)))
+
+    # most scripts are small, so they are sent to the workers in batches
+    chunksize = max(1, len(paths) // (jobs * 4))
+    with ProcessPoolExecutor(jobs) as executor:
+        return list(zip(paths, executor.map(check, paths, chunksize=chunksize)))
+
+
+def options_from_args(args):
+    # --jobs=4, --lexer=fast, --compile
+    options = dict(arg[2:].split("=", 1) for arg in args if arg.startswith("--") and "=" in arg)
+    return {
+        "jobs": int(options.get("jobs", 0)) or None,
+        "lexer": options.get("lexer", "default"),
+        "precompile": "--compile" in args,
+    }
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    paths = [arg for arg in args if not arg.startswith("--")]
+
+    if not paths:
+        print("Provide directory or file name")
+        sys.exit(2)
+
+    scripts = [script for path in paths for script in find_scripts(path)]
+    results = check_scripts(scripts, **options_from_args(args))
+
+    failed = 0
+    for path, error in results:
+        if error:
+            failed += 1
+            print(error)
+            print()
+
+    print(f"{len(scripts)} scripts checked, {failed} with errors")
+    sys.exit(1 if failed else 0)
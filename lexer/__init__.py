@@ -1,4 +1,7 @@
 from Lexer.lexer import *
+from Lexer.fast_lexer import *
+from Lexer.token_buffer import *
+from Lexer.token_stream import *
 
 
 
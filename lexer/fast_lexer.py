@@ -0,0 +1,174 @@
+import re
+from Translate import Translate
+from Errors import Error, IllegalCharacterError, ExpectedCharError
+from Lexer.position import Position, Source
+from Lexer.token import Token
+from Constants import *
+
+
+# -----------FAST LEXER---------------
+# Same token stream as Lexer, but every token is recognised by one match of a
+# compiled master pattern instead of walking the source char by char.
+
+
+DIGITS_TO_ENG = str.maketrans(Translate().DIGITS_M_TO_E)
+WORD_CACHE_SIZE = 4096
+
+OPERATORS = {
+    "+": TT_PLUS,
+    "-": TT_MINUS,
+    "->": TT_ARROW,
+    "*": TT_MUL,
+    "**": TT_POWER,
+    "/": TT_DIV,
+    "%": TT_MOD,
+    ",": TT_COMMA,
+    "(": TT_LPAREN,
+    ")": TT_RPAREN,
+    "[": TT_LSQUARE,
+    "]": TT_RSQUARE,
+    "=": TT_EQ,
+    "==": TT_EE,
+    "!=": TT_NE,
+    "<": TT_LT,
+    "<=": TT_LTE,
+    ">": TT_GT,
+    ">=": TT_GTE,
+    ";": TT_NEWLINE,
+    "\n": TT_NEWLINE,
+}
+
+
+def char_class(chars):
+    return "[" + re.escape(chars) + "]"
+
+
+TOKEN_PATTERN = re.compile(
+    r"(?P<space>[ \t]+)"
+    r"|(?P<operator>->|\*\*|==|!=|<=|>=|[-+*/%,()\[\]=<>;\n])"
+    rf"|(?P<number>{char_class(DIGITS)}+(?:\.{char_class(DIGITS)}*)?)"
+    rf"|(?P<identifier>{char_class(LETTERS)}{char_class(LETTERS_DIGITS + '_')}*)"
+    r'|(?P<string>"[^"]*"?)'
+    r"|(?P<comment>#[^\n]*\n?)"
+)
+
+# A backslash is dropped, except "\n" which becomes a newline (see Lexer.make_string)
+ESCAPE_PATTERN = re.compile(r"\\(n?)")
+
+
+def unescape(match):
+    return "\n" if match.group(1) else ""
+
+
+class FastLexer:
+    def __init__(self, fn, text, source=None, file=None):
+        self.fn = fn
+        self.text = text
+        self.source = source or Source(fn, text)
+        self.file = file
+
+    @classmethod
+    def from_file(cls, fn, path):
+        # the script is lexed line by line as the parser asks for tokens
+        return cls(fn, None, Source(fn, path=path), open(path, "r", encoding="utf-8"))
+
+    def read_chunks(self):
+        if self.file is None:
+            yield self.text
+            return
+        with self.file:
+            yield from self.file
+
+    def make_tokens(self):
+        tokens = []
+        for token in self.generate_tokens():
+            if isinstance(token, Error):
+                return [], token
+            tokens.append(token)
+        return tokens, None
+
+    def generate_tokens(self):
+        for row in self.scan():
+            if isinstance(row, Error):
+                yield row
+                return
+            token_type, value, start, end, keyword = row
+            yield Token(token_type, value, start, end, self.source, keyword)
+
+    def scan(self):
+        # yields (type, value, start, end, keyword) rows, or the first error
+        chunks = self.read_chunks()
+        words = {}
+        after_comment = False
+        text = next(chunks, "")
+        base = 0
+        idx = 0
+
+        while True:
+            found = TOKEN_PATTERN.match(text, idx)
+
+            if found is None and idx >= len(text):
+                chunk = next(chunks, None)
+                if chunk is None:
+                    break
+                base += idx
+                text = chunk
+                idx = 0
+                continue
+
+            # Lexer.skip_comment hands the next char straight to get_token,
+            # so whitespace or another comment there is an illegal character
+            if found is None or (after_comment and found.lastgroup in ("space", "comment")):
+                yield self.make_error(base + idx, text[idx])
+                return
+            after_comment = False
+            kind = found.lastgroup
+            end = found.end()
+
+            if kind == "operator":
+                yield OPERATORS[found.group()], None, base + idx, base + end, 0
+            elif kind == "identifier" or kind == "number":
+                word = found.group()
+                if word not in words:
+                    if len(words) > WORD_CACHE_SIZE:
+                        words.clear()
+                    words[word] = self.make_word(kind, word)
+                token_type, value, keyword = words[word]
+                yield token_type, value, base + idx, base + end, keyword
+            elif kind == "string":
+                closed = end - idx > 1 and text[end - 1] == '"'
+                if not closed:
+                    chunk = next(chunks, None)
+                    if chunk is not None:
+                        # the string runs on into the next line, lex it again from its quote
+                        base += idx
+                        text = text[idx:] + chunk
+                        idx = 0
+                        continue
+                    # an unterminated string advances once past the end of the text
+                    end += 1
+                string = ESCAPE_PATTERN.sub(unescape, text[idx + 1 : end - 1])
+                yield TT_STRING, string, base + idx, base + end, 0
+            elif kind == "comment":
+                after_comment = True
+
+            idx = end
+
+        yield TT_EOF, None, base + idx, base + idx, 0
+
+    def make_word(self, kind, word):
+        word = word.translate(DIGITS_TO_ENG)
+        if kind == "number":
+            if "." in word:
+                return TT_FLOAT, float(word), 0
+            return TT_INT, int(word), 0
+        keyword = KEYWORD_IDS.get(word, 0)
+        return (TT_KEYWORD if keyword else TT_IDENTIFIER), word, keyword
+
+    def make_error(self, idx, char):
+        if char == "!":
+            return ExpectedCharError(
+                Position(self.source, idx), Position(self.source, idx + 1), "'=' (after '!')"
+            )
+        position = Position(self.source, idx)
+        return IllegalCharacterError(position, position, "'" + char + "'")
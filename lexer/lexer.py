@@ -1,7 +1,7 @@
 from typing import Counter
 from Translate import Translate
 from Errors import Error, IllegalCharacterError, ExpectedCharError
-from Lexer.position import Position
+from Lexer.position import Position, Source
 from Lexer.token import Token
 from Constants import *
 
@@ -10,23 +10,30 @@ from Constants import *
 
 
 class Lexer:
-    def __init__(self, fn, text):
+    def __init__(self, fn, text, source=None, start=0):
         self.fn = fn
         self.text = text
-        self.pos = Position(-1, 0, -1, fn, text)
+        self.source = source or Source(fn, text)
+        self.idx = start - 1
         self.current_char = None
         self.advance()
         self.translate = Translate()
 
+    @classmethod
+    def from_file(cls, fn, path):
+        # peak() needs random access, so this lexer reads the whole script
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(fn, f.read())
+
     def advance(self):
-        self.pos.advance(self.current_char)
+        self.idx += 1
         self.current_char = (
-            self.text[self.pos.idx] if self.pos.idx < len(self.text) else None
+            self.text[self.idx] if self.idx < len(self.text) else None
         )
 
     def peak(self, idx=1):
-        if self.pos.idx + idx < len(self.text):
-            return self.text[self.pos.idx + idx]
+        if self.idx + idx < len(self.text):
+            return self.text[self.idx + idx]
         return None
 
     def primitive_token(self):
@@ -83,13 +90,14 @@ class Lexer:
         return None, None
 
     def get_token(self):
+        idx_start = self.idx
         token, error = self.primitive_token()
 
         if error:
             return error
         if token:
             self.advance()
-            return Token(token, pos_start=self.pos)
+            return Token(token, None, idx_start, self.idx, self.source)
 
         if self.current_char == '"':
             return self.make_string()
@@ -103,14 +111,21 @@ class Lexer:
         
             
 
-        position_start = self.pos.copy()
+        position_start = Position(self.source, self.idx)
 
         return IllegalCharacterError(
-            position_start, self.pos, "'" + self.current_char + "'"
+            position_start, position_start, "'" + self.current_char + "'"
         )
 
     def make_tokens(self):
         tokens = []
+        for current_token in self.generate_tokens():
+            if isinstance(current_token, Error):
+                return [], current_token
+            tokens.append(current_token)
+        return tokens, None
+
+    def generate_tokens(self):
         while self.current_char != None:
             if self.current_char in " \t":
                 self.advance()
@@ -118,17 +133,19 @@ class Lexer:
             if self.current_char == "#":
                 self.skip_comment()
             current_token = self.get_token()
+            yield current_token
             if isinstance(current_token, Error):
-                return [], current_token
-            tokens.append(current_token)
+                return
 
-        tokens.append(Token(TT_EOF, pos_start=self.pos))
-        return tokens, None
+        yield Token(TT_EOF, None, self.idx, self.idx, self.source)
+
+    def scan(self):
+        return self.generate_tokens()
 
     def make_number(self):
         num_str = ""
         dot = False
-        pos_start = self.pos
+        idx_start = self.idx
 
         while self.current_char != None and self.current_char in DIGITS + ".":
             if self.current_char == ".":
@@ -141,15 +158,13 @@ class Lexer:
             self.advance()
 
         if dot:
-            return Token(
-                TT_FLOAT, float(num_str), pos_start=pos_start, pos_end=self.pos
-            )
+            return Token(TT_FLOAT, float(num_str), idx_start, self.idx, self.source)
         else:
-            return Token(TT_INT, int(num_str), pos_start=pos_start, pos_end=self.pos)
+            return Token(TT_INT, int(num_str), idx_start, self.idx, self.source)
 
     def make_string(self):
         string = ''
-        pos_start = self.pos.copy()
+        idx_start = self.idx
         escape_character = False
         self.advance()
 
@@ -173,28 +188,31 @@ class Lexer:
             escape_character = False
         
         self.advance()
-        return Token(TT_STRING, string, pos_start, self.pos)
+        return Token(TT_STRING, string, idx_start, self.idx, self.source)
 
 
     def make_identifier(self):
         id_str = ""
-        pos_start = self.pos
+        idx_start = self.idx
 
         while self.current_char != None and self.current_char in LETTERS_DIGITS + "_":
             id_str += self.translate.digit_to_eng(self.current_char)
             self.advance()
 
-        token_type = TT_KEYWORD if id_str in KEYWORDS else TT_IDENTIFIER
-        return Token(token_type, id_str, pos_start, self.pos)
+        keyword = KEYWORD_IDS.get(id_str, 0)
+        token_type = TT_KEYWORD if keyword else TT_IDENTIFIER
+        return Token(token_type, id_str, idx_start, self.idx, self.source, keyword)
 
     def make_not_equals(self):
-        pos_start = self.pos.copy()
+        pos_start = Position(self.source, self.idx)
         self.advance()
 
         if self.current_char == "=":
             return TT_NE, None
 
-        return None, ExpectedCharError(pos_start, self.pos, "'=' (after '!')")
+        return None, ExpectedCharError(
+            pos_start, Position(self.source, self.idx), "'=' (after '!')"
+        )
 
     def make_equals(self):
         tok_type = TT_EQ
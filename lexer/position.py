@@ -1,22 +1,72 @@
+from bisect import bisect_right
+
+# ----------Source--------------
+
+
+class Source:
+    # offset of this source in the text its positions are reported against
+    base = 0
+
+    def __init__(self, fn, text=None, path=None):
+        self.fn = fn
+        self.path = path
+        self._text = text
+        self.line_starts = None
+
+    @property
+    def text(self):
+        # a script streamed from disk is only read whole to render an error
+        if self._text is None:
+            with open(self.path, "r", encoding="utf-8") as f:
+                self._text = f.read()
+        return self._text
+
+    def line_col(self, idx):
+        # the line index is only needed to render errors, so build it on demand
+        if self.line_starts is None:
+            line_starts = [0]
+            newline = self.text.find("\n")
+            while newline != -1:
+                line_starts.append(newline + 1)
+                newline = self.text.find("\n", newline + 1)
+            self.line_starts = line_starts
+
+        ln = bisect_right(self.line_starts, idx) - 1
+        return ln, idx - self.line_starts[ln]
+
+
 # ----------Position--------------
 
 
 class Position:
-    def __init__(self, idx, ln, col, fn, ftxt):
-        self.idx = idx
-        self.ln = ln
-        self.col = col
-        self.fn = fn
-        self.ftxt = ftxt
+    __slots__ = ("source", "offset", "anchor")
+
+    def __init__(self, source, offset, anchor=None):
+        self.source = source
+        self.offset = offset
+        # a position stepped past its anchor without crossing a newline
+        self.anchor = offset if anchor is None else anchor
+
+    def __reduce__(self):
+        # pickled as its constructor arguments, see Parser.ast_cache
+        return Position, (self.source, self.offset, self.anchor)
+
+    @property
+    def idx(self):
+        return self.source.base + self.offset
+
+    @property
+    def ln(self):
+        return self.source.line_col(self.anchor)[0]
 
-    def advance(self, current_char=None):
-        self.idx += 1
-        self.col += 1
+    @property
+    def col(self):
+        return self.source.line_col(self.anchor)[1] + self.offset - self.anchor
 
-        if current_char == "\n":
-            self.ln += 1
-            self.col = 0
-        return self
+    @property
+    def fn(self):
+        return self.source.fn
 
-    def copy(self):
-        return Position(self.idx, self.ln, self.col, self.fn, self.ftxt)
\ No newline at end of file
+    @property
+    def ftxt(self):
+        return self.source.text
@@ -1,14 +1,46 @@
+from Lexer.position import Position
+from Constants import *
+
+# Lexer reports the start of every token except strings at its end, and
+# widens single characters by one column (see Token.pos_start/pos_end)
+WORD_TOKENS = (TT_INT, TT_FLOAT, TT_IDENTIFIER, TT_KEYWORD, TT_STRING)
+
+
 class Token:
-    def __init__(self, type_, value=None, pos_start=None, pos_end=None):
+    __slots__ = ("type", "value", "start", "end", "source", "keyword")
+
+    def __init__(self, type_, value=None, start=0, end=0, source=None, keyword=0):
         self.type = type_
         self.value = value
-        if pos_start:
-            self.pos_start = pos_start.copy()
-            self.pos_end = pos_start.copy()
-            self.pos_end.advance()
+        self.start = start
+        self.end = end
+        self.source = source
+        # canonical KW_* id of a keyword, value keeps the spelling that was written
+        self.keyword = keyword
+
+    def __reduce__(self):
+        # pickled as its constructor arguments, see Parser.ast_cache
+        return Token, (self.type, self.value, self.start, self.end, self.source, self.keyword)
+
+    @property
+    def pos_start(self):
+        if self.type == TT_STRING:
+            return Position(self.source, self.start)
+        return Position(self.source, self.end)
+
+    @property
+    def pos_end(self):
+        if self.type in WORD_TOKENS:
+            return Position(self.source, self.end)
+        return Position(self.source, self.end + 1, self.end)
 
-        if pos_end:
-            self.pos_end = pos_end.copy()
+    @property
+    def span(self):
+        # (pos_start, pos_end), shared when they are the same position
+        pos_start = self.pos_start
+        if self.type in WORD_TOKENS and self.type != TT_STRING:
+            return pos_start, pos_start
+        return pos_start, self.pos_end
 
     def matches(self, type_, value):
         if isinstance(value,tuple):
@@ -19,4 +51,5 @@ class Token:
         return self.type == type_ and self.value == value
 
     def __repr__(self):
-        return f"{self.type}:{self.value}" if self.value else f"{self.type}"
+        name = TOKEN_NAMES[self.type]
+        return f"{name}:{self.value}" if self.value else f"{name}"
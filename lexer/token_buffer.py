@@ -0,0 +1,67 @@
+from array import array
+from Lexer.token import Token
+
+
+# -----------TOKEN BUFFER---------------
+# Tokens stored column-wise: one byte each for the type code and keyword id,
+# two ints for the offsets and an index into a table of interned values. Token objects are only
+# built when the parser asks for one.
+
+
+class TokenBuffer:
+    def __init__(self, source=None):
+        self.source = source
+        self.types = array("B")
+        self.keywords = array("B")
+        self.starts = array("i")
+        self.ends = array("i")
+        self.value_ids = array("i")
+        self.values = [None]
+        self.value_index = {(type(None), None): 0}
+
+    def append(self, type_, value, start, end, keyword=0):
+        key = (type(value), value)
+        value_id = self.value_index.get(key)
+        if value_id is None:
+            value_id = self.value_index[key] = len(self.values)
+            self.values.append(value)
+
+        self.types.append(type_)
+        self.keywords.append(keyword)
+        self.starts.append(start)
+        self.ends.append(end)
+        self.value_ids.append(value_id)
+
+    def token(self, idx):
+        return Token(
+            self.types[idx],
+            self.values[self.value_ids[idx]],
+            self.starts[idx],
+            self.ends[idx],
+            self.source,
+            self.keywords[idx],
+        )
+
+    def discard(self, count):
+        del self.types[:count]
+        del self.keywords[:count]
+        del self.starts[:count]
+        del self.ends[:count]
+        del self.value_ids[:count]
+
+    def compact(self):
+        # forget interned values no remaining token refers to
+        values = [None]
+        value_index = {(type(None), None): 0}
+        for i, value_id in enumerate(self.value_ids):
+            value = self.values[value_id]
+            key = (type(value), value)
+            if key not in value_index:
+                value_index[key] = len(values)
+                values.append(value)
+            self.value_ids[i] = value_index[key]
+        self.values = values
+        self.value_index = value_index
+
+    def __len__(self):
+        return len(self.types)
@@ -0,0 +1,96 @@
+from Errors import Error
+from Lexer.token_buffer import TokenBuffer
+from Constants import *
+
+
+# -----------TOKEN STREAM---------------
+# The parser's cursor over the lexer output. Rows are pulled into a
+# TokenBuffer window on demand and released once the parser is past them.
+
+VALUE_TABLE_SIZE = 4096
+
+
+class TokenStream:
+    def __init__(self, tokens, source=None):
+        self.rows = iter(tokens)
+        self.buffer = TokenBuffer(source)
+        self.offset = 0
+        self.error = None
+        self.done = False
+        self.cached_idx = -1
+        self.cached_token = None
+
+    @classmethod
+    def from_lexer(cls, lexer):
+        return cls(lexer.scan(), lexer.source)
+
+    @property
+    def end(self):
+        # one past the furthest token the lexer has handed over
+        return self.offset + len(self.buffer)
+
+    def fill(self, idx):
+        idx -= self.offset
+        types = self.buffer.types
+        while idx >= len(types) and not self.done:
+            self.pull()
+        if idx >= 0 and idx < len(types):
+            return idx
+        return None
+
+    def type_at(self, idx):
+        idx = self.fill(idx)
+        if idx is None:
+            return None
+        return self.buffer.types[idx]
+
+    def keyword_at(self, idx):
+        idx = self.fill(idx)
+        if idx is None:
+            return 0
+        return self.buffer.keywords[idx]
+
+    def get(self, idx):
+        if idx == self.cached_idx:
+            return self.cached_token
+        row = self.fill(idx)
+        if row is None:
+            return None
+        self.cached_idx = idx
+        self.cached_token = self.buffer.token(row)
+        return self.cached_token
+
+    def pull(self):
+        row = next(self.rows, None)
+
+        if row is None:
+            self.done = True
+            return
+
+        if isinstance(row, Error):
+            # the parser winds down on an EOF here, but the lexer error wins
+            self.error = row
+            pos = row.pos_start
+            self.buffer.source = pos.source
+            row = (TT_EOF, None, pos.offset, pos.offset, 0)
+        elif not isinstance(row, tuple):
+            self.buffer.source = row.source
+            row = (row.type, row.value, row.start, row.end, row.keyword)
+
+        if row[0] == TT_EOF:
+            self.done = True
+        self.buffer.append(*row)
+
+    def release(self, idx):
+        # tokens before idx will not be revisited by the parser
+        drop = idx - self.offset
+        if drop > 0:
+            self.buffer.discard(drop)
+            self.offset = idx
+            if len(self.buffer.values) > VALUE_TABLE_SIZE:
+                self.buffer.compact()
+
+    def drain(self):
+        while not self.done:
+            self.pull()
+            self.release(self.end - 1)
@@ -1,6 +1,9 @@
-from Lexer import Lexer
-from Parser import Parser
-from Interpreter import Interpreter
+from Lexer import Lexer, FastLexer, TokenStream
+from Parser import Parser, ASTCache
+from Results import ParseResult
+from Interpreter import Interpreter, RaisingInterpreter, ClosureCompiler, VirtualMachine, Transpiler
+from Interpreter import Compiler, Optimizer, Purity, Usage, Nesting, MAX_DEPTH
+from Interpreter import disassemble as disassemble_code
 from Context import Context
 from SymbolTable import global_symbol_table
 
@@ -9,21 +12,73 @@ import sys
 
 #------------EXECUTE--------------
 
+LEXERS = {
+    "default": Lexer,
+    "fast": FastLexer,
+}
+
+ENGINES = {
+    "interpreter": Interpreter,
+    "raising": RaisingInterpreter,
+    "closure": ClosureCompiler,
+    "vm": VirtualMachine,
+    "python": Transpiler,
+}
+
+# host stack frames one Baji call takes in the engines that recurse on it,
+# all of them but the vm, besides those of each node the call is nested in
+HOST_FRAMES_PER_CALL = 12
+HOST_FRAMES_PER_NODE = 4
+
 # ------------RUN-----------------
 
 context =None
-def run(fn, text, debug=False):
-    global context
-    lexer = Lexer(fn, text)
+def run(fn, text, debug=False, lexer="default", engine="interpreter", max_depth=MAX_DEPTH, memo=0):
+    return run_lexer(LEXERS[lexer](fn, text), debug, engine, max_depth, memo)
+
+
+def run_lexer(lexer, debug=False, engine="interpreter", max_depth=MAX_DEPTH, memo=0):
+    return run_ast(parse(lexer, debug), engine, max_depth, memo)
+
+
+def disassemble(fn, text, lexer="default"):
+    # the bytecode --engine=vm runs the script as, for debugging
+    ast = parse(LEXERS[lexer](fn, text))
+    if ast.error:
+        return None, ast.error
+    return disassemble_code(Compiler().compile(Optimizer().optimize(ast.node))), None
+
+
+def transpile(fn, text, lexer="default"):
+    # the Python source --engine=python runs the script as, for debugging
+    ast = parse(LEXERS[lexer](fn, text))
+    if ast.error:
+        return None, ast.error
+    program, _ = Transpiler().transpile(Optimizer().optimize(ast.node))
+    return program.source, None
+
+
+def parse(lexer, debug=False):
     # Genarate Tokens
-    tokens, error = lexer.make_tokens()
-    if error:
-        return None, error
+    if debug:
+        tokens, error = lexer.make_tokens()
+        if error:
+            return ParseResult().failure(error)
+        stream = TokenStream(tokens)
+    else:
+        # the parser pulls tokens as it goes instead of lexing the whole script first
+        stream = TokenStream.from_lexer(lexer)
 
     # Generate AST
-    parser = Parser(tokens)
+    parser = Parser(stream)
     ast = parser.parse()
 
+    # a lexer error anywhere in the script is reported before a syntax error
+    if ast.error:
+        stream.drain()
+    if stream.error:
+        return ParseResult().failure(stream.error)
+
     if debug:
         print("---symbols--\n")
         print(global_symbol_table.symbols, "\n")
@@ -33,19 +88,57 @@ def run(fn, text, debug=False):
         print(ast.node, "\n")
         print("--output--\n")
 
+    return ast
+
+
+def run_ast(ast, engine="interpreter", max_depth=MAX_DEPTH, memo=0, keep_value=True):
+    # ast is a ParseResult, from Parser.parse or IncrementalParser.edit
+    # a call nested deeper than max_depth calls fails with an RTError
+    # with memo, pure FUNs keep the values of their last memo calls
+    # without keep_value, the value of the program is not read
+    global context
     if ast.error:
         return None, ast.error
 
+    # constants are folded once here rather than on every run of the node
+    node = Optimizer().optimize(ast.node)
+    # and loops run as statements do not collect the values of their passes
+    node = Usage().rewrite(node, keep_value)
+
     # Run program
-    interpreter = Interpreter()
+    interpreter = ENGINES[engine](max_depth)
+    if memo and hasattr(interpreter, "memoize"):
+        # only the engines walking the tree call through a MemoCache
+        interpreter.memoize(Purity().pure_functions(node), memo)
+    # the tables with a parent of an earlier run are gone with it
+    global_symbol_table.local_names.clear()
     context = Context("<program>")
     context.symbol_table = global_symbol_table
-    result = interpreter.visit(ast.node, context)
+
+    # so the depth check, not the host stack, is what stops a deep recursion,
+    # and only while the program runs, for whatever else the process runs
+    limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(max(limit, host_frames(node, max_depth)))
+    try:
+        result = interpreter.visit(node, context)
+    finally:
+        sys.setrecursionlimit(limit)
 
     return result.value, result.error
 
 
-def run_from_file(file_name):
+def host_frames(node, max_depth):
+    # the host stack running node can take, with calls max_depth deep, and
+    # the frames Python allows by default for whatever runs main
+    nesting = Nesting()
+    depth = nesting.depth(node)
+    per_call = HOST_FRAMES_PER_CALL + HOST_FRAMES_PER_NODE * nesting.deepest_body
+    return max_depth * per_call + HOST_FRAMES_PER_NODE * depth + 1000
+
+
+def run_from_file(
+    file_name, lexer="default", cache=True, engine="interpreter", max_depth=MAX_DEPTH, memo=0
+):
     splits  = file_name.strip().split(".")
 
     if len(splits)<2:
@@ -60,24 +153,50 @@ def run_from_file(file_name):
         print(f"Found -> {extension}")
         exit()
     
+    ast = None
     try:
-        with open(file_name , 'r',encoding='utf-8') as f:
-            script = f.read()
+        if cache:
+            # an unchanged script is not lexed or parsed again
+            ast_cache = ASTCache(f"<{name}>", file_name)
+            node = ast_cache.load()
+            if node is not None:
+                ast = ParseResult().success(node)
+        if ast is None:
+            # any other is lexed from the file as the parser reads it
+            script_lexer = LEXERS[lexer].from_file(f"<{name}>", file_name)
     except BaseException as e:
         print("Failed to load Script")
         print(str(e))
-    
-    _,error = run(f"<{name}>", script, debug=False)
+
+    if ast is None:
+        ast = parse(script_lexer)
+        if cache and not ast.error:
+            ast_cache.store(ast.node)
+
+    _,error = run_ast(ast, engine, max_depth, memo, keep_value=False)
 
     if error:
         print(error.as_string())
 
 
+def options_from_args(args):
+    # --lexer=fast, --cache=off, --engine=raising, closure, vm or python,
+    # --max-depth=<calls>, --memo=<values kept per function>
+    options = dict(arg[2:].split("=", 1) for arg in args if arg.startswith("--") and "=" in arg)
+    return {
+        "lexer": options.get("lexer", "default"),
+        "cache": options.get("cache", "on") != "off",
+        "engine": options.get("engine", "interpreter"),
+        "max_depth": int(options.get("max-depth", MAX_DEPTH)),
+        "memo": int(options.get("memo", 0)),
+    }
+
+
 if __name__=="__main__":
     args = sys.argv
 
     if len(args)>1:
-        run_from_file(args[1])
+        run_from_file(args[1], **options_from_args(args[2:]))
     else:
         print("Provide file name")
         
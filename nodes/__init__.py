@@ -1,5 +1,6 @@
 # ------------NODES----------------
 
+from Nodes.node import *
 from Nodes.operation import *
 from Nodes.value import *
 from Nodes.variable import *
@@ -1,4 +1,8 @@
-class IfNode:
+from Nodes.node import Node
+
+class IfNode(Node):
+    __slots__ = ("cases", "else_case", "pos_start", "pos_end")
+
     def __init__(self, cases, else_case):
         self.cases = cases
         self.else_case = else_case
@@ -1,4 +1,15 @@
-class FuncDefNode:
+from Nodes.node import Node
+
+class FuncDefNode(Node):
+    __slots__ = (
+        "var_name_token",
+        "arg_name_tokens",
+        "body_node",
+        "should_auto_return",
+        "pos_start",
+        "pos_end",
+    )
+
     def __init__(self, var_name_token, arg_name_tokens, body_node, should_auto_return):
         self.var_name_token = var_name_token
         self.arg_name_tokens = arg_name_tokens
@@ -19,7 +30,9 @@ class FuncDefNode:
         return f"( function {self.var_name_token}->args({self.arg_name_tokens}) ({self.body_node}) ) "
 
 
-class CallNode:
+class CallNode(Node):
+    __slots__ = ("node_to_call", "arg_nodes", "pos_start", "pos_end")
+
     def __init__(self, node_to_call, arg_nodes):
         self.node_to_call = node_to_call
         self.arg_nodes = arg_nodes
@@ -35,7 +48,9 @@ class CallNode:
         return f"( function call {self.node_to_call}->args({self.arg_nodes}) ) "
 
 
-class ReturnNode:
+class ReturnNode(Node):
+    __slots__ = ("node_to_return", "pos_start", "pos_end")
+
     def __init__(self, node_to_return, pos_start, pos_end):
         self.node_to_return = node_to_return
 
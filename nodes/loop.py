@@ -1,4 +1,17 @@
-class ForNode:
+from Nodes.node import Node
+
+class ForNode(Node):
+    __slots__ = (
+        "var_name_token",
+        "start_value_node",
+        "end_value_node",
+        "step_value_node",
+        "body_node",
+        "should_return_null",
+        "pos_start",
+        "pos_end",
+    )
+
     def __init__(
         self,
         var_name_token,
@@ -22,7 +35,9 @@ class ForNode:
         return f"(For Loop[{self.start_value_node},{self.end_value_node},{self.step_value_node}] :{self.body_node})"
 
 
-class WhileNode:
+class WhileNode(Node):
+    __slots__ = ("condition_node", "body_node", "should_return_null", "pos_start", "pos_end")
+
     def __init__(self, condition_node, body_node, should_return_null):
         self.condition_node = condition_node
         self.body_node = body_node
@@ -35,7 +50,9 @@ class WhileNode:
         return f"(WHILE {self.body_node})"
 
 
-class ContinueNode:
+class ContinueNode(Node):
+    __slots__ = ("pos_start", "pos_end")
+
     def __init__(self, pos_start, pos_end):
         self.pos_start = pos_start
         self.pos_end = pos_end
@@ -43,7 +60,9 @@ class ContinueNode:
         return f"(continue)"
 
 
-class BreakNode:
+class BreakNode(Node):
+    __slots__ = ("pos_start", "pos_end")
+
     def __init__(self, pos_start, pos_end):
         self.pos_start = pos_start
         self.pos_end = pos_end
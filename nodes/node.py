@@ -0,0 +1,19 @@
+# ------------NODE----------------
+# Nodes keep their fields in __slots__, so a parsed program is a tree of small
+# fixed-size objects. pos_start and pos_end are shared with the token or child
+# they come from rather than copied.
+
+
+def make_node(cls, fields):
+    node = cls.__new__(cls)
+    for name, value in zip(cls.__slots__, fields):
+        setattr(node, name, value)
+    return node
+
+
+class Node:
+    __slots__ = ()
+
+    def __reduce__(self):
+        # pickled as its fields in slot order, see Parser.ast_cache
+        return make_node, (type(self), tuple(getattr(self, name) for name in self.__slots__))
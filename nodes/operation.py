@@ -1,5 +1,8 @@
+from Nodes.node import Node
+
+class BinOpNode(Node):
+    __slots__ = ("left_node", "op_token", "right_node", "pos_start", "pos_end")
 
-class BinOpNode:
     def __init__(self, left_node, op_token, right_node):
         self.left_node = left_node
         self.op_token = op_token
@@ -11,7 +14,9 @@ class BinOpNode:
     def __repr__(self):
         return f'( {self.left_node} {self.op_token} {self.right_node} )'
 
-class UnaryOpNode:
+class UnaryOpNode(Node):
+    __slots__ = ("op_token", "node", "pos_start", "pos_end")
+
     def __init__(self, op_token, node):
         self.op_token = op_token
         self.node = node
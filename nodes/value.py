@@ -1,23 +1,29 @@
-class NumberNode:
+from Nodes.node import Node
+
+class NumberNode(Node):
+    __slots__ = ("token", "pos_start", "pos_end")
+
     def __init__(self, token):
         self.token = token
-        self.pos_start = self.token.pos_start
-        self.pos_end = self.token.pos_end
+        self.pos_start, self.pos_end = self.token.span
 
     def __repr__(self):
         return f"{self.token}"
 
-class StringNode:
+class StringNode(Node):
+    __slots__ = ("token", "pos_start", "pos_end")
+
     def __init__(self, token):
         self.token = token
-        self.pos_start = self.token.pos_start
-        self.pos_end = self.token.pos_end
+        self.pos_start, self.pos_end = self.token.span
 
     def __repr__(self):
         return f"{self.token}"
 
 
-class ListNode:
+class ListNode(Node):
+    __slots__ = ("element_nodes", "pos_start", "pos_end")
+
     def __init__(self, element_nodes,pos_start,pos_end):
         self.element_nodes = element_nodes
         self.pos_start = pos_start
@@ -27,7 +33,9 @@ class ListNode:
         return f"{self.element_nodes}"
 
 
-class IndexNode:
+class IndexNode(Node):
+    __slots__ = ("index_node", "expr", "pos_start", "pos_end")
+
     def __init__(self, index_node, expr):
         self.index_node = index_node
         self.expr = expr
@@ -40,7 +48,9 @@ class IndexNode:
         return f"( Index {self.index_node}->expr({self.expr}) ) "
 
 
-class IndexAssignNode:
+class IndexAssignNode(Node):
+    __slots__ = ("index_node", "expr", "assgin_expr", "pos_start", "pos_end")
+
     def __init__(self, index_node, expr,assgin_expr):
         self.index_node = index_node
         self.expr = expr
@@ -1,21 +1,25 @@
-class VarAccessNode:
+from Nodes.node import Node
+
+class VarAccessNode(Node):
+    __slots__ = ("var_name_token", "pos_start", "pos_end")
+
     def __init__(self, var_name_token):
         self.var_name_token = var_name_token
-        self.pos_start = self.var_name_token.pos_start
-        self.pos_end = self.var_name_token.pos_end
+        self.pos_start, self.pos_end = self.var_name_token.span
         
 
     def __repr__(self):
         return f"(variable : ({self.var_name_token}))"
 
-class VarAssignNode:
+class VarAssignNode(Node):
+    __slots__ = ("var_name_token", "value_node", "declare", "pos_start", "pos_end")
+
     def __init__(self, var_name_token,value_node,declare=True):
         self.var_name_token = var_name_token
         self.value_node = value_node
         self.declare = declare
 
-        self.pos_start = self.var_name_token.pos_start
-        self.pos_end = self.var_name_token.pos_end
+        self.pos_start, self.pos_end = self.var_name_token.span
 
     def __repr__(self):
         return f"(var assign = ({self.var_name_token}))"
\ No newline at end of file
@@ -3,9 +3,13 @@ import sys
 
 Debug=False
 
+# options can come without a script too, python3 shell.py --engine=python
+scripts = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+options = main.options_from_args(sys.argv[1:])
+
 try:
-    if len(sys.argv)>1:
-        main.run_from_file(sys.argv[1])
+    if scripts:
+        main.run_from_file(scripts[0], **options)
     else:
         while True:
             text = input("बाजी >")
@@ -13,7 +17,15 @@ try:
             if len(text)==0:
                 continue
             
-            result, error = main.run("<मुख्य>", text, debug=Debug)
+            result, error = main.run(
+                "<मुख्य>",
+                text,
+                debug=Debug,
+                lexer=options["lexer"],
+                engine=options["engine"],
+                max_depth=options["max_depth"],
+                memo=options["memo"],
+            )
             if error:
                 print(error.as_string())
             elif result:
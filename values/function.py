@@ -12,9 +12,12 @@ from Values import *
 import os
 import time
 import random
+from collections import OrderedDict
 
 
 class BaseFunction(Value):
+    __slots__ = ("name",)
+
     def __init__(self, name):
         super().__init__()
         self.name = name or "<anonymous>"
@@ -67,16 +70,57 @@ class BaseFunction(Value):
         return res.success(None)
 
 
+class MemoCache:
+    __slots__ = ("size", "values", "hits", "misses")
+
+    # the values a pure Function gave, by its arguments, dropping the least
+    # recently used once there are more than size of them
+    def __init__(self, size):
+        self.size = size
+        self.values = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, args):
+        # None unless every argument is a Number or a String. The type of
+        # the value is kept as 1 and 1.0 are the same dict key
+        key = []
+        for arg in args:
+            if type(arg) is not Number and type(arg) is not String:
+                return None
+            key.append((type(arg.value), arg.value))
+        return tuple(key)
+
+    def get(self, key):
+        value = self.values.get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self.values.move_to_end(key)
+        return value
+
+    def store(self, key, value):
+        self.values[key] = value
+        if len(self.values) > self.size:
+            self.values.popitem(last=False)
+
+
 class Function(BaseFunction):
+    __slots__ = ("body_node", "arg_names", "should_auto_return", "memo")
+
     def __init__(self, name, body_node, arg_names, should_auto_return):
         super().__init__(name)
         self.body_node = body_node
         self.arg_names = arg_names
         self.should_auto_return = should_auto_return
+        # a MemoCache if the Interpreter found the function pure
+        self.memo = None
 
-    def execute(self, args):
+    def execute(self, args, interpreter=None):
+        # the body runs on the interpreter making the call
         res = RTResult()
-        interpreter = IPTR.Interpreter()
+        interpreter = interpreter or IPTR.Interpreter()
         exec_ctx = self.generate_new_context()
 
         res.register(self.check_and_populate_args(self.arg_names, args, exec_ctx))
@@ -94,6 +138,7 @@ class Function(BaseFunction):
         copy = Function(
             self.name, self.body_node, self.arg_names, self.should_auto_return
         )
+        copy.memo = self.memo
         copy.set_context(self.context)
         copy.set_pos(self.pos_start, self.pos_end)
         return copy
@@ -103,10 +148,12 @@ class Function(BaseFunction):
 
 
 class BuiltInFunction(BaseFunction):
+    __slots__ = ()
+
     def __init__(self, name):
         super().__init__(name)
 
-    def execute(self, args):
+    def execute(self, args, interpreter=None):
         res = RTResult()
         exec_ctx = self.generate_new_context()
 
@@ -297,7 +344,7 @@ class BuiltInFunction(BaseFunction):
                 )
             )
 
-        return RTResult().success(Number(len(list_.elements)))
+        return RTResult().success(Number.shared(len(list_.elements)))
 
     execute_len.arg_names = ["list"]
 
@@ -328,6 +375,26 @@ class BuiltInFunction(BaseFunction):
 
     execute_rand.arg_names = ["MIN", "MAX"]
 
+    def execute_memo_stats(self, exec_ctx):
+        function = exec_ctx.symbol_table.get("function")
+
+        if not isinstance(function, BaseFunction):
+            return RTResult().failure(
+                RTError(
+                    self.pos_start,
+                    self.pos_end,
+                    "Argument must be function",
+                    exec_ctx,
+                )
+            )
+
+        # [hits, misses, values cached], all 0 for a function without a cache
+        memo = function.memo if isinstance(function, Function) else None
+        stats = [memo.hits, memo.misses, len(memo.values)] if memo else [0, 0, 0]
+        return RTResult().success(List([Number(stat) for stat in stats]))
+
+    execute_memo_stats.arg_names = ["function"]
+
 
 BuiltInFunction.print = BuiltInFunction("print")
 BuiltInFunction.print_ret = BuiltInFunction("print_ret")
@@ -344,6 +411,7 @@ BuiltInFunction.extend = BuiltInFunction("extend")
 BuiltInFunction.len = BuiltInFunction("len")
 BuiltInFunction.sleep = BuiltInFunction("sleep")
 BuiltInFunction.rand = BuiltInFunction("rand")
+BuiltInFunction.memo_stats = BuiltInFunction("memo_stats")
 
 
 S_Table.global_symbol_table.set("PRINT", BuiltInFunction.print)
@@ -393,3 +461,6 @@ S_Table.global_symbol_table.set("झोप", BuiltInFunction.sleep)
 
 S_Table.global_symbol_table.set("RAND_INT", BuiltInFunction.rand)
 
+
+S_Table.global_symbol_table.set("MEMO_STATS", BuiltInFunction.memo_stats)
+S_Table.global_symbol_table.set("स्मृती_आकडे", BuiltInFunction.memo_stats)
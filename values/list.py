@@ -5,9 +5,13 @@ from Translate import Translate
 from Values.number import Number
 
 class List(Value):
+  __slots__ = ("elements",)
+
   def __init__(self, elements):
-    super().__init__()
     self.elements = elements
+    self.pos_start = None
+    self.pos_end = None
+    self.context = None
 
   def added_to(self, other):
     new_list = self.copy()
@@ -1,12 +1,33 @@
 from Values.value import Value
 from Errors import RTError
 from Translate import Translate
+
+# one Translate for printing every Number
+TRANSLATE = Translate()
+
+# ints from SMALL_INTS[0] to SMALL_INTS[1] have a shared Number, see Number.shared
+SMALL_INTS = (-5, 256)
+
 #------------Values-----------------
 class Number(Value):
+    __slots__ = ("value",)
+
     def __init__(self, value):
-        super().__init__()
+        # the fields of Value.__init__, set here rather than through it
         self.value = value
-        self.translate = Translate()
+        self.pos_start = None
+        self.pos_end = None
+        self.context = None
+
+    @staticmethod
+    def shared(value):
+        # a Number of value without position or context, the same one for every
+        # small int. It must not be given a position or context itself, so it
+        # is only for a value that is copied before it is read, such as a FOR
+        # variable or the result of a builtin
+        if type(value) is int and SMALL_INTS[0] <= value <= SMALL_INTS[1]:
+            return SHARED_INTS[value - SMALL_INTS[0]]
+        return Number(value)
 
     def set_pos(self, pos_start=None, pos_end=None):
         self.pos_start = pos_start
@@ -130,7 +151,9 @@ class Number(Value):
         return self.value != 0
 
     def __repr__(self):
-        return str(self.translate.number_to_mar(self.value))
+        return str(TRANSLATE.number_to_mar(self.value))
+
+SHARED_INTS = tuple(Number(value) for value in range(SMALL_INTS[0], SMALL_INTS[1] + 1))
 
 Number.null = Number(0)
 Number.false = Number(0)
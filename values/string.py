@@ -5,9 +5,13 @@ from Values.number import Number
 
 
 class String(Value):
+    __slots__ = ("value",)
+
     def __init__(self, value):
-        super().__init__()
         self.value = value
+        self.pos_start = None
+        self.pos_end = None
+        self.context = None
 
     def added_to(self, other):
         if isinstance(other, String):
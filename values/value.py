@@ -1,8 +1,12 @@
 from Errors import RTError
 class Value:
+	# every value is a small fixed-size object, subclasses add their own slots
+	__slots__ = ("pos_start", "pos_end", "context")
+
 	def __init__(self):
-		self.set_pos()
-		self.set_context()
+		self.pos_start = None
+		self.pos_end = None
+		self.context = None
 
 	def set_pos(self, pos_start=None, pos_end=None):
 		self.pos_start = pos_start
@@ -55,7 +59,7 @@ class Value:
 	def notted(self):
 		return None, self.illegal_operation(other)
 
-	def execute(self, args):
+	def execute(self, args, interpreter=None):
 		return RTResult().failure(self.illegal_operation())
 
 	def copy(self):